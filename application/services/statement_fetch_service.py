@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Callable, List, Optional, Tuple
 
 from application.usecases.fetch_statements import FetchStatementsUseCase
-from domain.dto import NsdDTO
+from domain.dto import ExecutionResultDTO, NsdDTO
 from domain.dto.raw_statement_dto import RawStatementDTO
 from domain.ports import (
     LoggerPort,
@@ -17,7 +17,13 @@ from domain.ports import (
     SqlAlchemyRawStatementRepositoryPort,
 )
 from infrastructure.config import Config
-from infrastructure.helpers import WorkerPool
+from infrastructure.helpers import (
+    CheckpointStore,
+    PersistenceWriter,
+    RetryPolicy,
+    ShutdownSignal,
+    WorkerPool,
+)
 
 
 class StatementFetchService:
@@ -34,8 +40,18 @@ class StatementFetchService:
         parsed_statements_repo: SqlAlchemyParsedStatementRepositoryPort,
         metrics_collector: MetricsCollectorPort,
         worker_pool_executor: WorkerPool,
+        writer: Optional[PersistenceWriter] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        shutdown: Optional[ShutdownSignal] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> None:
-        """Store dependencies for the service."""
+        """Store dependencies for the service.
+
+        ``writer`` is handed to the fetch use case so rows are saved on a
+        background thread; ``checkpoint`` and ``shutdown`` let the sync
+        stop on a signal and resume later; ``retry_policy`` bounds the
+        refetches of empty targets.
+        """
         self.logger = logger
         self.config = config
         self.source = source,
@@ -54,6 +70,10 @@ class StatementFetchService:
             parsed_statements_repo=parsed_statements_repo,
             metrics_collector=self.collector,
             worker_pool_executor=self.worker_pool_executor,
+            writer=writer,
+            checkpoint=checkpoint,
+            shutdown=shutdown,
+            retry_policy=retry_policy,
         )
 
         # self.logger.log(f"Load Class {self.__class__.__name__}", level="info")
@@ -64,34 +84,17 @@ class StatementFetchService:
         #     "Run  Method controller.run()._statement_service().statements_fetch_service.run()._build_targets()",
         #     level="info",
         # )
-        company_records = self.company_repo.get_all()
-        nsd_records = self.nsd_repo.get_all()
-
-        if not company_records or not nsd_records:
-            return []
-
-        nsd_rows_processed = {
-            row[0] for row in self.raw_statement_repo.get_existing_by_columns(column_names="nsd")
-        }
-
         valid_types = set(self.config.domain.statements_types)
 
-        company_names = {c.company_name for c in company_records if c.company_name}
-        nsd_company_names = {n.company_name for n in nsd_records if n.company_name}
-        common_company_names = set(company_names.intersection(nsd_company_names))
-
-        results = self.nsd_repo.get_all_pending(
-            company_names=common_company_names,
-            valid_types=valid_types,
-            exclude_nsd=nsd_rows_processed,
-        )
-
-        return results
+        # Company match, type filter and the fetched-NSD anti-join all run
+        # in one indexed query
+        return self.nsd_repo.get_statement_targets(valid_types)
 
     def fetch_statements(
         self,
         save_callback: Optional[Callable[[List[RawStatementDTO]], None]] = None,
         threshold: Optional[int] = None,
+        keep_results: bool = True,
     ) -> List[Tuple[NsdDTO, List[RawStatementDTO]]]:
         """Execute the fetch workflow and return raw rows.
 
@@ -101,6 +104,9 @@ class StatementFetchService:
             Optional function to persist buffered results.
         threshold:
             Number of items to collect before invoking ``save_callback``.
+        keep_results:
+            When ``False`` rows are only persisted and an empty list is
+            returned.
         """
 
         # self.logger.log(
@@ -130,6 +136,7 @@ class StatementFetchService:
             targets=targets,
             save_callback=save_callback,
             threshold=threshold,
+            keep_results=keep_results,
         )
         # self.logger.log(
         #     "End  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run(save_callback, threshold)",
@@ -142,3 +149,25 @@ class StatementFetchService:
         # )
 
         return rows
+
+    def sync_statements(
+        self,
+        threshold: Optional[int] = None,
+    ) -> Optional[ExecutionResultDTO[NsdDTO]]:
+        """Fetch, parse and persist every pending statement in one pass.
+
+        Parameters
+        ----------
+        threshold:
+            Number of NSDs buffered before each repository save.
+
+        Returns
+        -------
+        ExecutionResultDTO or None
+            Pipeline outcome, or ``None`` when nothing was pending.
+        """
+        targets = self._build_targets()
+        if not targets:
+            return None
+
+        return self.fetch_usecase.sync_statements(targets=targets, threshold=threshold)
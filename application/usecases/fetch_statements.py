@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import re
 import time
+from contextlib import nullcontext
+from datetime import datetime, timedelta
 from typing import Callable, Iterable, List, Optional, Tuple
 
+from application.usecases.parse_and_classify_statements import (
+    parse_fetched_statement,
+)
+from domain.dto import ExecutionResultDTO, ParsedStatementDTO
 from domain.dto.nsd_dto import NsdDTO
 from domain.dto.raw_statement_dto import RawStatementDTO
 from domain.dto.worker_class_dto import WorkerTaskDTO
@@ -16,7 +23,47 @@ from domain.ports import (
     SqlAlchemyRawStatementRepositoryPort,
 )
 from infrastructure.config import Config
-from infrastructure.helpers import ByteFormatter, SaveStrategy, WorkerPool
+from infrastructure.helpers import (
+    AsyncWorkerPool,
+    ByteFormatter,
+    CheckpointStore,
+    PersistenceWriter,
+    Pipeline,
+    RetryPolicy,
+    SaveStrategy,
+    ShutdownSignal,
+    Stage,
+    WorkerPool,
+)
+
+# Filings sent within this many days count as new for prioritization
+RECENT_DAYS = 120
+
+
+def statement_priority(
+    now: Optional[datetime] = None, recent_days: int = RECENT_DAYS
+) -> Callable[[NsdDTO], Tuple[int, float]]:
+    """Return a sort key ranking statement targets for time-boxed runs.
+
+    Recent first versions (new DFP/ITR filings) come first, then recent
+    re-presentations, then older gaps; newer ``sent_date`` wins within each
+    tier.
+
+    Args:
+        now: Reference time, defaulting to the current time.
+        recent_days: Age in days under which a filing counts as recent.
+    """
+    cutoff = (now or datetime.now()) - timedelta(days=recent_days)
+
+    def key(nsd: NsdDTO) -> Tuple[int, float]:
+        sent = nsd.sent_date.timestamp() if nsd.sent_date else 0.0
+        if not nsd.sent_date or nsd.sent_date < cutoff:
+            return 2, -sent
+        match = re.search(r"\d+", nsd.version or "")
+        representation = bool(match) and int(match.group()) > 1
+        return (1 if representation else 0), -sent
+
+    return key
 
 
 class FetchStatementsUseCase:
@@ -32,8 +79,18 @@ class FetchStatementsUseCase:
         worker_pool_executor: WorkerPool,
         config: Config,
         max_workers: int = 1,
+        writer: Optional[PersistenceWriter] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        shutdown: Optional[ShutdownSignal] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> None:
-        """Store dependencies for fetching and saving raw rows."""
+        """Store dependencies for fetching and saving raw rows.
+
+        ``writer`` moves repository saves off the worker pool threads.
+        ``checkpoint`` and ``shutdown`` make :meth:`sync_statements` stop
+        cleanly on a signal and resume where it stopped. ``retry_policy``
+        bounds the refetches of targets that come back empty.
+        """
         self.logger = logger
         self.source = source
         self.parsed_statements_repo = parsed_statements_repo
@@ -42,6 +99,11 @@ class FetchStatementsUseCase:
         self.collector = metrics_collector
         self.worker_pool_executor = worker_pool_executor
         self.max_workers = max_workers
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.shutdown = shutdown
+        self.retry_policy = retry_policy or RetryPolicy(config)
+        self.byte_formatter = ByteFormatter()
 
         # self.logger.log(f"Load Class {self.__class__.__name__}", level="info")
 
@@ -50,8 +112,13 @@ class FetchStatementsUseCase:
         targets: list[NsdDTO],
         save_callback: Optional[Callable[[List[RawStatementDTO]], None]] = None,
         threshold: Optional[int] = None,
+        keep_results: bool = True,
     ) -> List[Tuple[NsdDTO, List[RawStatementDTO]]]:
-        """Execute the use case for ``batch_rows``."""
+        """Execute the use case for ``batch_rows``.
+
+        Pass ``keep_results=False`` to only persist rows through
+        ``save_callback`` and return an empty list.
+        """
         # self.logger.log(
         #     "Run  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run(save_callback, threshold)",
         #     level="info",
@@ -68,6 +135,7 @@ class FetchStatementsUseCase:
             targets=targets,
             save_callback=save_callback,
             threshold=threshold,
+            keep_results=keep_results,
         )
         # self.logger.log(
         #     "End  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all(save_callback, threshold)",
@@ -81,19 +149,102 @@ class FetchStatementsUseCase:
 
         return results
 
+    def _fetch_target(
+        self, task: WorkerTaskDTO, size: int, start_time: float
+    ) -> Tuple[NsdDTO, List[RawStatementDTO]]:
+        """Fetch one target, retrying while the source returns no rows, and
+        log its progress.
+
+        Raises:
+            RetryExhaustedError: The target stayed empty for all the
+                attempts :attr:`retry_policy` allows.
+        """
+        # self.logger.log(
+        #     "Call Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all().processor().source.fetch()",
+        #     level="info",
+        # )
+        retry = self.retry_policy.start()
+
+        bytes_before = self.collector.network_bytes
+        fetched = self.source.fetch(task)
+        lines = len(fetched["statements"])
+
+        while lines == 0:
+            # Backs off between refetches and gives up when out of attempts
+            retry.sleep()
+            quarter = (
+                fetched["nsd"].quarter.strftime("%Y-%m-%d")
+                if fetched["nsd"].quarter
+                else None
+            )
+            extra_info = {
+                "details": f"{fetched['nsd'].nsd} {fetched['nsd'].company_name} {quarter} {fetched['nsd'].version}",
+                "attempt": f"attempt {retry.attempt}",
+            }
+            self.logger.log(
+                f"Retrying {task.index + 1}/{size}",
+                level="warning",
+                extra=extra_info,
+                worker_id=task.worker_id,
+            )
+
+            fetched = self.source.fetch(task)
+            lines = len(fetched["statements"])
+
+        download_bytes = self.collector.network_bytes - bytes_before
+
+        quarter = (
+            fetched["nsd"].quarter.strftime("%Y-%m-%d")
+            if fetched["nsd"].quarter
+            else None
+        )
+        extra_info = {
+            "details": f"{fetched['nsd'].nsd} {fetched['nsd'].company_name} {quarter} {fetched['nsd'].version}",
+            "lines": f"{len(fetched['statements'])} lines",
+            "Download": self.byte_formatter.format_bytes(download_bytes),
+            "Total download": self.byte_formatter.format_bytes(
+                self.collector.network_bytes
+            ),
+        }
+        self.logger.log(
+            f"Statement {task.index + 1}/{size}",
+            level="info",
+            progress={
+                "index": task.index + 1,
+                "size": size,
+                "start_time": start_time,
+            },
+            extra=extra_info,
+            worker_id=task.worker_id,
+        )
+
+        # self.logger.log(
+        #     "End  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all().processor().source.fetch()",
+        #     level="info",
+        # )
+
+        return fetched["nsd"], fetched["statements"]
+
     def fetch_all(
         self,
         targets: List[NsdDTO],
         save_callback: Optional[Callable[[List[RawStatementDTO]], None]] = None,
         threshold: Optional[int] = None,
+        keep_results: bool = True,
     ) -> List[Tuple[NsdDTO, List[RawStatementDTO]]]:
-        """Fetch statements for ``targets`` concurrently."""
+        """Fetch statements for ``targets`` concurrently.
+
+        Rows are always buffered through ``strategy``; with
+        ``keep_results=False`` the worker pool drops them afterwards so a
+        full backfill does not hold every statement in memory. Targets run
+        in :func:`statement_priority` order, so a run cut short by
+        ``global_settings.time_budget`` keeps the most useful filings.
+        """
         # self.logger.log(
         #     "Run  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all(save_callback, threshold)",
         #     level="info",
         # )
 
-        byte_formatter = ByteFormatter()
         # self.logger.log("End Instance worker_pool", level="info")
 
         # Initialize the saving strategy that buffers results.
@@ -102,78 +253,18 @@ class FetchStatementsUseCase:
             save_callback or self.raw_statement_repository.save_all,
             threshold,
             config=self.config,
+            writer=self.writer,
         )
         # self.logger.log("End Instance strategy", level="info")
 
         # Pair each target with its index for worker pool processing.
-        tasks = list(enumerate(targets))
+        tasks = enumerate(targets)
+        size = len(targets)
 
-        collector = self.collector
         start_time = time.perf_counter()
 
         def processor(task: WorkerTaskDTO) -> Tuple[NsdDTO, List[RawStatementDTO]]:
-            # self.logger.log(
-            #     "Call Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all().processor().source.fetch()",
-            #     level="info",
-            # )
-            attempt = 0
-
-            bytes_before = collector.network_bytes
-            fetched = self.source.fetch(task)
-            lines = len(fetched["statements"])
-
-            while lines == 0:
-                attempt += 1
-                quarter = (
-                    fetched["nsd"].quarter.strftime("%Y-%m-%d")
-                    if fetched["nsd"].quarter
-                    else None
-                )
-                extra_info = {
-                    "details": f"{fetched['nsd'].nsd} {fetched['nsd'].company_name} {quarter} {fetched['nsd'].version}",
-                    "attempt": f"attempt {attempt}",
-                }
-                self.logger.log(
-                    f"Retrying {task.index + 1}/{len(tasks)}",
-                    level="warning",
-                    extra=extra_info,
-                    worker_id=task.worker_id,
-                )
-
-                fetched = self.source.fetch(task)
-                lines = len(fetched["statements"])
-
-            download_bytes = collector.network_bytes - bytes_before
-
-            quarter = (
-                fetched["nsd"].quarter.strftime("%Y-%m-%d")
-                if fetched["nsd"].quarter
-                else None
-            )
-            extra_info = {
-                "details": f"{fetched['nsd'].nsd} {fetched['nsd'].company_name} {quarter} {fetched['nsd'].version}",
-                "lines": f"{len(fetched['statements'])} lines",
-                "Download": byte_formatter.format_bytes(download_bytes),
-                "Total download": byte_formatter.format_bytes(collector.network_bytes),
-            }
-            self.logger.log(
-                f"Statement {task.index + 1}/{len(tasks)}",
-                level="info",
-                progress={
-                    "index": task.index + 1,
-                    "size": len(tasks),
-                    "start_time": start_time,
-                },
-                extra=extra_info,
-                worker_id=task.worker_id,
-            )
-
-            # self.logger.log(
-            #     "End  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all().processor().source.fetch()",
-            #     level="info",
-            # )
-
-            return fetched["nsd"], fetched["statements"]
+            return self._fetch_target(task, size, start_time)
 
         def handle_batch(item: Tuple[NsdDTO, List[RawStatementDTO]]) -> None:
             """Buffer fetched statement rows via ``strategy``."""
@@ -191,6 +282,8 @@ class FetchStatementsUseCase:
             processor=processor,
             logger=self.logger,
             on_result=handle_batch,
+            keep_results=keep_results,
+            priority=statement_priority(),
         )
         # self.logger.log(
         #     "End  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all().worker_pool.run(tasks, processor, handle_batch)",
@@ -205,3 +298,104 @@ class FetchStatementsUseCase:
         # )
 
         return result.items
+
+    def sync_statements(
+        self,
+        targets: List[NsdDTO],
+        threshold: Optional[int] = None,
+        keep_results: bool = False,
+    ) -> ExecutionResultDTO[NsdDTO]:
+        """Fetch, parse and persist ``targets`` in one overlapped pass.
+
+        Three :class:`Pipeline` stages run at once: fetch threads (as many
+        as the worker pool has), which also parse the HTML through the
+        scraper, one thread building the parsed rows, and a single thread
+        writing raw and parsed rows to SQLite.
+        Targets enter in :func:`statement_priority` order. On a shutdown
+        request the NSDs already persisted are checkpointed, and a resumed
+        run skips them.
+
+        Returns:
+            ExecutionResultDTO: Synced NSDs (when ``keep_results``), metrics
+            and the targets that failed in ``dead_letters``.
+        """
+        raw_strategy: SaveStrategy[RawStatementDTO] = SaveStrategy(
+            self.raw_statement_repository.save_all, threshold, config=self.config
+        )
+        parsed_strategy: SaveStrategy[ParsedStatementDTO] = SaveStrategy(
+            self.parsed_statements_repo.save_all, threshold, config=self.config
+        )
+
+        checkpoint = self.checkpoint
+        if checkpoint is not None and not self.config.global_settings.resume:
+            checkpoint.clear()
+        elif checkpoint is not None and checkpoint.load():
+            targets = [t for t in targets if not checkpoint.is_done(int(t.nsd))]
+            self.logger.log(
+                f"Resuming statements, {len(checkpoint.completed)} NSDs already done",
+                level="info",
+            )
+
+        size = len(targets)
+        start_time = time.perf_counter()
+
+        def fetch(task: WorkerTaskDTO) -> Tuple[NsdDTO, List[RawStatementDTO]]:
+            return self._fetch_target(task, size, start_time)
+
+        def persist(task: WorkerTaskDTO) -> NsdDTO:
+            nsd, raw_rows, parsed_rows = task.data
+            raw_strategy.handle(raw_rows)
+            parsed_strategy.handle(parsed_rows)
+            if checkpoint is not None:
+                checkpoint.mark(int(nsd.nsd))
+            return nsd
+
+        fetch_workers = (
+            getattr(self.worker_pool_executor, "max_workers", None)
+            or self.config.global_settings.max_workers
+            or 1
+        )
+        pipeline = Pipeline(
+            self.config,
+            stages=[
+                Stage("fetch", fetch, workers=fetch_workers),
+                # Only a value conversion is left here, cheaper than
+                # pickling the rows to another process
+                Stage("parse", parse_fetched_statement),
+                Stage("persist", persist),
+            ],
+            logger=self.logger,
+            metrics_collector=self.collector,
+            shutdown=self.shutdown,
+        )
+
+        # On the asyncio engine the fetch threads share one loop and its
+        # sessions instead of starting a loop per target
+        serving = (
+            self.worker_pool_executor.serve()
+            if isinstance(self.worker_pool_executor, AsyncWorkerPool)
+            else nullcontext()
+        )
+
+        ordered = sorted(targets, key=statement_priority())
+        try:
+            with serving:
+                result = pipeline.run(enumerate(ordered), keep_results=keep_results)
+        finally:
+            raw_strategy.finalize()
+            parsed_strategy.finalize()
+
+        if checkpoint is not None:
+            if result.interrupted:
+                checkpoint.save()
+            else:
+                checkpoint.clear()
+
+        for name, stats in pipeline.stats().items():
+            self.logger.log(
+                f"{name}: {stats['processed']} done, {stats['failed']} failed, "
+                f"{stats['busy_time']:.1f}s busy, queue peak {stats['queue_peak']}",
+                level="info",
+            )
+
+        return result
@@ -1,16 +1,45 @@
 from __future__ import annotations
 
-from domain.dto import ParsedStatementDTO
+from typing import Any, List, Tuple
+
+from domain.dto import ParsedStatementDTO, WorkerTaskDTO
 from domain.dto.raw_statement_dto import RawStatementDTO
 from domain.ports import (
     LoggerPort,
     SqlAlchemyParsedStatementRepositoryPort,
 )
-from domain.utils.statement_processing import classify_section
 from infrastructure.config import Config
 from infrastructure.helpers import SaveStrategy
 
 
+def build_parsed_statement(row: RawStatementDTO) -> ParsedStatementDTO:
+    """Return ``row`` as a :class:`ParsedStatementDTO` with a numeric value."""
+    return ParsedStatementDTO(
+        nsd=str(row.nsd),
+        company_name=row.company_name,
+        quarter=row.quarter,
+        version=row.version,
+        grupo=row.grupo,
+        quadro=row.quadro,
+        account=row.account,
+        description=row.description,
+        value=float(row.value or 0.0),
+    )
+
+
+def parse_fetched_statement(
+    task: WorkerTaskDTO,
+) -> Tuple[Any, List[RawStatementDTO], List[ParsedStatementDTO]]:
+    """Pipeline stage turning ``(nsd, raw_rows)`` into
+    ``(nsd, raw_rows, parsed_rows)``.
+
+    The fetch stage already parsed the HTML, on the scraper's
+    ``parse_pool`` when there is one, so only the values are converted here.
+    """
+    nsd, rows = task.data
+    return nsd, rows, [build_parsed_statement(row) for row in rows]
+
+
 class ParseAndClassifyStatementsUseCase:
     """Parse raw HTML and build :class:`ParsedStatementDTO` objects."""
 
@@ -30,14 +59,7 @@ class ParseAndClassifyStatementsUseCase:
 
     def parse_and_store_row(self, row: RawStatementDTO) -> ParsedStatementDTO:
         """Build a :class:`ParsedStatementDTO` from a statement row."""
-        dto = ParsedStatementDTO(
-            batch_id=str(row.nsd),
-            account=row.account,
-            section=classify_section(row.account),
-            value=float(row.value),
-            company=row.company_name,
-            period=row.quarter,
-        )
+        dto = build_parsed_statement(row)
         self.strategy.handle(dto)
         return dto
 
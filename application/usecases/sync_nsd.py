@@ -31,10 +31,12 @@ class SyncNSDUseCase:
         existing_ids = self.repository.get_all_primary_keys()
 
         # Fetch all documents from the scraper, persisting them in batches.
+        # Results are not kept in memory since ``_save_batch`` stores them.
         # self.logger.log("Call Method controller.run()._nsd_service().run().sync_nsd_usecase.run().fetch_all()", level="info")
         self.scraper.fetch_all(
             skip_codes=existing_ids,
             save_callback=self._save_batch,
+            keep_results=False,
         )
         # self.logger.log("Call Method controller.run()._nsd_service().run().sync_nsd_usecase.run().fetch_all()", level="info")
 
@@ -0,0 +1 @@
+"""Offline benchmarks for the execution and persistence layers."""
@@ -0,0 +1,390 @@
+"""Run the company, NSD and statement services against the local stand-in.
+
+A :class:`StandInServer` plays the CVM and B3 sites with the given latency,
+error and block rates, and every service runs exactly as the CLI wires it,
+into a throwaway SQLite database. For each service the benchmark prints
+items per second, the p50/p95 latency of ``fetch_with_retry`` calls
+(retries included) and the bytes downloaded, decoded and on the wire.
+
+Usage:
+    python -m benchmarks.bench_end_to_end --nsd 300 --companies 30 --workers 8
+    python -m benchmarks.bench_end_to_end --backend async --block-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from application import CompanyDataMapper
+from application.services.company_data_service import CompanyDataService
+from application.services.nsd_service import NsdService
+from application.services.statement_fetch_service import StatementFetchService
+from infrastructure.config import Config
+from infrastructure.config.database import DatabaseConfig
+from infrastructure.helpers import (
+    AsyncFetchUtils,
+    AsyncWorkerPool,
+    ByteFormatter,
+    DataCleaner,
+    FetchUtils,
+    HostConcurrencyController,
+    MetricsCollector,
+    PersistenceWriter,
+    RateLimiter,
+    RequestHedger,
+    WorkerPool,
+)
+from infrastructure.repositories import (
+    SqlAlchemyCompanyDataRepository,
+    SqlAlchemyNsdRepository,
+    SqlAlchemyParsedStatementRepository,
+    SqlAlchemyRawStatementRepository,
+)
+from infrastructure.scrapers.company_data_exchange_scraper import CompanyDataScraper
+from infrastructure.scrapers.nsd_scraper import NsdScraper
+from infrastructure.scrapers.requests_raw_statement_scraper import (
+    RawStatementScraper,
+)
+
+from .common import QuietLogger, report
+from .stand_in_server import StandInProfile, StandInServer
+
+
+class Recorder:
+    """Latencies and response sizes of ``fetch_with_retry`` calls."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def add(self, latency: float, size: int) -> None:
+        """Record one call."""
+        with self._lock:
+            self.latencies.append(latency)
+            self.bytes += size
+
+    def reset(self) -> None:
+        """Forget the calls of the previous service."""
+        with self._lock:
+            self.latencies = []
+            self.bytes = 0
+
+    def percentile(self, share: float) -> float:
+        """Return the latency below which ``share`` of the calls fall."""
+        ordered = sorted(self.latencies)
+        if not ordered:
+            return 0.0
+        return ordered[min(int(share * len(ordered)), len(ordered) - 1)]
+
+
+class TimedRawStatementScraper(RawStatementScraper):
+    """``RawStatementScraper`` that records the time of each NSD fetch."""
+
+    def __init__(self, *args: Any, recorder: Recorder, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+
+    def fetch(self, task: Any) -> dict:
+        started = time.perf_counter()
+        result = super().fetch(task)
+        self.recorder.add(time.perf_counter() - started, 0)
+        return result
+
+
+class TimedFetchUtils(FetchUtils):
+    """``FetchUtils`` that records every call in a :class:`Recorder`."""
+
+    def __init__(self, *args: Any, recorder: Recorder, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+
+    def fetch_with_retry(self, scraper: Any, url: str, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        response, session = super().fetch_with_retry(scraper, url, *args, **kwargs)
+        self.recorder.add(time.perf_counter() - started, len(response.content))
+        return response, session
+
+
+class TimedAsyncFetchUtils(AsyncFetchUtils):
+    """``AsyncFetchUtils`` that records every call in a :class:`Recorder`."""
+
+    def __init__(self, *args: Any, recorder: Recorder, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+
+    async def fetch_with_retry(self, session: Any, url: str, *args: Any, **kwargs: Any):
+        started = time.perf_counter()
+        response, session = await super().fetch_with_retry(
+            session, url, *args, **kwargs
+        )
+        self.recorder.add(time.perf_counter() - started, len(response.content))
+        return response, session
+
+
+def build_config(
+    args: argparse.Namespace, server: StandInServer, data_dir: Path
+) -> Config:
+    """Return a ``Config`` aimed at ``server`` and a throwaway database."""
+    config = server.configure(Config())
+    config.database = DatabaseConfig(data_dir=data_dir)
+    config.global_settings = replace(
+        config.global_settings,
+        max_workers=args.workers,
+        max_concurrency=args.concurrency,
+        execution_backend=args.backend,
+        wait=args.wait,
+        time_budget=0,
+        resume=False,
+    )
+    config.scraping = replace(
+        config.scraping,
+        adaptive_concurrency=args.adaptive,
+        rate_limit_default=args.rate,
+        rate_limits={},
+        response_cache=False,
+    )
+    return config
+
+
+def run_service(
+    label: str,
+    recorder: Recorder,
+    server: StandInServer,
+    service: Callable[[], Any],
+    count: Callable[[], int],
+    items: Optional[Recorder] = None,
+) -> None:
+    """Run ``service`` and print its throughput, latency and bytes.
+
+    ``items``, when given, holds per-item times whose p50/p95/p99 are
+    printed too.
+    """
+    recorder.reset()
+    if items is not None:
+        items.reset()
+    served = dict(server.stats)
+    started = time.perf_counter()
+    service()
+    elapsed = time.perf_counter() - started
+
+    report(label, count(), elapsed)
+    wire = server.stats["wire_bytes"] - served["wire_bytes"]
+    calls = len(recorder.latencies)
+    print(
+        f"{'':<32} {calls:>8} calls p50 {recorder.percentile(0.5) * 1000:>7.1f}ms "
+        f"p95 {recorder.percentile(0.95) * 1000:>7.1f}ms "
+        f"p99 {recorder.percentile(0.99) * 1000:>7.1f}ms "
+        f"{ByteFormatter().format_bytes(recorder.bytes):>10} decoded "
+        f"{ByteFormatter().format_bytes(wire):>10} wire "
+        f"({server.stats['requests'] - served['requests']} requests, "
+        f"{server.stats['errors'] - served['errors']} errors, "
+        f"{server.stats['blocks'] - served['blocks']} blocks)"
+    )
+    if items is not None and items.latencies:
+        print(
+            f"{'':<32} {len(items.latencies):>8} items p50 "
+            f"{items.percentile(0.5) * 1000:>7.1f}ms "
+            f"p95 {items.percentile(0.95) * 1000:>7.1f}ms "
+            f"p99 {items.percentile(0.99) * 1000:>7.1f}ms"
+        )
+
+
+def main() -> None:
+    """Serve the stand-in, run the selected services and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nsd", type=int, default=200)
+    parser.add_argument("--companies", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--block-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--stall", type=float, default=2.0)
+    parser.add_argument("--recordings", type=Path)
+    parser.add_argument("--no-gzip", action="store_true")
+    parser.add_argument("--hedge", action="store_true")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--backend", choices=("thread", "async"), default="thread")
+    parser.add_argument("--adaptive", action="store_true")
+    parser.add_argument("--rate", type=float, default=0.0)
+    parser.add_argument("--wait", type=float, default=0.05)
+    parser.add_argument(
+        "--services",
+        default="company,nsd,statements",
+        help="Comma-separated subset of company,nsd,statements",
+    )
+    args = parser.parse_args()
+    services = set(args.services.split(","))
+
+    profile = StandInProfile(
+        nsd_count=args.nsd,
+        companies=args.companies,
+        rows=args.rows,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        block_rate=args.block_rate,
+        stall_rate=args.stall_rate,
+        stall=args.stall,
+        gzip=not args.no_gzip,
+        recordings=args.recordings,
+    )
+
+    with StandInServer(profile) as server, tempfile.TemporaryDirectory() as tmp:
+        config = build_config(args, server, Path(tmp))
+        logger = QuietLogger()
+        collector = MetricsCollector()
+        recorder = Recorder()
+        data_cleaner = DataCleaner(config, logger)
+
+        controller: Optional[HostConcurrencyController] = None
+        max_workers = args.workers
+        if args.adaptive:
+            controller = HostConcurrencyController(config)
+            max_workers = max(max_workers, config.scraping.concurrency_max)
+        rate_limiter = RateLimiter(config)
+        hedger = RequestHedger(config) if args.hedge else None
+        items = Recorder()
+        fetch_utils = TimedFetchUtils(
+            config,
+            logger,
+            controller=controller,
+            rate_limiter=rate_limiter,
+            pool_size=max_workers,
+            metrics_collector=collector,
+            hedger=hedger,
+            recorder=recorder,
+        )
+        if args.backend == "async":
+            pool: Any = AsyncWorkerPool(
+                config,
+                metrics_collector=collector,
+                max_workers=max_workers,
+                fetch_utils=TimedAsyncFetchUtils(
+                    config,
+                    logger,
+                    controller=controller,
+                    rate_limiter=rate_limiter,
+                    metrics_collector=collector,
+                    hedger=hedger,
+                    recorder=recorder,
+                ),
+            )
+        else:
+            pool = WorkerPool(
+                config, metrics_collector=collector, max_workers=max_workers
+            )
+        writer = (
+            PersistenceWriter(config, logger, metrics_collector=collector)
+            if config.global_settings.writer_queue_size
+            else None
+        )
+
+        company_repo = SqlAlchemyCompanyDataRepository(config=config, logger=logger)
+        nsd_repo = SqlAlchemyNsdRepository(config=config, logger=logger)
+        raw_repo = SqlAlchemyRawStatementRepository(config=config, logger=logger)
+        parsed_repo = SqlAlchemyParsedStatementRepository(config=config, logger=logger)
+
+        print(
+            f"stand-in {server.url}: {args.nsd} NSDs, {args.companies} companies, "
+            f"{args.latency * 1000:.0f}ms latency, {args.backend} x{max_workers}"
+        )
+        try:
+            if "company" in services:
+                company_service = CompanyDataService(
+                    config=config,
+                    logger=logger,
+                    repository=company_repo,
+                    scraper=CompanyDataScraper(
+                        config=config,
+                        logger=logger,
+                        data_cleaner=data_cleaner,
+                        mapper=CompanyDataMapper(data_cleaner),
+                        worker_pool_executor=pool,
+                        metrics_collector=collector,
+                        fetch_utils=fetch_utils,
+                        writer=writer,
+                    ),
+                )
+                run_service(
+                    "companies",
+                    recorder,
+                    server,
+                    company_service.sync_companies,
+                    lambda: len(company_repo.get_all()),
+                )
+
+            if "nsd" in services:
+                nsd_service = NsdService(
+                    logger=logger,
+                    repository=nsd_repo,
+                    scraper=NsdScraper(
+                        config=config,
+                        logger=logger,
+                        data_cleaner=data_cleaner,
+                        repository=nsd_repo,
+                        worker_pool_executor=pool,
+                        metrics_collector=collector,
+                        fetch_utils=fetch_utils,
+                        writer=writer,
+                    ),
+                )
+                run_service(
+                    "nsd",
+                    recorder,
+                    server,
+                    nsd_service.sync_nsd,
+                    lambda: len(nsd_repo.get_all_primary_keys()),
+                )
+
+            if "statements" in services:
+                statement_service = StatementFetchService(
+                    logger=logger,
+                    config=config,
+                    source=TimedRawStatementScraper(
+                        recorder=items,
+                        config=config,
+                        logger=logger,
+                        data_cleaner=data_cleaner,
+                        metrics_collector=collector,
+                        worker_pool_executor=pool,
+                        fetch_utils=fetch_utils,
+                    ),
+                    company_repo=company_repo,
+                    nsd_repo=nsd_repo,
+                    raw_statement_repo=raw_repo,
+                    parsed_statements_repo=parsed_repo,
+                    metrics_collector=collector,
+                    worker_pool_executor=pool,
+                    writer=writer,
+                )
+                run_service(
+                    "statements (NSDs)",
+                    recorder,
+                    server,
+                    statement_service.sync_statements,
+                    lambda: len(raw_repo.get_existing_by_columns(column_names="nsd")),
+                    items=items,
+                )
+            if hedger is not None:
+                print(
+                    f"{hedger.hedges} hedged requests, "
+                    f"{hedger.hedge_wins} answered first"
+                )
+        finally:
+            fetch_utils.close()
+            if writer is not None:
+                writer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Measure statement pages parsed per second as worker count grows.
+
+A synthetic ``--rows`` row statement page is parsed ``--pages`` times with
+``parse_statement_html``, first on a thread pool and then on a process pool,
+for 1, 2, 4, ... up to ``--max-workers`` workers. Threads plateau at one
+core because BeautifulSoup holds the GIL; processes keep scaling.
+
+Usage:
+    python -m benchmarks.bench_parse --pages 400 --rows 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from domain.dto import WorkerTaskDTO
+from infrastructure.config import Config
+from infrastructure.helpers import (
+    DataCleaner,
+    MetricsCollector,
+    ProcessWorkerPool,
+    WorkerPool,
+)
+from infrastructure.scrapers.html_parsers import parse_statement_html
+
+from .common import QuietLogger, report
+
+_CLEANER = DataCleaner(Config(), QuietLogger())
+
+
+def build_page(rows: int) -> str:
+    """Return a statement page shaped like the CVM ``tbDados`` table."""
+    body = "".join(
+        f"<tr><td>{i // 100 + 1}.{i % 100:02d}</td>"
+        f"<td>Conta descritiva número {i}</td><td>{i * 1234:,}</td></tr>"
+        for i in range(rows)
+    )
+    return (
+        "<html><body><div id='TituloTabelaSemBorda'>Valores (Reais Mil)</div>"
+        f"<table id='ctl00_cphPopUp_tbDados'>{body}</table></body></html>"
+    )
+
+
+def parse_page(task: WorkerTaskDTO) -> int:
+    """Parse one page and return the number of rows found."""
+    _, rows = parse_statement_html(task.data, "DFs", [], _CLEANER)
+    return len(rows)
+
+
+def worker_counts(limit: int) -> list[int]:
+    """Return 1, 2, 4, ... capped at ``limit`` and always including it."""
+    counts = []
+    count = 1
+    while count < limit:
+        counts.append(count)
+        count *= 2
+    counts.append(limit)
+    return counts
+
+
+def main() -> None:
+    """Parse the same pages on threads and processes and print pages/s."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=300)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    config = Config()
+    logger = QuietLogger()
+    page = build_page(args.rows)
+
+    for workers in worker_counts(args.max_workers):
+        thread_pool = WorkerPool(config, MetricsCollector(), max_workers=workers)
+        result = thread_pool.run(
+            tasks=((i, page) for i in range(args.pages)),
+            processor=parse_page,
+            logger=logger,
+        )
+        report(f"threads ({workers})", len(result.items), result.metrics.elapsed_time)
+
+    for workers in worker_counts(args.max_workers):
+        with ProcessWorkerPool(
+            config, MetricsCollector(), max_workers=workers
+        ) as process_pool:
+            # Start the processes before timing so only parsing is measured
+            process_pool.call(os.getpid)
+            result = process_pool.run(
+                tasks=((i, page) for i in range(args.pages)),
+                processor=parse_page,
+                logger=logger,
+            )
+        report(f"processes ({workers})", len(result.items), result.metrics.elapsed_time)
+
+
+if __name__ == "__main__":
+    main()
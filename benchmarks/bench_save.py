@@ -0,0 +1,80 @@
+"""Compare rows per second of the ``save_all`` write paths.
+
+``--rows`` synthetic statement rows are saved in batches of ``--batch``
+into a throwaway SQLite database, once with ``save_mode="merge"`` (one
+SELECT plus INSERT/UPDATE per row through the ORM) and once with
+``"upsert"`` (one ``INSERT ... ON CONFLICT DO UPDATE`` per batch). Each
+mode first inserts every row, then saves them all again as updates.
+
+Usage:
+    python -m benchmarks.bench_save --rows 20000 --batch 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from domain.dto.raw_statement_dto import RawStatementDTO
+from infrastructure.config import Config
+from infrastructure.config.database import DatabaseConfig
+from infrastructure.repositories.raw_statement_repository import (
+    SqlAlchemyRawStatementRepository,
+)
+
+from .common import QuietLogger, report
+
+
+def build_rows(count: int, value: float) -> List[RawStatementDTO]:
+    """Return ``count`` statement rows spread over NSDs of 300 rows."""
+    return [
+        RawStatementDTO(
+            nsd=str(i // 300 + 1),
+            company_name="ACME",
+            quarter="2024-03-31",
+            version="1",
+            grupo="DFs Consolidadas",
+            quadro="Balanço Patrimonial Ativo",
+            account=f"{i % 300 // 100 + 1}.{i % 100:02d}",
+            description=f"Conta descritiva número {i}",
+            value=value + i,
+        )
+        for i in range(count)
+    ]
+
+
+def run(save_mode: str, rows: int, batch: int, data_dir: Path) -> None:
+    """Insert then update ``rows`` rows with ``save_mode``."""
+    config = Config()
+    config.database = DatabaseConfig(
+        data_dir=data_dir, db_filename=f"bench_{save_mode}.db"
+    )
+    repo = SqlAlchemyRawStatementRepository(config, QuietLogger())
+    repo.save_mode = save_mode
+
+    for phase, value in (("insert", 0.0), ("update", 1.0)):
+        items = build_rows(rows, value)
+        start = time.perf_counter()
+        for offset in range(0, rows, batch):
+            repo.save_all(items[offset : offset + batch])
+        report(f"{save_mode} {phase}", rows, time.perf_counter() - start)
+    repo.engine.dispose()
+
+
+def main() -> None:
+    """Parse arguments and time both write paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for save_mode in ("merge", "upsert"):
+            run(save_mode, args.rows, args.batch, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare the thread pool and the asyncio pool on simulated NSD probes.
+
+Each task waits ``--latency`` seconds, standing in for a network round trip.
+The thread pool blocks one thread per task, while the asyncio pool keeps
+``--concurrency`` probes in flight on a single thread.
+
+Usage:
+    python -m benchmarks.bench_worker_pool --tasks 2000 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from domain.dto import WorkerTaskDTO
+from infrastructure.config import Config
+from infrastructure.helpers import AsyncWorkerPool, MetricsCollector, WorkerPool
+
+from .common import QuietLogger, report
+
+
+def main() -> None:
+    """Run both pools over the same simulated workload and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    config = Config()
+    logger = QuietLogger()
+
+    def blocking_probe(task: WorkerTaskDTO) -> int:
+        time.sleep(args.latency)
+        return task.data
+
+    async def async_probe(task: WorkerTaskDTO) -> int:
+        await asyncio.sleep(args.latency)
+        return task.data
+
+    thread_pool = WorkerPool(config, MetricsCollector(), max_workers=args.workers)
+    result = thread_pool.run(
+        tasks=enumerate(range(args.tasks)), processor=blocking_probe, logger=logger
+    )
+    report(f"threads ({args.workers})", len(result.items), result.metrics.elapsed_time)
+
+    async_pool = AsyncWorkerPool(
+        config, MetricsCollector(), max_concurrency=args.concurrency
+    )
+    result = async_pool.run(
+        tasks=enumerate(range(args.tasks)), processor=async_probe, logger=logger
+    )
+    report(
+        f"asyncio ({args.concurrency})", len(result.items), result.metrics.elapsed_time
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from domain.ports import LoggerPort
+
+
+class QuietLogger(LoggerPort):
+    """Logger that discards every message so timings are not skewed."""
+
+    def log(
+        self,
+        message: str,
+        level: str = "info",
+        progress: Optional[dict] = None,
+        extra: Optional[dict] = None,
+        worker_id: Optional[str] = None,
+        show_path: Optional[bool] = None,
+    ) -> None:
+        """Ignore ``message``."""
+        return None
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    """Print a throughput line for ``count`` items processed in ``elapsed``."""
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"{label:<32} {count:>8} items {elapsed:>8.2f}s {rate:>10.1f}/s")
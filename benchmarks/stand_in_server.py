@@ -0,0 +1,440 @@
+"""Local stand-in for the CVM RAD pages and the B3 company API.
+
+The server answers the URLs the scrapers request with synthetic pages shaped
+like the real ones, or with recorded pages when ``recordings`` holds them:
+
+    nsd/<nsd>.html            frmGerenciaPaginaFRE.aspx
+    df/<nsd>-<quadro>.html    frmDemonstracaoFinanceiraITR.aspx
+    capital/<nsd>.html        frmDadosComposicaoCapitalITR.aspx
+    companies/<page>.json     GetInitialCompanies
+    detail/<codeCVM>.json     GetDetail
+
+Latency, server errors and ``MensagemModal`` block pages are injected at the
+rates given in :class:`StandInProfile`, so fetch and worker-pool changes can
+be measured offline. Like the real site, every NSD page carries a new
+``Hash`` and statement pages requested with a hash never issued for their
+NSD get the block page. :meth:`StandInServer.configure` points a ``Config`` at
+the server.
+
+Usage:
+    python -m benchmarks.stand_in_server --port 8800 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from infrastructure.config import Config
+
+NSD_PATH = "/ENET/frmGerenciaPaginaFRE.aspx"
+DF_PATH = "/ENET/frmDemonstracaoFinanceiraITR.aspx"
+CAPITAL_PATH = "/ENET/frmDadosComposicaoCapitalITR.aspx"
+COMPANY_PATH = "/listedCompaniesProxy/CompanyCall/"
+PROBE_PATH = "/generate_204"
+
+BLOCK_PAGE = (
+    "<html><body><div id='MensagemModal'>Por favor, acesse este conteúdo pela "
+    "página principal dos documentos.</div></body></html>"
+)
+QUARTER_END = {3: 31, 6: 30, 9: 30, 12: 31}
+CATEGORIES = ("INFORMACOES TRIMESTRAIS", "DEMONSTRACOES FINANCEIRAS PADRONIZADAS")
+
+
+@dataclass(frozen=True)
+class StandInProfile:
+    """Shape of the simulated sites.
+
+    Attributes:
+        nsd_count: NSDs 1..``nsd_count`` exist; higher ones are empty pages.
+        companies: Companies listed by the B3 API and filing the NSDs.
+        rows: Accounts per statement page.
+        latency: Base seconds before every answer.
+        jitter: Extra random seconds added to ``latency``.
+        error_rate: Share of requests answered with HTTP 503.
+        block_rate: Share of statement pages answered with a block page.
+        stall_rate: Share of requests that hang for ``stall`` seconds
+            before answering, the slow tail hedging targets.
+        stall: Seconds a stalled request hangs.
+        seed: Seed of the random injections.
+        gzip: Whether bodies are gzipped for clients accepting it.
+        recordings: Optional folder of recorded pages served instead of the
+            synthetic ones.
+    """
+
+    nsd_count: int = 200
+    companies: int = 20
+    rows: int = 60
+    latency: float = 0.02
+    jitter: float = 0.01
+    error_rate: float = 0.0
+    block_rate: float = 0.0
+    stall_rate: float = 0.0
+    stall: float = 2.0
+    seed: int = 0
+    gzip: bool = True
+    recordings: Optional[Path] = None
+
+
+def company_name(index: int) -> str:
+    """Return the name of the ``index``-th simulated company."""
+    return f"EMPRESA {index:04d} PARTICIPACOES"
+
+
+def nsd_page(nsd: int, companies: int, hash_value: str) -> str:
+    """Return an NSD page for ``nsd`` filed by one of ``companies``."""
+    year = 2010 + nsd % 14
+    month = (3, 6, 9, 12)[nsd % 4]
+    category = CATEGORIES[1] if month == 12 else CATEGORIES[0]
+    return (
+        "<html><body>"
+        f"<span id='lblNomeCompanhia'>{company_name(nsd % companies)}</span>"
+        f"<span id='lblDataDocumento'>{QUARTER_END[month]}/{month:02d}/{year}</span>"
+        f"<span id='lblDescricaoCategoria'>{category} - {1 + nsd % 2}</span>"
+        f"<span id='lblDataEnvio'>15/{month:02d}/{year} 10:00:00</span>"
+        f"<span id='lblProtocolo'>{nsd:012d}</span>"
+        "<span id='lblNomeDRI'>DIRETOR DE RELACOES</span>"
+        "<span id='lblAuditor'>AUDITORES INDEPENDENTES</span>"
+        f"<input type='hidden' id='hdnHash' value='{hash_value}'/>"
+        "</body></html>"
+    )
+
+
+def statement_page(nsd: int, rows: int) -> str:
+    """Return a ``tbDados`` statement page with ``rows`` accounts."""
+    body = "".join(
+        f"<tr><td>{i // 10 + 1}.{i % 10 + 1:02d}</td>"
+        f"<td>Conta {i} do documento {nsd}</td><td>{(nsd + i) * 1234:,}</td></tr>"
+        for i in range(rows)
+    )
+    return (
+        "<html><body><div id='TituloTabelaSemBorda'>Valores (Reais Mil)</div>"
+        f"<table id='ctl00_cphPopUp_tbDados'>{body}</table></body></html>"
+    )
+
+
+def capital_page(nsd: int) -> str:
+    """Return a capital composition page."""
+    cells = "".join(
+        f"<span id='{elem_id}'>{(nsd + i) * 1000:,}</span>"
+        for i, elem_id in enumerate(
+            ("QtdAordCapiItgz_1", "QtdAprfCapiItgz_1", "QtdAordTeso_1", "QtdAprfTeso_1")
+        )
+    )
+    return (
+        "<html><body><div id='UltimaTabela'>Quantidade (Mil)</div>"
+        f"{cells}</body></html>"
+    )
+
+
+def company_listing(index: int) -> Dict[str, Any]:
+    """Return the listing entry of company ``index``."""
+    return {
+        "codeCVM": str(1000 + index),
+        "issuingCompany": f"EM{index:02d}",
+        "companyName": company_name(index),
+        "tradingName": f"EMPRESA {index:04d}",
+        "cnpj": f"{index:014d}",
+        "segment": "Novo Mercado",
+        "market": "NM",
+        "type": "1",
+        "status": "A",
+        "dateListing": "01/01/2000",
+    }
+
+
+def company_detail(index: int) -> Dict[str, Any]:
+    """Return the detail document of company ``index``."""
+    return {
+        **company_listing(index),
+        "industryClassification": "Financeiro / Holdings / Holdings Diversificadas",
+        "activity": "Participacoes",
+        "website": f"www.empresa{index}.com.br",
+        "otherCodes": [
+            {"code": f"EM{index:02d}3", "isin": f"BREM{index:02d}ACNOR0"},
+            {"code": f"EM{index:02d}4", "isin": f"BREM{index:02d}ACNPR0"},
+        ],
+        "lastDate": "01/01/2024 00:00:00",
+    }
+
+
+class StandInServer:
+    """Threaded HTTP server playing the CVM and B3 endpoints.
+
+    Counts requests, bytes before and after compression, injected errors and blocks in
+    :attr:`stats`. Use as a context manager or call :meth:`start` and
+    :meth:`stop`.
+    """
+
+    def __init__(
+        self,
+        profile: Optional[StandInProfile] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.profile = profile or StandInProfile()
+        self.host = host
+        self.port = port
+        self.stats = {
+            "requests": 0,
+            "bytes": 0,
+            "wire_bytes": 0,
+            "errors": 0,
+            "blocks": 0,
+        }
+        self._random = random.Random(self.profile.seed)
+        # NSD -> hashes issued on its NSD page
+        self._hashes: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL the server listens on."""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "StandInServer":
+        """Start serving on a background thread."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this,
+            # Nagle plus delayed ACKs add ~40ms to every response
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                status, content_type, body = stand_in.respond(self.path)
+                accepted = self.headers.get("Accept-Encoding", "")
+                compress = stand_in.profile.gzip and "gzip" in accepted
+                if compress and body:
+                    body = gzip.compress(body, compresslevel=6)
+                with stand_in._lock:
+                    stand_in.stats["wire_bytes"] += len(body)
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", content_type)
+                    if compress and body:
+                        self.send_header("Content-Encoding", "gzip")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up, e.g. a cancelled hedge loser
+                    self.close_connection = True
+
+            def log_message(self, *args: Any) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stand-in-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def configure(self, config: Config) -> Config:
+        """Point ``config``'s CVM and B3 endpoints at this server."""
+        exchange = config.exchange
+        config.exchange = replace(
+            exchange,
+            nsd_endpoint=self.url
+            + NSD_PATH
+            + "?"
+            + urlsplit(exchange.nsd_endpoint).query,
+            company_data_endpoint={
+                key: self.url + urlsplit(endpoint).path
+                for key, endpoint in exchange.company_data_endpoint.items()
+            },
+        )
+        config.statements = replace(
+            config.statements,
+            url_df=self.url + DF_PATH,
+            url_capital=self.url + CAPITAL_PATH,
+        )
+        config.scraping = replace(config.scraping, test_internet=self.url + PROBE_PATH)
+        return config
+
+    def respond(self, target: str) -> Tuple[int, str, bytes]:
+        """Return status, content type and body for the request ``target``."""
+        profile = self.profile
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = profile.latency + self._random.uniform(0, profile.jitter)
+            failed = self._random.random() < profile.error_rate
+            blocked = self._random.random() < profile.block_rate
+            if self._random.random() < profile.stall_rate:
+                delay += profile.stall
+        time.sleep(delay)
+
+        parts = urlsplit(target)
+        if parts.path == PROBE_PATH:
+            return 204, "text/plain", b""
+        if failed:
+            with self._lock:
+                self.stats["errors"] += 1
+            return 503, "text/plain", b"Service Unavailable"
+
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        status, content_type, text = self._page(parts.path, query, blocked)
+        body = text.encode("utf-8")
+        with self._lock:
+            self.stats["bytes"] += len(body)
+        return status, content_type, body
+
+    def _page(
+        self, path: str, query: Dict[str, str], blocked: bool
+    ) -> Tuple[int, str, str]:
+        profile = self.profile
+        html = "text/html; charset=utf-8"
+        nsd = int(query.get("NumeroSequencialDocumento", 0) or 0)
+
+        if path == NSD_PATH:
+            if not 1 <= nsd <= profile.nsd_count:
+                return 200, html, "<html><body></body></html>"
+            recorded = self._recorded(f"nsd/{nsd}.html")
+            if recorded:
+                return 200, html, recorded
+            return 200, html, nsd_page(nsd, profile.companies, self._issue_hash(nsd))
+
+        if path in (DF_PATH, CAPITAL_PATH):
+            with self._lock:
+                issued = self._hashes.get(nsd)
+            # A hash from another session, e.g. a stale cached page
+            if issued is not None and query.get("Hash") not in issued:
+                blocked = True
+            if blocked:
+                with self._lock:
+                    self.stats["blocks"] += 1
+                return 200, html, BLOCK_PAGE
+            if path == CAPITAL_PATH:
+                return (
+                    200,
+                    html,
+                    self._recorded(f"capital/{nsd}.html") or capital_page(nsd),
+                )
+            quadro = query.get("Quadro", "")
+            return (
+                200,
+                html,
+                self._recorded(f"df/{nsd}-{quadro}.html")
+                or statement_page(nsd, profile.rows),
+            )
+
+        if path.startswith(COMPANY_PATH):
+            call, _, token = path[len(COMPANY_PATH) :].partition("/")
+            payload = json.loads(base64.b64decode(token or "e30=") or b"{}")
+            return 200, "application/json", self._company_call(call, payload)
+
+        return 404, "text/plain", "Not Found"
+
+    def _company_call(self, call: str, payload: Dict[str, Any]) -> str:
+        profile = self.profile
+        if call == "GetInitialCompanies":
+            page = int(payload.get("pageNumber", 1))
+            size = int(payload.get("pageSize", 20))
+            recorded = self._recorded(f"companies/{page}.json")
+            if recorded:
+                return recorded
+            first = (page - 1) * size
+            results = [
+                company_listing(i)
+                for i in range(first, min(first + size, profile.companies))
+            ]
+            total_pages = max(-(-profile.companies // size), 1)
+            return json.dumps(
+                {
+                    "page": {"pageNumber": page, "totalPages": total_pages},
+                    "results": results,
+                }
+            )
+        if call == "GetDetail":
+            code = str(payload.get("codeCVM", ""))
+            recorded = self._recorded(f"detail/{code}.json")
+            if recorded:
+                return recorded
+            return json.dumps(company_detail(int(code) - 1000 if code else 0))
+        return json.dumps({})
+
+    def _issue_hash(self, nsd: int) -> str:
+        """Return a new hash accepted by ``nsd``'s statement pages."""
+        with self._lock:
+            issued = self._hashes.setdefault(nsd, set())
+            hash_value = f"h{nsd:08x}{self._random.getrandbits(32):08x}"
+            issued.add(hash_value)
+        return hash_value
+
+    def _recorded(self, name: str) -> Optional[str]:
+        if self.profile.recordings is None:
+            return None
+        path = Path(self.profile.recordings) / name
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+
+def main() -> None:
+    """Serve the stand-in until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--nsd", type=int, default=200)
+    parser.add_argument("--companies", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--block-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--stall", type=float, default=2.0)
+    parser.add_argument("--recordings", type=Path)
+    parser.add_argument("--no-gzip", action="store_true")
+    args = parser.parse_args()
+
+    profile = StandInProfile(
+        nsd_count=args.nsd,
+        companies=args.companies,
+        rows=args.rows,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        block_rate=args.block_rate,
+        stall_rate=args.stall_rate,
+        stall=args.stall,
+        gzip=not args.no_gzip,
+        recordings=args.recordings,
+    )
+    with StandInServer(profile, port=args.port) as server:
+        print(f"Serving CVM/B3 stand-in on {server.url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
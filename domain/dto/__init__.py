@@ -2,6 +2,7 @@
 
 from .company_data_dto import CompanyDataDTO
 from .execution_result_dto import ExecutionResultDTO
+from .failed_task_dto import FailedTaskDTO
 from .metrics_dto import MetricsDTO
 from .nsd_dto import NsdDTO
 from .page_result_dto import PageResultDTO
@@ -14,7 +15,7 @@ from .raw_company_data_dto import (
 )
 from .raw_statement_dto import RawStatementDTO
 from .sync_companies_result_dto import SyncCompanyDataResultDTO
-from .worker_class_dto import WorkerTaskDTO
+from .worker_class_dto import WorkerResultDTO, WorkerTaskDTO
 
 __all__ = [
     "CompanyDataDTO",
@@ -26,8 +27,10 @@ __all__ = [
     "CompanyDataDetailDTO",
     "CodeDTO",
     "ExecutionResultDTO",
+    "FailedTaskDTO",
     "MetricsDTO",
     "PageResultDTO",
     "WorkerTaskDTO",
+    "WorkerResultDTO",
     "SyncCompanyDataResultDTO",
 ]
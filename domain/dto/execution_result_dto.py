@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Generic, List, TypeVar
 
+from .failed_task_dto import FailedTaskDTO
 from .metrics_dto import MetricsDTO
 
 R = TypeVar("R")
@@ -10,7 +11,15 @@ R = TypeVar("R")
 
 @dataclass(frozen=True)
 class ExecutionResultDTO(Generic[R]):
-    """Results and metrics returned by a worker pool run."""
+    """Results and metrics returned by a worker pool run.
+
+    ``dead_letters`` holds the tasks that kept failing after all retries and
+    ``deadline_reached`` tells whether the run stopped on its time budget
+    and ``interrupted`` whether it stopped on a shutdown request.
+    """
 
     items: List[R]
     metrics: MetricsDTO
+    dead_letters: List[FailedTaskDTO] = field(default_factory=list)
+    deadline_reached: bool = False
+    interrupted: bool = False
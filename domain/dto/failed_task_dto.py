@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class FailedTaskDTO:
+    """Task that still failed after every retry of a worker pool run."""
+
+    index: int
+    data: Any
+    error: str
+    attempts: int
+    worker_id: str
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
 
 
 @dataclass(frozen=True)
@@ -11,3 +12,13 @@ class MetricsDTO:
     network_bytes: int = 0
     processing_bytes: int = 0
     failures: int = 0
+    write_queue_peak: int = 0
+    commits: int = 0
+    commit_time: float = 0.0
+    commit_latency_max: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    # Endpoint (host and path) -> (wire bytes, decoded bytes)
+    endpoint_bytes: Dict[str, Tuple[int, int]] = field(default_factory=dict)
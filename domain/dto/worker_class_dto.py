@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 
 
 @dataclass(frozen=True)
@@ -7,3 +7,17 @@ class WorkerTaskDTO:
     index: int
     data: Any
     worker_id: str
+
+
+@dataclass(frozen=True)
+class WorkerResultDTO:
+    """Picklable envelope returned by process workers.
+
+    Exceptions raised in a child process are reduced to ``error`` text so
+    unpicklable exception types never cross the process boundary.
+    """
+
+    index: int
+    value: Any
+    worker_id: str
+    error: Optional[str] = None
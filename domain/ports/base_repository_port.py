@@ -3,7 +3,20 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Sequence, Tuple, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")   # DTO type
 K = TypeVar("K")   # Key type (e.g., str, int)
@@ -39,6 +52,37 @@ class SqlAlchemyRepositoryBasePort(ABC, Generic[T, K]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[T]:
+        """Stream all persisted items without loading them at once.
+
+        Args:
+            batch_size (Optional[int]): Items fetched per round trip.
+
+        Returns:
+            Iterator[T]: The stored items, one at a time.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def select_columns(
+        self,
+        *column_names: str,
+        distinct: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Tuple]:
+        """Stream plain tuples holding only the requested columns.
+
+        Args:
+            *column_names (str): Columns to select, in tuple order.
+            distinct (bool): Whether duplicate tuples are dropped.
+            batch_size (Optional[int]): Rows fetched per round trip.
+
+        Returns:
+            Iterator[Tuple]: One tuple per stored row.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_all_primary_keys(self) -> List[K]:
         """Retrieve the set of all primary keys currently stored.
@@ -84,6 +128,30 @@ class SqlAlchemyRepositoryBasePort(ABC, Generic[T, K]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_many(self, identifiers: Iterable[K]) -> Dict[K, T]:
+        """Retrieve the items of many identifiers in as few queries as possible.
+
+        Args:
+            identifiers (Iterable[K]): Keys to look up.
+
+        Returns:
+            Dict[K, T]: Item by key; keys not found are absent.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def has_many(self, identifiers: Iterable[K]) -> Set[K]:
+        """Check the existence of many identifiers at once.
+
+        Args:
+            identifiers (Iterable[K]): Keys to check.
+
+        Returns:
+            Set[K]: The keys that exist.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _safe_cast(self, value: Any) -> Union[int, str]:
         raise NotImplementedError
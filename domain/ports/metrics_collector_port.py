@@ -18,6 +18,27 @@ class MetricsCollectorPort(Protocol):
         """Accumulate ``n`` bytes processed locally."""
         raise NotImplementedError
 
+    def record_write_queue_depth(self, depth: int) -> None:
+        """Record the persistence queue depth seen after a submit."""
+        raise NotImplementedError
+
+    def record_commit(self, latency: float) -> None:
+        """Record one repository commit that took ``latency`` seconds."""
+        raise NotImplementedError
+
+    def record_cache_hit(self) -> None:
+        """Record one response served from the response cache."""
+        raise NotImplementedError
+
+    def record_cache_miss(self) -> None:
+        """Record one cacheable response that had to be downloaded."""
+        raise NotImplementedError
+
+    def record_transfer(self, endpoint: str, wire: int, decoded: int) -> None:
+        """Record one response body of ``wire`` bytes on the network and
+        ``decoded`` bytes after decompression."""
+        raise NotImplementedError
+
     @property
     def network_bytes(self) -> int:
         """Total bytes transferred over the network."""
@@ -22,3 +22,9 @@ class NSDRepositoryPort(SqlAlchemyRepositoryBasePort[NsdDTO, str]):
     ) -> List[NsdDTO]:
         """Retorna todos os NSDs válidos ainda não processados."""
         raise NotImplementedError
+
+    @abstractmethod
+    def get_statement_targets(self, valid_types: Set[str]) -> List[NsdDTO]:
+        """Retorna os NSDs de empresas conhecidas, dos tipos aceitos, ainda
+        sem demonstrações brutas salvas, ordenados por número."""
+        raise NotImplementedError
@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Iterable, List, Optional, Protocol, Tuple, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+)
 
 from domain.dto import ExecutionResultDTO, WorkerTaskDTO
 
@@ -20,7 +30,27 @@ class WorkerPoolPort(Protocol):
         logger: LoggerPort,
         on_result: Optional[Callable[[R], None]] = None,
         post_callback: Optional[Callable[[List[R]], None]] = None,
+        keep_results: bool = True,
+        priority: Optional[Callable[[Any], Any]] = None,
+        time_budget: Optional[float] = None,
     ) -> ExecutionResultDTO[R]:
-        """Execute tasks concurrently using worker threads."""
+        """Execute tasks concurrently using worker threads.
+
+        When ``keep_results`` is ``False`` results are discarded after
+        ``on_result`` and the returned ``items`` list is empty. ``priority``
+        maps task data to a sort key (smallest first) and ``time_budget``
+        stops the run cleanly after that many seconds.
+        """
+
+        raise NotImplementedError
+
+    def stream(
+        self,
+        tasks: Iterable[Tuple[int, Any]],
+        processor: Callable[[T], R],
+        logger: LoggerPort,
+        on_result: Optional[Callable[[R], None]] = None,
+    ) -> Iterator[R]:
+        """Yield results as they complete with bounded buffering."""
 
         raise NotImplementedError
@@ -14,6 +14,13 @@ TABLES = {
     "parsed_statements": "tbl_parsed_statements",
 }
 
+# Perfil das conexões SQLite, aplicado a cada conexão aberta
+SQLITE_SYNCHRONOUS = "NORMAL"  # Seguro com WAL; fsync só nos checkpoints
+SQLITE_CACHE_SIZE = -65536  # Cache de páginas; negativo = KiB (64 MiB)
+SQLITE_MMAP_SIZE = 268435456  # Bytes do arquivo lidos via mmap (256 MiB)
+SQLITE_TEMP_STORE = "MEMORY"  # Tabelas e índices temporários em memória
+SQLITE_BUSY_TIMEOUT = 5000  # Milissegundos aguardando um lock antes de falhar
+
 
 @dataclass(frozen=True)
 class DatabaseConfig:
@@ -24,11 +31,21 @@ class DatabaseConfig:
         db_file_name: SQLite file name.
         db_path: Full path to the database file.
         connection_string: SQLAlchemy connection URI.
+        sqlite_synchronous: ``PRAGMA synchronous`` level.
+        sqlite_cache_size: ``PRAGMA cache_size``; negative values are KiB.
+        sqlite_mmap_size: Bytes of the file read through ``mmap``.
+        sqlite_temp_store: Where temporary tables and indexes live.
+        sqlite_busy_timeout: Milliseconds to wait for a lock before failing.
     """
 
     data_dir: Path
     db_filename: str = field(default=DB_FILENAME)
     tables: Mapping[str, str] = field(default_factory=lambda: TABLES)
+    sqlite_synchronous: str = field(default=SQLITE_SYNCHRONOUS)
+    sqlite_cache_size: int = field(default=SQLITE_CACHE_SIZE)
+    sqlite_mmap_size: int = field(default=SQLITE_MMAP_SIZE)
+    sqlite_temp_store: str = field(default=SQLITE_TEMP_STORE)
+    sqlite_busy_timeout: int = field(default=SQLITE_BUSY_TIMEOUT)
     connection_string: str = field(init=False)
 
     def __post_init__(self) -> None:
@@ -47,4 +64,9 @@ def load_database_config() -> DatabaseConfig:
         data_dir=paths.data_dir,
         db_filename=DB_FILENAME,
         tables=TABLES,
+        sqlite_synchronous=SQLITE_SYNCHRONOUS,
+        sqlite_cache_size=SQLITE_CACHE_SIZE,
+        sqlite_mmap_size=SQLITE_MMAP_SIZE,
+        sqlite_temp_store=SQLITE_TEMP_STORE,
+        sqlite_busy_timeout=SQLITE_BUSY_TIMEOUT,
     )
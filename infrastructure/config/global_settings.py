@@ -8,6 +8,16 @@ MAX_LINEAR_HOLES = 200  # Maximum number of linear holes allowed
 MAX_WORKERS = 1  # Default number of threads for sync operations
 BATCH_SIZE = 100  # Number of items per repository batch
 QUEUE_SIZE = 1  # Max queue size for producer/consumer pipeline
+MAX_CONCURRENCY = 100  # Max in-flight coroutines for the asyncio engine
+EXECUTION_BACKEND = "thread"  # Worker pool backend: "thread" or "async"
+TASK_RETRIES = 2  # Extra attempts for a task whose processor raised
+RETRY_BACKOFF = 1.0  # Seconds before the first retry, doubled on each retry
+TIME_BUDGET = 0  # Seconds a pool run may take before it stops (0 = no limit)
+PARSE_WORKERS = 0  # Processes for HTML parsing; 0 parses in the fetch threads
+WRITER_QUEUE_SIZE = 8  # Batches waiting for the persistence writer; 0 saves inline
+RESUME = True  # Continue an interrupted run from its checkpoint
+CPU_SAMPLE_INTERVAL = 1.0  # Seconds between background CPU usage samples
+CPU_SMOOTHING = 0.3  # Weight of the newest CPU sample in the moving average
 
 @dataclass(frozen=True)
 class GlobalSettingsConfig:
@@ -32,7 +42,16 @@ class GlobalSettingsConfig:
     max_workers: int = field(default=MAX_WORKERS)
     batch_size: int = field(default=BATCH_SIZE)
     queue_size: int = field(default=QUEUE_SIZE)
-
+    max_concurrency: int = field(default=MAX_CONCURRENCY)
+    execution_backend: str = field(default=EXECUTION_BACKEND)
+    task_retries: int = field(default=TASK_RETRIES)
+    retry_backoff: float = field(default=RETRY_BACKOFF)
+    time_budget: float = field(default=TIME_BUDGET)
+    parse_workers: int = field(default=PARSE_WORKERS)
+    writer_queue_size: int = field(default=WRITER_QUEUE_SIZE)
+    resume: bool = field(default=RESUME)
+    cpu_sample_interval: float = field(default=CPU_SAMPLE_INTERVAL)
+    cpu_smoothing: float = field(default=CPU_SMOOTHING)
 
 
 def load_global_settings_config() -> GlobalSettingsConfig:
@@ -56,5 +75,15 @@ def load_global_settings_config() -> GlobalSettingsConfig:
         max_workers=MAX_WORKERS,
         batch_size=BATCH_SIZE,
         queue_size=QUEUE_SIZE,
+        max_concurrency=MAX_CONCURRENCY,
+        execution_backend=EXECUTION_BACKEND,
+        task_retries=TASK_RETRIES,
+        retry_backoff=RETRY_BACKOFF,
+        time_budget=TIME_BUDGET,
+        parse_workers=PARSE_WORKERS,
+        writer_queue_size=WRITER_QUEUE_SIZE,
+        resume=RESUME,
+        cpu_sample_interval=CPU_SAMPLE_INTERVAL,
+        cpu_smoothing=CPU_SMOOTHING,
     )
 
@@ -5,6 +5,8 @@ from pathlib import Path
 TEMP_DIR = "temp"
 LOG_DIR = "logs"
 DATA_DIR = "data"
+CHECKPOINT_DIR = "data/checkpoints"
+CACHE_DIR = "data/cache"
 
 
 @dataclass(frozen=True)
@@ -16,11 +18,15 @@ class PathConfig:
         temp_dir: Subfolder for temporary files.
         log_dir: Subfolder for log files.
         data_dir: Subfolder for databases.
+        checkpoint_dir: Subfolder for resumable run checkpoints.
+        cache_dir: Subfolder for the HTTP response cache.
     """
 
     temp_dir: Path = field(init=False)
     log_dir: Path = field(init=False)
     data_dir: Path = field(init=False)
+    checkpoint_dir: Path = field(init=False)
+    cache_dir: Path = field(init=False)
     root_dir: Path = field(init=False)
 
     def __post_init__(self) -> None:
@@ -30,6 +36,8 @@ class PathConfig:
         object.__setattr__(self, "temp_dir", root / TEMP_DIR)
         object.__setattr__(self, "log_dir", root / LOG_DIR)
         object.__setattr__(self, "data_dir", root / DATA_DIR)
+        object.__setattr__(self, "checkpoint_dir", root / CHECKPOINT_DIR)
+        object.__setattr__(self, "cache_dir", root / CACHE_DIR)
 
         # Create folders if they do not already exist
         for fld in fields(self):
@@ -1,11 +1,61 @@
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 TEST_INTERNET = "http://clients3.google.com/generate_204"  # URL usada para verificar conectividade
 TIMEOUT = 5  # Tempo máximo de espera em cada requisição (em segundos)
-MAX_ATTEMPTS = 5  # Número máximo de tentativas em caso de falha
+MAX_ATTEMPTS = 5  # Número máximo de tentativas por requisição (0 = sem limite)
+RETRY_BASE = 0.5  # Espera mínima (s) entre tentativas
+RETRY_CAP = 30.0  # Espera máxima (s) entre tentativas
+RETRY_BUDGET_RATIO = 0.2  # Novas tentativas permitidas por requisição na execução
+RETRY_BUDGET_MIN = 100  # Novas tentativas sempre permitidas, além da proporção
+CONNECTIVITY_TTL = 30.0  # Segundos em que o último veredito de conectividade vale
+ACCEPT_ENCODING = ""  # Compressões aceitas ("" = gzip, deflate e br se instalado)
+
+# Controle adaptativo (AIMD) de concorrência por host
+ADAPTIVE_CONCURRENCY = True  # Ajusta a concorrência por host automaticamente
+CONCURRENCY_INITIAL = 2  # Requisições simultâneas iniciais por host
+CONCURRENCY_MIN = 1  # Limite mínimo por host
+CONCURRENCY_MAX = 32  # Limite máximo por host (também o tamanho do pool)
+CONCURRENCY_INCREASE = 1  # Aumento aditivo a cada rodada saudável
+CONCURRENCY_DECREASE = 0.5  # Fator multiplicativo aplicado em bloqueios
+BLOCK_PAUSE = 5.0  # Pausa (s) de todos os workers do host após um bloqueio
+LATENCY_FACTOR = 3.0  # Latência acima de N x a melhor congela o aumento
+
+# Limite de taxa (token bucket) por host, em requisições por segundo
+RATE_LIMITS = {
+    "www.rad.cvm.gov.br": 5.0,
+    "sistemaswebb3-listados.b3.com.br": 5.0,
+}
+RATE_LIMIT_DEFAULT = 0.0  # Taxa dos demais hosts (0 = sem limite)
+RATE_BURST = 2  # Requisições que podem sair juntas antes do espaçamento
+
+# Sessões reserva, já prontas para substituir uma sessão bloqueada
+SPARE_SESSIONS = 2  # Quantidade de sessões reserva (0 = desativado)
+SPARE_WARM_URL = ""  # URL acessada para abrir a conexão TLS da reserva ("" = não)
+
+# Cache de respostas em disco, com validade (s) por tipo de página
+RESPONSE_CACHE = True  # Reaproveita páginas já baixadas entre execuções
+CACHE_MAX_BYTES = 2 * 1024**3  # Tamanho máximo (comprimido) do cache
+CACHE_POLICIES = {
+    "frmGerenciaPaginaFRE.aspx": None,  # Documento entregue não muda (None = sempre)
+    "frmDemonstracaoFinanceiraITR.aspx": None,
+    "frmDadosComposicaoCapitalITR.aspx": None,
+    "sistemaswebb3-listados.b3.com.br": 6 * 3600,  # Lista de empresas da B3
+}
+CACHE_IGNORED_PARAMS = ("Hash",)  # Parâmetros de sessão fora da chave do cache
+
+# Requisições "hedged": cópia por outra sessão quando a resposta demora
+HEDGE_REQUESTS = False  # Ativa as cópias de requisições lentas
+HEDGE_RATIO = 0.05  # Cópias permitidas por requisição enviada
+HEDGE_QUANTILE = 0.95  # Quantil de latência do endpoint que dispara a cópia
+HEDGE_WINDOW = 200  # Latências recentes guardadas por endpoint
+HEDGE_MIN_SAMPLES = 20  # Amostras necessárias antes de copiar requisições
+HEDGE_SESSIONS = 2  # Sessões próprias das cópias, fora da reserva
+
+# Sondagens de NSD reaproveitadas pelo download completo da mesma execução
+PROBE_MEMO_TTL = 600  # Segundos que uma página sondada fica guardada
 
 USER_AGENTS_JSON = "user_agents.json"  # Arquivo JSON com User-Agents
 REFERERS_JSON = "referers.json"  # Arquivo JSON com Referers
@@ -18,10 +68,56 @@ class ScrapingConfig:
     Attributes:
         test_internet: URL used to check connectivity.
         timeout: Maximum wait time for each request.
-        max_attempts: Maximum retry attempts if a request fails.
+        max_attempts: Attempts per request, the first included, before
+            ``RetryPolicy`` gives up (``0`` never gives up).
+        retry_base: Shortest wait in seconds between attempts.
+        retry_cap: Longest wait in seconds between attempts.
+        retry_budget_ratio: Retries a run may spend per request started
+            (negative disables the budget).
+        retry_budget_min: Retries a run may always spend on top of the
+            ratio.
+        connectivity_ttl: Seconds a connectivity verdict is reused before
+            ``test_internet`` is probed again.
+        accept_encoding: ``Accept-Encoding`` sent with every request; empty
+            negotiates every compression the installed decoders support.
         user_agents: List of user-agent strings loaded from ``user_agents.json``.
         referers: List of referer strings loaded from ``referers.json``.
         languages: List of Accept-Language headers from ``languages.json``.
+        adaptive_concurrency: Whether a shared AIMD controller limits
+            requests per host.
+        concurrency_initial: Starting per-host limit.
+        concurrency_min: Lower bound of the per-host limit.
+        concurrency_max: Upper bound of the per-host limit.
+        concurrency_increase: Additive increase per healthy round.
+        concurrency_decrease: Multiplicative decrease on a block.
+        block_pause: Base pause in seconds applied to a host after a block.
+        latency_factor: Latency growth over the best seen that stops
+            increases.
+        rate_limits: Requests per second tolerated by each host.
+        rate_limit_default: Rate for hosts missing from ``rate_limits``
+            (``0`` disables the limit).
+        rate_burst: Requests a host may receive back to back before the
+            spacing applies.
+        spare_sessions: Sessions built ahead of time for rotation after a
+            block (``0`` disables the reserve).
+        spare_warm_url: URL requested once by each spare so its TLS
+            connection is open before use (empty to skip).
+        response_cache: Whether ``FetchUtils`` serves repeated pages from
+            the on-disk response cache.
+        cache_max_bytes: Compressed size the cache may use on disk.
+        cache_policies: URL fragment to TTL in seconds of cached pages
+            (``None`` never expires); other URLs are not cached.
+        cache_ignored_params: Query parameters left out of cache keys.
+        hedge_requests: Whether requests slower than their endpoint's
+            ``hedge_quantile`` latency are duplicated on another session.
+        hedge_ratio: Hedges allowed per request sent.
+        hedge_quantile: Latency quantile after which a request is hedged.
+        hedge_window: Recent latencies kept per endpoint.
+        hedge_min_samples: Latencies needed before an endpoint is hedged.
+        hedge_sessions: Sessions kept for hedges, apart from the spares; a
+            hedge is skipped while none is idle.
+        probe_memo_ttl: Seconds a page parsed while probing for the last NSD
+            is kept for the download that follows.
     """
 
     user_agents: List[str]
@@ -30,6 +126,38 @@ class ScrapingConfig:
     test_internet: str = field(default=TEST_INTERNET)
     timeout: int = field(default=TIMEOUT)
     max_attempts: int = field(default=MAX_ATTEMPTS)
+    retry_base: float = field(default=RETRY_BASE)
+    retry_cap: float = field(default=RETRY_CAP)
+    retry_budget_ratio: float = field(default=RETRY_BUDGET_RATIO)
+    retry_budget_min: int = field(default=RETRY_BUDGET_MIN)
+    connectivity_ttl: float = field(default=CONNECTIVITY_TTL)
+    accept_encoding: str = field(default=ACCEPT_ENCODING)
+    adaptive_concurrency: bool = field(default=ADAPTIVE_CONCURRENCY)
+    concurrency_initial: int = field(default=CONCURRENCY_INITIAL)
+    concurrency_min: int = field(default=CONCURRENCY_MIN)
+    concurrency_max: int = field(default=CONCURRENCY_MAX)
+    concurrency_increase: float = field(default=CONCURRENCY_INCREASE)
+    concurrency_decrease: float = field(default=CONCURRENCY_DECREASE)
+    block_pause: float = field(default=BLOCK_PAUSE)
+    latency_factor: float = field(default=LATENCY_FACTOR)
+    rate_limits: Dict[str, float] = field(default_factory=lambda: dict(RATE_LIMITS))
+    rate_limit_default: float = field(default=RATE_LIMIT_DEFAULT)
+    rate_burst: float = field(default=RATE_BURST)
+    spare_sessions: int = field(default=SPARE_SESSIONS)
+    spare_warm_url: str = field(default=SPARE_WARM_URL)
+    response_cache: bool = field(default=RESPONSE_CACHE)
+    cache_max_bytes: int = field(default=CACHE_MAX_BYTES)
+    cache_policies: Dict[str, Optional[float]] = field(
+        default_factory=lambda: dict(CACHE_POLICIES)
+    )
+    cache_ignored_params: Tuple[str, ...] = field(default=CACHE_IGNORED_PARAMS)
+    hedge_requests: bool = field(default=HEDGE_REQUESTS)
+    hedge_ratio: float = field(default=HEDGE_RATIO)
+    hedge_quantile: float = field(default=HEDGE_QUANTILE)
+    hedge_window: int = field(default=HEDGE_WINDOW)
+    hedge_min_samples: int = field(default=HEDGE_MIN_SAMPLES)
+    hedge_sessions: int = field(default=HEDGE_SESSIONS)
+    probe_memo_ttl: float = field(default=PROBE_MEMO_TTL)
 
 
 def load_scraping_config() -> ScrapingConfig:
@@ -47,5 +175,35 @@ def load_scraping_config() -> ScrapingConfig:
         languages=languages,
         test_internet=TEST_INTERNET,
         timeout=TIMEOUT,
-        max_attempts=MAX_ATTEMPTS
+        max_attempts=MAX_ATTEMPTS,
+        retry_base=RETRY_BASE,
+        retry_cap=RETRY_CAP,
+        retry_budget_ratio=RETRY_BUDGET_RATIO,
+        retry_budget_min=RETRY_BUDGET_MIN,
+        connectivity_ttl=CONNECTIVITY_TTL,
+        accept_encoding=ACCEPT_ENCODING,
+        adaptive_concurrency=ADAPTIVE_CONCURRENCY,
+        concurrency_initial=CONCURRENCY_INITIAL,
+        concurrency_min=CONCURRENCY_MIN,
+        concurrency_max=CONCURRENCY_MAX,
+        concurrency_increase=CONCURRENCY_INCREASE,
+        concurrency_decrease=CONCURRENCY_DECREASE,
+        block_pause=BLOCK_PAUSE,
+        latency_factor=LATENCY_FACTOR,
+        rate_limits=dict(RATE_LIMITS),
+        rate_limit_default=RATE_LIMIT_DEFAULT,
+        rate_burst=RATE_BURST,
+        spare_sessions=SPARE_SESSIONS,
+        spare_warm_url=SPARE_WARM_URL,
+        response_cache=RESPONSE_CACHE,
+        cache_max_bytes=CACHE_MAX_BYTES,
+        cache_policies=dict(CACHE_POLICIES),
+        cache_ignored_params=CACHE_IGNORED_PARAMS,
+        hedge_requests=HEDGE_REQUESTS,
+        hedge_ratio=HEDGE_RATIO,
+        hedge_quantile=HEDGE_QUANTILE,
+        hedge_window=HEDGE_WINDOW,
+        hedge_min_samples=HEDGE_MIN_SAMPLES,
+        hedge_sessions=HEDGE_SESSIONS,
+        probe_memo_ttl=PROBE_MEMO_TTL,
     )
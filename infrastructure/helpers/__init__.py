@@ -1,17 +1,51 @@
+from .async_fetch_utils import AsyncFetchUtils
+from .async_worker_pool import AsyncWorkerPool
 from .byte_formatter import ByteFormatter
+from .checkpoint import CheckpointStore
+from .concurrency_controller import HostConcurrencyController
+from .connectivity import ConnectivityMonitor
+from .cpu_sampler import CpuSampler
 from .data_cleaner import DataCleaner
 from .fetch_utils import FetchUtils
+from .hedging import RequestHedger
 from .metrics_collector import MetricsCollector
+from .persistence_writer import PersistenceWriter
+from .pipeline import Pipeline, Stage
+from .process_worker_pool import ProcessWorkerPool
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry_policy import RetryExhaustedError, RetryPolicy
 from .save_strategy import SaveStrategy
+from .shutdown import ShutdownSignal
+from .single_flight import SingleFlight
+from .spare_sessions import SpareSessions
 from .time_utils import TimeUtils
 from .worker_pool import WorkerPool
 
 __all__ = [
     "FetchUtils",
+    "AsyncFetchUtils",
     "TimeUtils",
     "DataCleaner",
     "WorkerPool",
+    "AsyncWorkerPool",
+    "ProcessWorkerPool",
     "MetricsCollector",
     "SaveStrategy",
+    "PersistenceWriter",
+    "Pipeline",
+    "Stage",
     "ByteFormatter",
+    "HostConcurrencyController",
+    "ShutdownSignal",
+    "CheckpointStore",
+    "RateLimiter",
+    "SpareSessions",
+    "ConnectivityMonitor",
+    "CpuSampler",
+    "RequestHedger",
+    "ResponseCache",
+    "RetryPolicy",
+    "RetryExhaustedError",
+    "SingleFlight",
 ]
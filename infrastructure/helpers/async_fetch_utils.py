@@ -0,0 +1,419 @@
+"""Asyncio counterpart of :class:`FetchUtils` for the async worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import ssl
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Dict, Optional, Set
+
+import certifi
+
+from domain.ports import LoggerPort, MetricsCollectorPort
+from infrastructure.config import Config
+from infrastructure.helpers.concurrency_controller import HostConcurrencyController
+from infrastructure.helpers.connectivity import ConnectivityMonitor
+from infrastructure.helpers.fetch_utils import FetchUtils
+from infrastructure.helpers.hedging import RequestHedger
+from infrastructure.helpers.rate_limiter import RateLimiter
+from infrastructure.helpers.response_cache import ResponseCache
+from infrastructure.helpers.retry_policy import RetryPolicy
+from infrastructure.helpers.single_flight import SingleFlight
+from infrastructure.helpers.time_utils import TimeUtils
+from infrastructure.helpers.transfer import decode_body
+from infrastructure.utils.id_generator import IdGenerator
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+@dataclass(frozen=True)
+class AsyncResponse:
+    """Fully read HTTP response exposing the ``requests`` attributes used by
+    the scrapers."""
+
+    status_code: int
+    content: bytes
+    encoding: Optional[str] = None
+    from_cache: bool = False
+    shared: bool = False
+
+    @property
+    def text(self) -> str:
+        """Return the decoded body."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Return the body parsed as JSON."""
+        return json.loads(self.text)
+
+
+class AsyncFetchUtils:
+    """Non-blocking HTTP helper with bounded concurrency.
+
+    Requests run on ``aiohttp`` when it is installed. Without it every call
+    falls back to :meth:`FetchUtils.fetch_with_retry` on a worker thread, so
+    callers keep working with the same interface.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: LoggerPort,
+        max_concurrency: Optional[int] = None,
+        controller: Optional[HostConcurrencyController] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        connectivity: Optional[ConnectivityMonitor] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics_collector: Optional[MetricsCollectorPort] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedger: Optional[RequestHedger] = None,
+        flights: Optional[SingleFlight] = None,
+    ) -> None:
+        """Store configuration and prepare per-event-loop state.
+
+        Args:
+            config: Application configuration.
+            logger: Logger used for retry warnings.
+            max_concurrency: Maximum simultaneous requests per event loop.
+            controller: Shared AIMD limiter deciding how many of those
+                requests may target the same host.
+            rate_limiter: Shared token buckets spacing requests per host.
+            connectivity: Shared connectivity monitor for the thread fallback.
+            cache: Shared on-disk response cache.
+            metrics_collector: Collector of wire and decoded bytes per
+                endpoint.
+            retry_policy: Shared backoff, attempt cap and retry budget.
+            hedger: Shared latency tracker deciding when a slow request is
+                duplicated on the loop's hedge session.
+            flights: Shared coalescer of concurrent downloads of one URL.
+        """
+        self.config = config
+        self.logger = logger
+        self.max_concurrency = (
+            max_concurrency or config.global_settings.max_concurrency or 1
+        )
+        self.controller = controller
+        self.rate_limiter = rate_limiter
+        self.fetch_utils = FetchUtils(
+            config,
+            logger,
+            controller=controller,
+            rate_limiter=rate_limiter,
+            connectivity=connectivity,
+            cache=cache,
+            metrics_collector=metrics_collector,
+            retry_policy=retry_policy,
+            hedger=hedger,
+            flights=flights,
+        )
+        self.retry_policy = self.fetch_utils.retry_policy
+        self.flights = self.fetch_utils.flights
+        self.hedger = hedger
+        self.time_util = TimeUtils(config)
+        self.id_generator = IdGenerator(config=config)
+
+        # asyncio primitives are bound to the loop that first uses them
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+        self._shared: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._hedge_shared: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._owned: Dict[asyncio.AbstractEventLoop, Set[Any]] = {}
+
+    @property
+    def native(self) -> bool:
+        """Return ``True`` when requests run natively on the event loop."""
+        return aiohttp is not None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphores[loop]
+
+    async def create_session(self, insecure: bool = False) -> Any:
+        """Return a new ``aiohttp.ClientSession`` with randomized headers.
+
+        Bodies are decompressed by :func:`decode_body` rather than by
+        ``aiohttp`` so the bytes on the wire can be counted.
+
+        Args:
+            insecure: Whether to disable SSL verification.
+        """
+        if insecure:
+            ssl_context: Any = False
+        else:
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ssl=ssl_context)
+        session = aiohttp.ClientSession(
+            headers=self.fetch_utils.header_random(),
+            connector=connector,
+            trust_env=False,
+            auto_decompress=False,
+        )
+        self._owned.setdefault(asyncio.get_running_loop(), set()).add(session)
+        return session
+
+    async def get_session(self, insecure: bool = False) -> Any:
+        """Return the keep-alive session shared by the current event loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._shared:
+            self._shared[loop] = await self.create_session(insecure=insecure)
+        return self._shared[loop]
+
+    async def rotate_session(self, session: Any, insecure: bool = False) -> Any:
+        """Replace a blocked session without disturbing other coroutines."""
+        loop = asyncio.get_running_loop()
+        if session is not self._shared.get(loop):
+            self._owned.get(loop, set()).discard(session)
+            await session.close()
+        return await self.create_session(insecure=insecure)
+
+    async def aclose(self) -> None:
+        """Close every session opened on the current event loop."""
+        loop = asyncio.get_running_loop()
+        for session in self._owned.pop(loop, set()):
+            await session.close()
+        self._shared.pop(loop, None)
+        self._hedge_shared.pop(loop, None)
+        self._semaphores.pop(loop, None)
+
+    def report_block(self, url: str) -> None:
+        """Tell the controller that ``url``'s host served a block page."""
+        self.fetch_utils.report_block(url)
+
+    def forget(self, url: str) -> None:
+        """Drop ``url`` from the response cache."""
+        self.fetch_utils.forget(url)
+
+    def _bypass(self, url: str) -> str:
+        """Append a random query parameter so caches are skipped."""
+        param_name = self.id_generator.create_id(random.randint(1, 4))
+        digest = self.id_generator.create_id(random.randint(4, 12))
+        return f"{url}&{param_name}={digest}"
+
+    async def _get(
+        self, session: Any, target: str, url: str, timeout: float
+    ) -> AsyncResponse:
+        """Send one GET, count its bytes and feed its latency to the hedger."""
+        started = time.perf_counter()
+        # Only ``max_concurrency`` requests are on the wire at a time
+        async with self._semaphore():
+            async with session.get(
+                target, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                wire = await response.read()
+                content = decode_body(wire, response.headers.get("Content-Encoding"))
+                self.fetch_utils.record_transfer(url, len(wire), len(content))
+                if self.hedger is not None and response.status == 200:
+                    self.hedger.observe(url, time.perf_counter() - started)
+                return AsyncResponse(
+                    status_code=response.status,
+                    content=content,
+                    encoding=response.charset,
+                )
+
+    async def _hedged_get(
+        self, session: Any, target: str, url: str, timeout: float, insecure: bool
+    ) -> AsyncResponse:
+        """Send the request, hedging it when it outlives the endpoint's p95.
+
+        The hedge runs on the loop's separate hedge session while
+        :attr:`hedger` allows more hedges and :attr:`controller` has a free
+        slot for the host. The first 200 answer wins and the other request
+        is cancelled.
+        """
+        delay = self.hedger.delay(url) if self.hedger is not None else None
+        if delay is None:
+            return await self._get(session, target, url, timeout)
+
+        primary = asyncio.ensure_future(self._get(session, target, url, timeout))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return await primary
+        # A hedge is optional: skip it rather than wait for the host
+        slot = self.controller.try_slot(url) if self.controller is not None else None
+        host_busy = self.controller is not None and slot is None
+        if host_busy or not self.hedger.try_hedge():
+            if slot is not None:
+                slot.close()
+            return await primary
+
+        loop = asyncio.get_running_loop()
+        try:
+            if loop not in self._hedge_shared:
+                self._hedge_shared[loop] = await self.create_session(insecure=insecure)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url)
+        except BaseException:
+            if slot is not None:
+                slot.close()
+            raise
+        hedge = asyncio.ensure_future(
+            self._get(self._hedge_shared[loop], target, url, timeout)
+        )
+
+        def settle(task: asyncio.Future) -> None:
+            if slot is None:
+                return
+            if (
+                not task.cancelled()
+                and task.exception() is None
+                and task.result().status_code == 200
+            ):
+                slot.success()
+            else:
+                slot.close()
+
+        hedge.add_done_callback(settle)
+
+        pending = {primary, hedge}
+        first: Optional[asyncio.Future] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    first = first or task
+                    if task.exception() is None and task.result().status_code == 200:
+                        if task is hedge:
+                            self.hedger.record_win()
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        # Neither got a 200: report the earliest outcome
+        return first.result()
+
+    async def fetch_with_retry(
+        self,
+        session: Optional[Any],
+        url: str,
+        cache_bypass: bool = False,
+        timeout: Optional[int] = None,
+        insecure: bool = False,
+        worker_id: Optional[str] = None,
+    ) -> tuple[Any, Any]:
+        """Fetch a URL without blocking the loop, rotating the session when
+        blocked.
+
+        Args:
+            session: Session to use, or ``None`` for the loop's shared session.
+            url: Address to request.
+            cache_bypass: Whether to skip the response cache and append a
+                random no-cache parameter.
+            timeout: Base timeout in seconds, grown by one per attempt.
+            insecure: Whether to disable SSL verification.
+            worker_id: Identifier used in log messages.
+
+        Returns:
+            tuple: The response and the session that produced it.
+
+        Raises:
+            RetryExhaustedError: :attr:`retry_policy` gave up on the URL.
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(
+                self.fetch_utils.fetch_with_retry,
+                session,
+                url,
+                cache_bypass,
+                timeout,
+                insecure,
+                worker_id,
+            )
+
+        timeout = timeout or self.config.scraping.timeout or 5
+        session = session or await self.get_session(insecure=insecure)
+
+        cache = self.fetch_utils.cache
+        if cache is not None and not cache_bypass:
+            cached = cache.get(url)
+            if cached is not None:
+                return (
+                    AsyncResponse(
+                        status_code=200,
+                        content=cached.content,
+                        encoding=cached.encoding,
+                        from_cache=True,
+                    ),
+                    session,
+                )
+
+        def download() -> Awaitable[tuple[AsyncResponse, Any]]:
+            return self._download(
+                session, url, cache_bypass, timeout, insecure, worker_id
+            )
+
+        # A bypassing caller wants its own fresh page, not a shared one
+        if cache_bypass:
+            return await download()
+        # Coroutines asking for the same URL share the first one's download
+        (response, fetched_with), leader = await self.flights.do_async(
+            (url, insecure), download
+        )
+        if leader:
+            return response, fetched_with
+        # Only the leader's bytes count as downloaded
+        return replace(response, shared=True), session
+
+    async def _download(
+        self,
+        session: Any,
+        url: str,
+        cache_bypass: bool,
+        timeout: int,
+        insecure: bool,
+        worker_id: Optional[str],
+    ) -> tuple[Any, Any]:
+        """Download ``url`` with retries for :meth:`fetch_with_retry`."""
+        cache = self.fetch_utils.cache
+        retry = self.retry_policy.start()
+
+        while True:
+            target = self._bypass(url) if cache_bypass else url
+            # Wait for the host's next token without blocking the loop
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url)
+            # Wait for a slot on the host; paused hosts hold every coroutine
+            host = (
+                await self.controller.acquire_async(url)
+                if self.controller is not None
+                else None
+            )
+            started = time.perf_counter()
+            success, latency = True, None
+            try:
+                response = await self._hedged_get(
+                    session, target, url, timeout + retry.attempt - 1, insecure
+                )
+                if response.status_code == 200:
+                    latency = time.perf_counter() - started
+                    if cache is not None:
+                        cache.put(url, response.content, response.encoding)
+                    return response, session
+                success = False
+            except (asyncio.TimeoutError, aiohttp.ClientError):
+                pass
+            except Exception:  # noqa: BLE001
+                self.logger.log(
+                    f"Attempt {retry.attempt} {url}",
+                    level="warning",
+                    worker_id=worker_id,
+                )
+            finally:
+                if host is not None:
+                    self.controller.release(host, success=success, latency=latency)
+
+            # Jittered backoff without blocking the other coroutines;
+            # raises once the attempts or budget run out
+            await retry.sleep_async()
+
+            # Recreate the session in case we were blocked
+            session = await self.rotate_session(session, insecure)
@@ -0,0 +1,363 @@
+"""Asyncio implementation of the domain ``WorkerPoolPort``."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from domain.dto import ExecutionResultDTO, FailedTaskDTO, WorkerTaskDTO
+from domain.ports import LoggerPort, MetricsCollectorPort, WorkerPoolPort
+from infrastructure.config import Config
+from infrastructure.helpers.async_fetch_utils import AsyncFetchUtils
+from infrastructure.helpers.result_stream import stream_results
+from infrastructure.helpers.task_scheduler import PriorityFn, StopFlag, TaskScheduler
+
+T = WorkerTaskDTO
+R = TypeVar("R")
+
+
+class AsyncWorkerPool(WorkerPoolPort):
+    """Event-loop worker pool for I/O-bound processors.
+
+    Coroutine processors run directly on the loop, so ``max_concurrency``
+    tasks can be in flight on a single thread. Plain callables are still
+    accepted and are offloaded to at most ``max_workers`` threads.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        metrics_collector: MetricsCollectorPort,
+        max_concurrency: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        fetch_utils: Optional[AsyncFetchUtils] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        shutdown: Optional[StopFlag] = None,
+    ) -> None:
+        """Initialize the pool with configuration and metrics.
+
+        Args:
+            config: Application configuration.
+            metrics_collector: Collector packaged into the execution result.
+            max_concurrency: Number of worker coroutines.
+            max_workers: Thread count used for synchronous processors.
+            fetch_utils: Async HTTP helper shared by the processors of this
+                pool. Its sessions are closed at the end of every run.
+            max_retries: Extra attempts for a task whose processor raised.
+            retry_backoff: Seconds before the first retry, doubled on each
+                following retry.
+            shutdown: Optional ``ShutdownSignal``; once set, runs stop
+                taking new tasks and let in-flight ones finish.
+        """
+        self.config = config
+        self.metrics_collector = metrics_collector
+        self.max_concurrency = (
+            max_concurrency or config.global_settings.max_concurrency or 1
+        )
+        self.max_workers = max_workers or config.global_settings.max_workers or 1
+        self.fetch_utils = fetch_utils
+        self.max_retries = (
+            config.global_settings.task_retries if max_retries is None else max_retries
+        )
+        self.retry_backoff = (
+            config.global_settings.retry_backoff
+            if retry_backoff is None
+            else retry_backoff
+        )
+        self.shutdown = shutdown
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def run(
+        self,
+        tasks: Iterable[Tuple[int, Any]],
+        processor: Callable[[T], Union[R, Awaitable[R]]],
+        logger: LoggerPort,
+        on_result: Optional[Callable[[R], None]] = None,
+        post_callback: Optional[Callable[[List[R]], None]] = None,
+        keep_results: bool = True,
+        priority: Optional[PriorityFn] = None,
+        time_budget: Optional[float] = None,
+    ) -> ExecutionResultDTO[R]:
+        """Process ``tasks`` on a fresh event loop using ``processor``."""
+        return asyncio.run(
+            self.run_async(
+                tasks,
+                processor,
+                logger,
+                on_result,
+                post_callback,
+                keep_results,
+                priority,
+                time_budget,
+            )
+        )
+
+    async def run_async(
+        self,
+        tasks: Iterable[Tuple[int, Any]],
+        processor: Callable[[T], Union[R, Awaitable[R]]],
+        logger: LoggerPort,
+        on_result: Optional[Callable[[R], None]] = None,
+        post_callback: Optional[Callable[[List[R]], None]] = None,
+        keep_results: bool = True,
+        priority: Optional[PriorityFn] = None,
+        time_budget: Optional[float] = None,
+    ) -> ExecutionResultDTO[R]:
+        """Process ``tasks`` on the running event loop using ``processor``.
+
+        With ``keep_results=False`` results are dropped after ``on_result``.
+        Failing tasks are retried and dead-lettered, and ``priority`` and
+        ``time_budget`` behave like in :meth:`WorkerPool.run`.
+        """
+        scheduler = TaskScheduler(
+            priority,
+            (
+                self.config.global_settings.time_budget
+                if time_budget is None
+                else time_budget
+            ),
+            self.shutdown,
+        )
+        results: List[R] = []
+        dead_letters: List[FailedTaskDTO] = []
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue(
+            scheduler.queue_size(self.config.global_settings.queue_size)
+        )
+        skipped = 0
+        retries_settled = asyncio.Event()
+        scheduled_retries = 0
+        sentinel = object()
+        start_time = time.perf_counter()
+        is_coroutine = inspect.iscoroutinefunction(processor)
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+
+        executor = None if is_coroutine else ThreadPoolExecutor(self.max_workers)
+        # Strong references keep pending retry timers from being collected
+        retry_tasks: Set[asyncio.Task] = set()
+
+        async def requeue(item: Tuple[int, Any, int], delay: float) -> None:
+            nonlocal scheduled_retries
+            await asyncio.sleep(delay)
+            await queue.put(scheduler.entry(item))
+            scheduled_retries -= 1
+            retries_settled.set()
+
+        def handle_failure(
+            index: int, entry: Any, attempt: int, worker_id: str, exc: Exception
+        ) -> None:
+            nonlocal scheduled_retries
+            if attempt <= self.max_retries and not scheduler.expired():
+                delay = self.retry_backoff * 2 ** (attempt - 1)
+                logger.log(
+                    f"task {index} failed (attempt {attempt}), retrying in "
+                    f"{delay:.2f}s: {exc}",
+                    level="warning",
+                    worker_id=worker_id,
+                )
+                scheduled_retries += 1
+                retry = asyncio.create_task(requeue((index, entry, attempt + 1), delay))
+                retry_tasks.add(retry)
+                retry.add_done_callback(retry_tasks.discard)
+                return
+
+            logger.log(
+                f"task {index} failed after {attempt} attempts: {exc}",
+                level="warning",
+                worker_id=worker_id,
+            )
+            dead_letters.append(
+                FailedTaskDTO(
+                    index=index,
+                    data=entry,
+                    error=f"{type(exc).__name__}: {exc}",
+                    attempts=attempt,
+                    worker_id=worker_id,
+                )
+            )
+
+        async def worker(worker_id: str) -> None:
+            nonlocal skipped
+            while True:
+                item = (await queue.get())[-1]
+                if item is sentinel:
+                    queue.task_done()
+                    break
+                if scheduler.expired():
+                    # Out of time: drain the queue without starting new work
+                    skipped += 1
+                    queue.task_done()
+                    continue
+                index, entry, attempt = item
+                task = WorkerTaskDTO(index=index, data=entry, worker_id=worker_id)
+                try:
+                    try:
+                        if is_coroutine:
+                            result = await processor(task)
+                        else:
+                            result = await loop.run_in_executor(
+                                executor, processor, task
+                            )
+                    except Exception as exc:  # noqa: BLE001
+                        handle_failure(index, entry, attempt, worker_id, exc)
+                        continue
+                    # Results are appended on the loop thread, no lock needed
+                    if keep_results:
+                        results.append(result)
+                    if callable(on_result):
+                        on_result(result)
+                except Exception as exc:  # noqa: BLE001
+                    logger.log(
+                        f"worker error: {exc}", level="warning", worker_id=worker_id
+                    )
+                finally:
+                    queue.task_done()
+
+        # Synchronous processors cannot use more slots than threads
+        size = self.max_concurrency if is_coroutine else self.max_workers
+        workers = [
+            asyncio.create_task(worker(uuid.uuid4().hex[:8])) for _ in range(size)
+        ]
+
+        try:
+            for index, entry in tasks:
+                if scheduler.expired():
+                    break
+                await queue.put(scheduler.entry((index, entry, 1)))
+
+            # Retries are re-queued before their failed attempt is marked
+            # done, so an empty queue with no scheduled retry means finished
+            while True:
+                await queue.join()
+                if not scheduled_retries:
+                    break
+                retries_settled.clear()
+                await retries_settled.wait()
+
+            for _ in range(size):
+                await queue.put(scheduler.sentinel(sentinel))
+
+            await asyncio.gather(*workers)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if self.fetch_utils is not None:
+                await self.fetch_utils.aclose()
+            self._loop = None
+
+        elapsed = time.perf_counter() - start_time
+
+        deadline_reached = scheduler.deadline_passed()
+        interrupted = scheduler.interrupted()
+        if deadline_reached or interrupted:
+            reason = (
+                "Shutdown requested"
+                if interrupted
+                else f"Time budget of {scheduler.time_budget}s reached"
+            )
+            logger.log(f"{reason}, {skipped} queued tasks skipped", level="warning")
+
+        # Package execution metrics (network and processing bytes)
+        metrics = self.metrics_collector.get_metrics(elapsed_time=elapsed)
+        metrics = replace(metrics, failures=metrics.failures + len(dead_letters))
+
+        # Final callback after all tasks are done
+        if callable(post_callback):
+            post_callback(results)
+
+        return ExecutionResultDTO(
+            items=results,
+            metrics=metrics,
+            dead_letters=dead_letters,
+            deadline_reached=deadline_reached,
+            interrupted=interrupted,
+        )
+
+    def stream(
+        self,
+        tasks: Iterable[Tuple[int, Any]],
+        processor: Callable[[T], Union[R, Awaitable[R]]],
+        logger: LoggerPort,
+        on_result: Optional[Callable[[R], None]] = None,
+    ) -> Iterator[R]:
+        """Yield results as they complete while the loop runs on a background
+        thread, keeping at most ``queue_size`` results buffered."""
+        return stream_results(
+            self.run,
+            tasks,
+            processor,
+            logger,
+            on_result=on_result,
+            queue_size=self.config.global_settings.queue_size,
+        )
+
+    @contextmanager
+    def serve(self) -> Iterator[None]:
+        """Keep an event loop running on a background thread meanwhile.
+
+        Threads outside a run, such as pipeline stages, then hand their
+        coroutines to this loop through :meth:`run_coroutine` and share
+        its sessions and keep-alive connections, instead of opening a loop
+        and a session per call. The sessions are closed on exit.
+        """
+        if self._loop is not None:
+            yield
+            return
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="async-pool-loop", daemon=True
+        )
+        thread.start()
+        self._loop = loop
+        try:
+            yield
+        finally:
+            self._loop = None
+            if self.fetch_utils is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self.fetch_utils.aclose(), loop
+                ).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def run_coroutine(self, coroutine: Awaitable[R]) -> R:
+        """Run ``coroutine`` on the loop of the active run and wait for it.
+
+        Synchronous processors execute on executor threads; this lets them
+        hand their I/O back to the pool's event loop. Outside a run or
+        :meth:`serve` the coroutine gets its own loop, whose sessions are
+        closed afterwards.
+        """
+        if self._loop is None:
+
+            async def run_and_close() -> R:
+                try:
+                    return await coroutine
+                finally:
+                    if self.fetch_utils is not None:
+                        await self.fetch_utils.aclose()
+
+            return asyncio.run(run_and_close())
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)  # type: ignore[arg-type]
+        return future.result()
@@ -0,0 +1,98 @@
+"""Resumable run checkpoints stored as small JSON files."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from infrastructure.config import Config
+
+
+def _to_ranges(values: Iterable[int]) -> List[List[int]]:
+    """Compress sorted integers into ``[first, last]`` runs."""
+    ranges: List[List[int]] = []
+    for value in sorted(set(values)):
+        if ranges and value == ranges[-1][1] + 1:
+            ranges[-1][1] = value
+        else:
+            ranges.append([value, value])
+    return ranges
+
+
+def _from_ranges(ranges: Iterable[Iterable[int]]) -> Set[int]:
+    done: Set[int] = set()
+    for first, last in ranges:
+        done.update(range(first, last + 1))
+    return done
+
+
+class CheckpointStore:
+    """Record which tasks of a named run are done.
+
+    An interrupted run saves the keys it completed (NSD numbers, for
+    example) plus whatever it needs to restart, such as the NSD range it
+    had probed. The next run loads the checkpoint, skips those keys and
+    reuses the metadata instead of probing again. A run that finishes
+    clears its checkpoint.
+
+    Keys are kept as ``[first, last]`` ranges, so a checkpoint of a long
+    NSD scan stays a few lines long. Thread-safe.
+    """
+
+    def __init__(self, config: Config, name: str) -> None:
+        """Bind the store to ``<paths.checkpoint_dir>/<name>.json``."""
+        self.path = Path(config.paths.checkpoint_dir) / f"{name}.json"
+        self.completed: Set[int] = set()
+        self.meta: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """Read the checkpoint from disk.
+
+        Returns:
+            bool: ``True`` when a checkpoint existed.
+        """
+        if not self.path.exists():
+            return False
+        with self.path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+        with self._lock:
+            self.completed = _from_ranges(data.get("completed", []))
+            self.meta = data.get("meta", {})
+        return True
+
+    def mark(self, key: int) -> None:
+        """Record ``key`` as completed."""
+        with self._lock:
+            self.completed.add(int(key))
+
+    def is_done(self, key: int) -> bool:
+        """Return ``True`` if ``key`` was completed by this or a past run."""
+        with self._lock:
+            return int(key) in self.completed
+
+    def save(self, **meta: Any) -> None:
+        """Write completed keys and ``meta`` atomically."""
+        with self._lock:
+            self.meta.update(meta)
+            data = {"completed": _to_ranges(self.completed), "meta": self.meta}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as handle:
+            json.dump(data, handle)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        """Forget the checkpoint once a run completes."""
+        with self._lock:
+            self.completed.clear()
+            self.meta = {}
+        if self.path.exists():
+            self.path.unlink()
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Return a metadata value saved by a previous run."""
+        return self.meta.get(key, default)
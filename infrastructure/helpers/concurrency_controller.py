@@ -0,0 +1,245 @@
+"""Adaptive per-host concurrency limits shared by every worker."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from infrastructure.config import Config
+
+# Weight of the newest sample in the latency moving average
+_LATENCY_ALPHA = 0.2
+
+# How often waiters re-check a busy host
+_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class HostState:
+    """Mutable AIMD state of a single host."""
+
+    limit: float
+    in_flight: int = 0
+    successes: int = 0
+    blocks: int = 0
+    consecutive_blocks: int = 0
+    paused_until: float = 0.0
+    latency: Optional[float] = None
+    best_latency: Optional[float] = None
+
+
+class HostConcurrencyController:
+    """AIMD controller deciding how many requests may hit each host at once.
+
+    Every worker asks for a slot before a request and reports how it went:
+
+    - a healthy response adds ``increase`` to the host limit once per
+      "round" (``limit`` successes), unless latency has grown beyond
+      ``latency_factor`` times the best latency seen, a sign of queuing;
+    - a block multiplies the limit by ``decrease`` and pauses *every*
+      worker on that host for ``block_pause * 2**(n-1)`` seconds (capped at
+      64x), where ``n`` counts consecutive blocks. Blocks reported while the host is
+      already paused belong to the same event and are not counted again.
+
+    Hosts are independent, so a block on ``rad.cvm.gov.br`` never slows
+    down ``sistemaswebb3-listados.b3.com.br``. The controller is thread-safe
+    and offers :meth:`acquire_async` for the asyncio backend.
+    """
+
+    def __init__(self, config: Config) -> None:
+        """Read limits from ``config.scraping``."""
+        scraping = config.scraping
+        self.initial = scraping.concurrency_initial
+        self.minimum = scraping.concurrency_min
+        self.maximum = scraping.concurrency_max
+        self.increase = scraping.concurrency_increase
+        self.decrease = scraping.concurrency_decrease
+        self.block_pause = scraping.block_pause
+        self.latency_factor = scraping.latency_factor
+
+        self._hosts: Dict[str, HostState] = {}
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the host part of ``url`` used as the controller key."""
+        return urlsplit(url).hostname or url
+
+    def _state(self, host: str) -> HostState:
+        if host not in self._hosts:
+            self._hosts[host] = HostState(limit=float(self.initial))
+        return self._hosts[host]
+
+    def _try_acquire(self, host: str) -> float:
+        """Take a slot for ``host``; return ``0`` on success or the number of
+        seconds worth waiting before trying again. Caller holds the lock."""
+        state = self._state(host)
+        pause = state.paused_until - time.monotonic()
+        if pause > 0:
+            return pause
+        if state.in_flight >= max(int(state.limit), self.minimum):
+            return _POLL_INTERVAL
+        state.in_flight += 1
+        return 0.0
+
+    def acquire(self, url: str) -> str:
+        """Block until a request to ``url``'s host is allowed.
+
+        Returns:
+            str: Host key to pass back to :meth:`release`.
+        """
+        host = self.host_of(url)
+        with self._condition:
+            while True:
+                wait = self._try_acquire(host)
+                if not wait:
+                    return host
+                self._condition.wait(timeout=wait)
+
+    async def acquire_async(self, url: str) -> str:
+        """Event-loop counterpart of :meth:`acquire`."""
+        host = self.host_of(url)
+        while True:
+            with self._condition:
+                wait = self._try_acquire(host)
+            if not wait:
+                return host
+            await asyncio.sleep(min(wait, _POLL_INTERVAL))
+
+    def release(
+        self, host: str, success: bool = True, latency: Optional[float] = None
+    ) -> None:
+        """Return a slot and record its outcome.
+
+        Args:
+            host: Key returned by :meth:`acquire`.
+            success: Whether the host answered normally. Failures that are
+                not blocks (timeouts, DNS) should still pass ``True`` with no
+                latency so they neither grow nor shrink the limit.
+            latency: Seconds the request took, when it succeeded.
+        """
+        with self._condition:
+            state = self._state(host)
+            state.in_flight = max(state.in_flight - 1, 0)
+            if success and latency is not None:
+                self._on_success(state, latency)
+            elif not success:
+                self._on_block(state)
+            self._condition.notify_all()
+
+    def record_block(self, url: str) -> None:
+        """Report a block detected after the response was read (for example
+        a ``MensagemModal`` page served with status 200)."""
+        with self._condition:
+            self._on_block(self._state(self.host_of(url)))
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator["_Slot"]:
+        """Hold a slot for ``url`` while the ``with`` block runs.
+
+        The block reports its outcome through the yielded object; leaving it
+        without a report releases the slot as a neutral outcome.
+        """
+        permit = _Slot(self, self.acquire(url))
+        try:
+            yield permit
+        finally:
+            permit.close()
+
+    def try_slot(self, url: str) -> Optional["_Slot"]:
+        """Return a slot for ``url`` if one is free right now, else ``None``.
+
+        For optional requests, such as hedges, that should not wait for the
+        host. The caller reports the outcome and releases the slot.
+        """
+        host = self.host_of(url)
+        with self._condition:
+            if self._try_acquire(host):
+                return None
+        return _Slot(self, host)
+
+    def _on_success(self, state: HostState, latency: float) -> None:
+        state.consecutive_blocks = 0
+        state.latency = (
+            latency
+            if state.latency is None
+            else (1 - _LATENCY_ALPHA) * state.latency + _LATENCY_ALPHA * latency
+        )
+        if state.best_latency is None or latency < state.best_latency:
+            state.best_latency = latency
+
+        # Rising latency means the host is queuing us: hold the limit
+        if state.latency > self.latency_factor * state.best_latency:
+            state.successes = 0
+            return
+
+        state.successes += 1
+        if state.successes >= int(state.limit):
+            state.successes = 0
+            state.limit = min(state.limit + self.increase, float(self.maximum))
+
+    def _on_block(self, state: HostState) -> None:
+        now = time.monotonic()
+        if state.paused_until > now:
+            # Same block event seen by another worker
+            return
+        state.blocks += 1
+        state.consecutive_blocks += 1
+        state.successes = 0
+        state.limit = max(state.limit * self.decrease, float(self.minimum))
+        # Exponential pause, capped at 64x the base
+        state.paused_until = now + self.block_pause * 2 ** min(
+            state.consecutive_blocks - 1, 6
+        )
+
+    def limit(self, url: str) -> int:
+        """Return the current concurrency limit for ``url``'s host."""
+        with self._condition:
+            return max(int(self._state(self.host_of(url)).limit), self.minimum)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return limit, in-flight count, blocks and latency per host."""
+        with self._condition:
+            return {
+                host: {
+                    "limit": max(int(state.limit), self.minimum),
+                    "in_flight": state.in_flight,
+                    "blocks": state.blocks,
+                    "latency": state.latency or 0.0,
+                }
+                for host, state in self._hosts.items()
+            }
+
+
+class _Slot:
+    """Outcome recorder handed out by :meth:`HostConcurrencyController.slot`."""
+
+    def __init__(self, controller: HostConcurrencyController, host: str) -> None:
+        self.controller = controller
+        self.host = host
+        self.start = time.perf_counter()
+        self._released = False
+
+    def success(self) -> None:
+        """Record a healthy response timed from slot acquisition."""
+        self._release(True, time.perf_counter() - self.start)
+
+    def blocked(self) -> None:
+        """Record a block; the host is cut back and paused."""
+        self._release(False, None)
+
+    def close(self) -> None:
+        """Release the slot without a signal if nothing was recorded."""
+        self._release(True, None)
+
+    def _release(self, success: bool, latency: Optional[float]) -> None:
+        if self._released:
+            return
+        self._released = True
+        self.controller.release(self.host, success=success, latency=latency)
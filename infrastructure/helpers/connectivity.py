@@ -0,0 +1,115 @@
+"""Shared internet connectivity verdict with a single in-flight probe."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+import requests
+
+from infrastructure.config import Config
+from infrastructure.helpers.time_utils import TimeUtils
+
+FALLBACK_URL = "https://www.google.com"
+
+
+class ConnectivityMonitor:
+    """Tell workers whether the network is up without probing per request.
+
+    Any HTTP response a worker receives proves the link works, so
+    :meth:`mark_online` refreshes the verdict for ``ttl`` seconds. While the
+    verdict is fresh :meth:`wait_online` returns at once. Once it expires,
+    the first caller probes ``scraping.test_internet`` until it answers and
+    every other caller waits on that probe instead of sending its own.
+
+    Thread-safe; one monitor is shared by every ``FetchUtils``.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        ttl: Optional[float] = None,
+        url: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Read the probe URL, timeout and verdict TTL from ``config.scraping``.
+
+        Args:
+            config: Application configuration.
+            ttl: Seconds a verdict is reused, defaulting to
+                ``scraping.connectivity_ttl``.
+            url: Probe URL, defaulting to ``scraping.test_internet``.
+            timeout: Probe timeout in seconds.
+        """
+        scraping = config.scraping
+        self.ttl = scraping.connectivity_ttl if ttl is None else ttl
+        self.url = url or scraping.test_internet or FALLBACK_URL
+        self.timeout = timeout or scraping.timeout or 5
+        self.time_util = TimeUtils(config)
+        # Number of probes actually sent
+        self.probes = 0
+
+        self._online_at: Optional[float] = None
+        self._probing: Optional[threading.Event] = None
+        self._lock = threading.Lock()
+
+    def is_fresh(self) -> bool:
+        """Return ``True`` while the last online verdict is within ``ttl``."""
+        online_at = self._online_at
+        return online_at is not None and time.monotonic() - online_at < self.ttl
+
+    def mark_online(self) -> None:
+        """Record that a request just got an answer."""
+        self._online_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Drop the verdict so the next :meth:`wait_online` probes."""
+        self._online_at = None
+
+    def probe(self, url: Optional[str] = None) -> bool:
+        """Send one connectivity request and return whether it succeeded."""
+        with self._lock:
+            self.probes += 1
+        try:
+            response = requests.get(url or self.url, timeout=self.timeout)
+        except Exception:  # noqa: BLE001
+            return False
+        return response.status_code in (200, 204)
+
+    def wait_online(self) -> bool:
+        """Block until the network is known to be up.
+
+        Returns immediately with a fresh verdict. Otherwise one caller
+        probes, sleeping between failures, while the others wait for it.
+
+        Returns:
+            bool: Always ``True``, once connectivity is confirmed.
+        """
+        if self.is_fresh():
+            return True
+
+        with self._lock:
+            if self.is_fresh():
+                return True
+            probing = self._probing
+            leader = probing is None
+            if leader:
+                probing = self._probing = threading.Event()
+
+        if not leader:
+            probing.wait()
+            return True
+
+        try:
+            url = self.url
+            while not self.probe(url):
+                # não faz nada, apenas dorme e tenta de novo
+                url = FALLBACK_URL
+                self.time_util.sleep_dynamic()
+            self.mark_online()
+        finally:
+            with self._lock:
+                self._probing = None
+            probing.set()
+        return True
@@ -0,0 +1,96 @@
+"""Process-wide CPU load sampled on a background thread."""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import psutil
+
+
+class CpuSampler:
+    """Publish a smoothed CPU usage that readers get without waiting.
+
+    A daemon thread calls ``psutil.cpu_percent`` every ``interval``
+    seconds and folds each sample into an exponential moving average
+    weighted by ``smoothing``. :attr:`load` returns the latest average at
+    once, so sleep decisions no longer block a worker for the sampling
+    interval. The thread starts on the first read.
+
+    Use :meth:`shared` for the instance every :class:`TimeUtils` reads.
+    """
+
+    _shared: Optional["CpuSampler"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, interval: float = 1.0, smoothing: float = 0.3) -> None:
+        """Store the sampling settings; nothing runs until the first read.
+
+        Args:
+            interval: Seconds between samples.
+            smoothing: Weight of the newest sample, between 0 and 1.
+        """
+        self.interval = interval
+        self.smoothing = smoothing
+        self._load: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def shared(
+        cls, interval: Optional[float] = None, smoothing: Optional[float] = None
+    ) -> "CpuSampler":
+        """Return the process-wide sampler, creating it on first use.
+
+        The settings only apply to the call that creates it.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(
+                    interval=1.0 if interval is None else interval,
+                    smoothing=0.3 if smoothing is None else smoothing,
+                )
+            return cls._shared
+
+    @property
+    def load(self) -> float:
+        """Return the smoothed CPU usage in percent, ``0`` before a sample."""
+        self.start()
+        return self._load or 0.0
+
+    def start(self) -> None:
+        """Start the sampling thread unless it is already running."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            # Prime psutil so the first sample covers the first interval
+            psutil.cpu_percent(interval=None)
+            self._thread = threading.Thread(
+                target=self._run, name="cpu-sampler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread; the next read starts it again."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stop.set()
+        if thread is not None:
+            thread.join()
+
+    def record(self, sample: float) -> float:
+        """Fold ``sample`` into the moving average and return it."""
+        if self._load is None:
+            self._load = sample
+        else:
+            self._load += self.smoothing * (sample - self._load)
+        return self._load
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            # Usage since the previous call; returns without blocking
+            self.record(psutil.cpu_percent(interval=None))
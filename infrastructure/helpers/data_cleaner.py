@@ -33,6 +33,16 @@ class DataCleaner(DataCleanerPort):
 
         # self.logger.log(f"Load Class {self.__class__.__name__}", level="info")
 
+    def __getstate__(self) -> dict:
+        """Drop the logger when pickled for a worker process.
+
+        Loggers hold file and database handles; the normalization helpers
+        treat a missing logger as "do not log".
+        """
+        state = self.__dict__.copy()
+        state["logger"] = None
+        return state
+
     def clean_text(
         self, text: Optional[str], words_to_remove: Optional[List[str]] = None
     ) -> Optional[str]:
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import copy
 import random
 import ssl
+import threading
 import time
-from typing import Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures import wait
+from contextlib import nullcontext
+from typing import ContextManager, Optional
 
 import certifi
 import cloudscraper
@@ -12,31 +18,107 @@ import urllib3
 from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 
-from domain.ports import LoggerPort
+from domain.ports import LoggerPort, MetricsCollectorPort
 from infrastructure.config import Config
+from infrastructure.helpers.concurrency_controller import HostConcurrencyController
+from infrastructure.helpers.connectivity import ConnectivityMonitor
+from infrastructure.helpers.hedging import RequestHedger
+from infrastructure.helpers.rate_limiter import RateLimiter
+from infrastructure.helpers.response_cache import CachedResponse, ResponseCache
+from infrastructure.helpers.retry_policy import RetryPolicy
+from infrastructure.helpers.single_flight import SingleFlight
+from infrastructure.helpers.spare_sessions import SpareSessions
 from infrastructure.helpers.time_utils import TimeUtils
+from infrastructure.helpers.transfer import accept_encoding, endpoint_of, wire_size
 from infrastructure.utils.id_generator import IdGenerator
 
 
 class FetchUtils:
-    """Utility class for HTTP operations with retry and randomized headers."""
-
-    def __init__(self, config: Config, logger: LoggerPort) -> None:
+    """Utility class for HTTP operations with retry and randomized headers.
+
+    Every worker thread gets its own keep-alive session from
+    :meth:`session`, so threads never overwrite each other's session and
+    each keeps its TCP+TLS connections warm across all of its tasks.
+    A blocked thread swaps in one of the ``scraping.spare_sessions``
+    sessions built in the background instead of waiting for a new one.
+    With a :class:`RequestHedger`, a request slower than its endpoint's
+    p95 is duplicated on a separate session and the first answer wins.
+    Threads asking for a URL already being downloaded wait for that
+    download instead of starting their own.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: LoggerPort,
+        controller: Optional[HostConcurrencyController] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_size: Optional[int] = None,
+        connectivity: Optional[ConnectivityMonitor] = None,
+        cache: Optional[ResponseCache] = None,
+        metrics_collector: Optional[MetricsCollectorPort] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedger: Optional[RequestHedger] = None,
+        flights: Optional[SingleFlight] = None,
+    ) -> None:
         self.config = config
         self.logger = logger
+        # Connections kept per session adapter, matched to the worker count
+        self.pool_size = pool_size or config.global_settings.max_workers or 1
+        # Per-thread keep-alive sessions
+        self._local = threading.local()
+        # Shared AIMD limiter; every request waits for a slot on its host
+        self.controller = controller
+        # Shared token buckets spacing requests at each host's rate
+        self.rate_limiter = rate_limiter
+        # Cached network verdict; real responses keep it fresh
+        self.connectivity = connectivity or ConnectivityMonitor(config)
+        # On-disk cache of pages that do not change between runs
+        self.cache = cache
+        # Wire and decoded bytes of every response, per endpoint
+        self.metrics_collector = metrics_collector
+        # Backoff, attempt cap and retry budget shared by the whole run
+        self.retry_policy = retry_policy or RetryPolicy(config)
+        # Duplicates requests stuck past their endpoint's p95 latency
+        self.hedger = hedger
+        # Coalesces concurrent downloads of the same URL
+        self.flights = flights or SingleFlight()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
         self.time_util = TimeUtils(self.config)
 
         self.id_generator = IdGenerator(config=config)
 
+        # Sessions built ahead of time so rotation after a block is instant
+        self.spares = SpareSessions(
+            self.create_scraper,
+            config.scraping.spare_sessions,
+            logger=logger,
+            warm_url=config.scraping.spare_warm_url or None,
+            timeout=config.scraping.timeout or 5,
+        )
+        # Hedges get their own sessions so they never drain the spares
+        self.hedge_sessions = SpareSessions(
+            self.create_scraper,
+            config.scraping.hedge_sessions,
+            logger=logger,
+        )
+
         # self.logger.log(f"Load Class {self.__class__.__name__}", level="info")
 
     def header_random(self) -> dict:
-        """Generate random HTTP headers based on scraping config."""
+        """Generate random HTTP headers based on scraping config.
+
+        Compression is always negotiated through ``Accept-Encoding``.
+        """
         try:
             return {
                 "User-Agent": random.choice(self.config.scraping.user_agents),
                 "Referer": random.choice(self.config.scraping.referers),
                 "Accept-Language": random.choice(self.config.scraping.languages),
+                "Accept-Encoding": accept_encoding(
+                    self.config.scraping.accept_encoding
+                ),
             }
         except Exception:
             # self.logger.log(f"Header generation failed: {e}", level="warning")
@@ -45,6 +127,7 @@ class FetchUtils:
                 "(KHTML, like Gecko) Chrome/114.0.5735.199 Safari/537.36",
                 "Referer": "https://www.google.com/",
                 "Accept-Language": "en-US,en;q=0.9",
+                "Accept-Encoding": accept_encoding(),
             }
 
     def create_scraper_old(self, insecure: bool = False) -> requests.Session:
@@ -82,6 +165,57 @@ class FetchUtils:
 
         return session
 
+    def session(self, insecure: bool = False) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.create_scraper(insecure=insecure)
+            self._local.session = session
+            # Build the spares while the first requests run
+            self.spares.start()
+        return session
+
+    def replacement_session(self, insecure: bool = False) -> requests.Session:
+        """Return a fresh session, taken from the spares when possible.
+
+        Spares are built with verification on, so ``insecure`` sessions are
+        always built inline.
+        """
+        if insecure:
+            return self.create_scraper(insecure=True)
+        return self.spares.take()
+
+    def rotate_session(self, insecure: bool = False) -> requests.Session:
+        """Replace the calling thread's session, e.g. after a block."""
+        old = getattr(self._local, "session", None)
+        self._local.session = self.replacement_session(insecure=insecure)
+        if old is not None:
+            old.close()
+        return self._local.session
+
+    def close(self) -> None:
+        """Close the spare and hedge sessions and stop refilling them."""
+        self.spares.close()
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.hedge_sessions.close()
+
+    def _size_adapters(self, session: requests.Session) -> None:
+        """Resize every mounted adapter to ``pool_size`` connections.
+
+        The adapters are resized in place so cloudscraper keeps its own
+        cipher-suite adapter for HTTPS.
+        """
+        for adapter in session.adapters.values():
+            if isinstance(adapter, HTTPAdapter):
+                adapter._pool_connections = self.pool_size
+                adapter._pool_maxsize = self.pool_size
+                adapter.init_poolmanager(
+                    self.pool_size, self.pool_size, block=adapter._pool_block
+                )
+
     def create_scraper(self, insecure: bool = False) -> requests.Session:
         """Return a configured cloudscraper session.
 
@@ -120,27 +254,147 @@ class FetchUtils:
             scraper.trust_env = False
             scraper.verify = certifi.where()
 
+        # Keep as many warm connections as there are workers
+        self._size_adapters(scraper)
+
         return scraper
 
-    def test_internet(
-        self, url: Optional[str] = None, timeout: Optional[int] = None
-    ) -> bool:
-        """Checks if internet connection is active via HTTP GET request."""
-        url = url or self.config.scraping.test_internet or "https://www.google.com"
-        timeout = timeout or self.config.scraping.timeout or 5
+    def test_internet(self) -> bool:
+        """Block until the shared connectivity monitor reports the network up.
 
-        while True:
-            try:
-                response = requests.get(url, timeout=timeout)
-                if response.status_code == 200 or response.status_code == 204:
-                    return True
-            except Exception:
-                # não faz nada, apenas dorme e tenta de novo
-                url = "https://www.google.com"
-                pass
+        A verdict younger than ``scraping.connectivity_ttl`` is reused, and
+        concurrent callers share a single probe.
+        """
+        return self.connectivity.wait_online()
+
+    def _timed_get(
+        self, scraper: requests.Session, target: str, url: str, timeout: float
+    ) -> requests.Response:
+        """Send one GET and feed its latency to the hedger."""
+        started = time.perf_counter()
+        response = scraper.get(target, timeout=timeout)
+        if self.hedger is not None and response.status_code == 200:
+            self.hedger.observe(url, time.perf_counter() - started)
+        return response
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size * 2, thread_name_prefix="hedge"
+                )
+            return self._hedge_executor
+
+    def _get(
+        self, scraper: requests.Session, target: str, url: str, timeout: float
+    ) -> tuple[requests.Response, requests.Session]:
+        """Send the request, hedging it when it outlives the endpoint's p95.
 
-            # aguarda um intervalo antes da próxima tentativa
-            self.time_util.sleep_dynamic()
+        The original runs on ``scraper``; a hedge runs on an idle session of
+        :attr:`hedge_sessions`, and only while :attr:`hedger` allows more
+        hedges and :attr:`controller` has a free slot for the host. The
+        first 200 answer is returned. ``requests`` cannot abort a request
+        in flight, so when the hedge wins the original finishes in the
+        background on ``scraper``, which is then closed; the caller carries
+        on with the hedge's session instead.
+
+        Returns:
+            tuple: The response and the session to use from now on.
+        """
+        delay = self.hedger.delay(url) if self.hedger is not None else None
+        if delay is None:
+            return self._timed_get(scraper, target, url, timeout), scraper
+
+        # Get the hedge sessions ready while the original runs
+        self.hedge_sessions.start()
+        executor = self._executor()
+        primary = executor.submit(self._timed_get, scraper, target, url, timeout)
+        try:
+            return primary.result(timeout=delay), scraper
+        except FutureTimeout:
+            pass
+
+        # A hedge is optional: skip it rather than wait for a session or
+        # for the host to allow one more request
+        session = self.hedge_sessions.take_ready()
+        slot = self.controller.try_slot(url) if self.controller is not None else None
+        host_busy = self.controller is not None and slot is None
+        if session is None or host_busy or not self.hedger.try_hedge():
+            if session is not None:
+                self.hedge_sessions.give_back(session)
+            if slot is not None:
+                slot.close()
+            return primary.result(), scraper
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        hedge = executor.submit(self._timed_get, session, target, url, timeout)
+
+        def settle(future: Future) -> None:
+            if slot is None:
+                return
+            if future.exception() is None and future.result().status_code == 200:
+                slot.success()
+            else:
+                slot.close()
+
+        hedge.add_done_callback(settle)
+
+        pending = {primary, hedge}
+        first: Optional[Future] = None
+        winner: Optional[Future] = None
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                first = first or future
+                if future.exception() is None and future.result().status_code == 200:
+                    winner = future
+                    break
+        if winner is None:
+            # Neither got a 200: report the earliest outcome
+            hedge.add_done_callback(lambda _: self.hedge_sessions.give_back(session))
+            return first.result(), scraper
+        if winner is hedge:
+            self.hedger.record_win()
+            if not primary.done():
+                # One session per thread: the loser still holds ``scraper``
+                primary.add_done_callback(lambda _: scraper.close())
+                return hedge.result(), session
+        hedge.add_done_callback(lambda _: self.hedge_sessions.give_back(session))
+        return winner.result(), scraper
+
+    def _slot(self, url: str) -> ContextManager:
+        """Return a host slot from the controller, or a no-op context."""
+        if self.controller is None:
+            return nullcontext()
+        return self.controller.slot(url)
+
+    def report_block(self, url: str) -> None:
+        """Tell the controller that ``url``'s host served a block page."""
+        self.forget(url)
+        if self.controller is not None:
+            self.controller.record_block(url)
+
+    def forget(self, url: str) -> None:
+        """Drop ``url`` from the response cache, e.g. an invalid page."""
+        if self.cache is not None:
+            self.cache.delete(url)
+
+    def record_transfer(self, url: str, wire: int, decoded: int) -> None:
+        """Report a response body's wire and decoded sizes for ``url``."""
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_transfer(endpoint_of(url), wire, decoded)
+
+    @staticmethod
+    def _cached_response(cached: CachedResponse) -> requests.Response:
+        """Wrap a cache entry in a ``requests.Response``."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = cached.url
+        response.encoding = cached.encoding
+        response._content = cached.content
+        response.from_cache = True
+        return response
 
     def fetch_with_retry(
         self,
@@ -151,26 +405,90 @@ class FetchUtils:
         insecure: bool = False,
         worker_id: Optional[str] = None,
     ) -> tuple[requests.Response, requests.Session]:
-        """Fetch a URL, recreating the scraper when blocked."""
+        """Fetch a URL, recreating the scraper when blocked.
 
-        timeout = timeout or self.config.scraping.timeout or 5
-        scraper = scraper or self.create_scraper(insecure=insecure)
+        Pass ``scraper=None`` to use the calling thread's session; a
+        replacement after a block then becomes that thread's session too.
+        URLs covered by a cache policy are served from :attr:`cache` when
+        present, and stored there after a successful download;
+        ``cache_bypass=True`` skips the lookup and always downloads.
+
+        Raises:
+            RetryExhaustedError: :attr:`retry_policy` gave up on the URL.
+        """
 
+        timeout = timeout or self.config.scraping.timeout or 5
+        thread_session = scraper is None or scraper is getattr(
+            self._local, "session", None
+        )
+        scraper = scraper or self.session(insecure=insecure)
+
+        # A bypassing caller needs a fresh page, e.g. for its session Hash
+        if self.cache is not None and not cache_bypass:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return self._cached_response(cached), scraper
+
+        def download() -> tuple[requests.Response, requests.Session]:
+            return self._download(
+                scraper, url, cache_bypass, timeout, insecure, worker_id, thread_session
+            )
+
+        # A bypassing caller wants its own fresh page, not a shared one
+        if cache_bypass:
+            return download()
+        # Concurrent callers of the same URL share the first one's download
+        (response, fetched_with), leader = self.flights.do((url, insecure), download)
+        if leader:
+            return response, fetched_with
+        # Only the leader's bytes count as downloaded
+        response = copy.copy(response)
+        response.shared = True
+        return response, scraper
+
+    def _download(
+        self,
+        scraper: requests.Session,
+        url: str,
+        cache_bypass: bool,
+        timeout: int,
+        insecure: bool,
+        worker_id: Optional[str],
+        thread_session: bool,
+    ) -> tuple[requests.Response, requests.Session]:
+        """Download ``url`` with retries for :meth:`fetch_with_retry`."""
         block_start = None
-        attempt = 0
+        retry = self.retry_policy.start()
 
         while True:
             try:
+                target = url
                 if cache_bypass:
                     # random parameter for no-cache, encoding is just for fun
                     param_name = self.id_generator.create_id(random.randint(1, 4))
                     digest = self.id_generator.create_id(random.randint(4, 12))
                     no_cache = f"{param_name}={digest}"
-                    url = f"{url}&{no_cache}"
-
-                # Perform the request with the current session
-                timeout_wait = timeout + attempt
-                response = scraper.get(url, timeout=timeout_wait)
+                    target = f"{url}&{no_cache}"
+
+                # Perform the request with the current session, holding a
+                # slot on the host while the adaptive limiter is enabled
+                timeout_wait = timeout + retry.attempt - 1
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(url)
+                with self._slot(url) as slot:
+                    response, session = self._get(scraper, target, url, timeout_wait)
+                    if session is not scraper:
+                        scraper = session
+                        if thread_session:
+                            self._local.session = session
+                    # Any answer proves the network is up
+                    self.connectivity.mark_online()
+                    self.record_transfer(url, *wire_size(response))
+                    if slot is not None:
+                        if response.status_code == 200:
+                            slot.success()
+                        else:
+                            slot.blocked()
                 if response.status_code == 200:
                     # On success, log the total block time if any
                     if block_start:
@@ -180,27 +498,38 @@ class FetchUtils:
                         #     level="warning",
                         #     worker_id=worker_id,
                         # )
+                    if self.cache is not None:
+                        self.cache.put(
+                            url,
+                            response.content,
+                            response.encoding or response.apparent_encoding,
+                        )
                     return response, scraper
             except (requests.Timeout, requests.ConnectionError):
-                if not self.test_internet():
-                    continue
+                # Probes only if no request succeeded within the TTL
+                self.test_internet()
 
             except Exception:  # noqa: BLE001
                 # Ignore network errors and retry with a new scraper
                 pass
                 self.logger.log(
-                    f"Attempt {attempt + 1} {url}", level="warning", worker_id=worker_id
+                    f"Attempt {retry.attempt} {url}",
+                    level="warning",
+                    worker_id=worker_id,
                 )
 
             # Record the start of blocking period on first failure
             if block_start is None:
                 block_start = time.perf_counter()
 
-            attempt += 1
-            # Wait using dynamic sleep to avoid aggressive retries
-            self.time_util.sleep_dynamic(multiplier=attempt)
+            # Jittered backoff; raises once the attempts or budget run out
+            retry.sleep()
 
             # Recreate the scraper session in case we were blocked
-            scraper = self.create_scraper(insecure=insecure)
+            scraper = (
+                self.rotate_session(insecure=insecure)
+                if thread_session
+                else self.replacement_session(insecure=insecure)
+            )
 
             # self.logger.log("Recreating scraper due to block", level="info")
@@ -0,0 +1,97 @@
+"""Per-endpoint latency tracking and a capped budget for hedged requests."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from infrastructure.config import Config
+from infrastructure.helpers.transfer import endpoint_of
+
+
+class RequestHedger:
+    """Decide when a slow request deserves a duplicate on another session.
+
+    Latencies of successful responses are kept per endpoint (host and
+    path) in a window of the last ``window`` samples. Once an endpoint has
+    ``min_samples``, :meth:`delay` returns its ``quantile`` latency: a
+    request still unanswered by then is hedged. :meth:`try_hedge` keeps
+    hedges under ``ratio`` of the requests started plus a small ``burst``,
+    so the extra load on the site stays bounded.
+
+    Thread-safe; one hedger is shared by every fetch helper of a run.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        ratio: Optional[float] = None,
+        quantile: Optional[float] = None,
+        window: Optional[int] = None,
+        min_samples: Optional[int] = None,
+        burst: int = 2,
+    ) -> None:
+        """Read the hedging settings from ``config.scraping``.
+
+        Args:
+            config: Application configuration.
+            ratio: Hedges allowed per request started.
+            quantile: Latency quantile after which a request is hedged.
+            window: Latency samples kept per endpoint.
+            min_samples: Samples needed before an endpoint is hedged.
+            burst: Hedges allowed on top of ``ratio``.
+        """
+        scraping = config.scraping
+        self.ratio = scraping.hedge_ratio if ratio is None else ratio
+        self.quantile = scraping.hedge_quantile if quantile is None else quantile
+        self.window = scraping.hedge_window if window is None else window
+        self.min_samples = (
+            scraping.hedge_min_samples if min_samples is None else min_samples
+        )
+        self.burst = burst
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, url: str, latency: float) -> None:
+        """Record the latency of a successful response from ``url``."""
+        endpoint = endpoint_of(url)
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None:
+                samples = self._latencies[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def delay(self, url: str) -> Optional[float]:
+        """Count a request to ``url`` and return when to hedge it.
+
+        Returns:
+            Optional[float]: Seconds after which a duplicate should go out,
+            or ``None`` while the endpoint has too few samples.
+        """
+        endpoint = endpoint_of(url)
+        with self._lock:
+            self.requests += 1
+            samples = self._latencies.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(int(self.quantile * len(ordered)), len(ordered) - 1)
+        return ordered[index]
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the budget; ``False`` once the cap is reached."""
+        with self._lock:
+            if self.hedges >= self.ratio * self.requests + self.burst:
+                return False
+            self.hedges += 1
+            return True
+
+    def record_win(self) -> None:
+        """Count a hedge that answered before the original request."""
+        with self._lock:
+            self.hedge_wins += 1
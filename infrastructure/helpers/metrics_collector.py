@@ -1,3 +1,6 @@
+import threading
+from typing import Dict, List, Tuple
+
 from domain.dto import MetricsDTO
 from domain.ports import MetricsCollectorPort
 
@@ -10,6 +13,15 @@ class MetricsCollector(MetricsCollectorPort):
 
         self._network_bytes = 0
         self._processing_bytes = 0
+        self._write_queue_peak = 0
+        self._commits = 0
+        self._commit_time = 0.0
+        self._commit_latency_max = 0.0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Endpoint -> [wire bytes, decoded bytes]
+        self._transfers: Dict[str, List[int]] = {}
+        self._transfers_lock = threading.Lock()
 
     def record_network_bytes(self, n: int) -> None:
         """Accumulate ``n`` bytes transferred over the network."""
@@ -21,6 +33,37 @@ class MetricsCollector(MetricsCollectorPort):
 
         self._processing_bytes += n
 
+    def record_write_queue_depth(self, depth: int) -> None:
+        """Keep the deepest persistence queue seen."""
+
+        self._write_queue_peak = max(self._write_queue_peak, depth)
+
+    def record_commit(self, latency: float) -> None:
+        """Accumulate one repository commit taking ``latency`` seconds."""
+
+        self._commits += 1
+        self._commit_time += latency
+        self._commit_latency_max = max(self._commit_latency_max, latency)
+
+    def record_cache_hit(self) -> None:
+        """Count one response served from the response cache."""
+
+        self._cache_hits += 1
+
+    def record_cache_miss(self) -> None:
+        """Count one cacheable response that had to be downloaded."""
+
+        self._cache_misses += 1
+
+    def record_transfer(self, endpoint: str, wire: int, decoded: int) -> None:
+        """Accumulate one response body per endpoint, before and after
+        decompression."""
+
+        with self._transfers_lock:
+            totals = self._transfers.setdefault(endpoint, [0, 0])
+            totals[0] += wire
+            totals[1] += decoded
+
     @property
     def network_bytes(self) -> int:
         """Return the total network bytes."""
@@ -33,6 +76,20 @@ class MetricsCollector(MetricsCollectorPort):
 
         return self._processing_bytes
 
+    @property
+    def wire_bytes(self) -> int:
+        """Return the response bytes transferred, compressed or not."""
+
+        with self._transfers_lock:
+            return sum(wire for wire, _ in self._transfers.values())
+
+    @property
+    def decoded_bytes(self) -> int:
+        """Return the response bytes after decompression."""
+
+        with self._transfers_lock:
+            return sum(decoded for _, decoded in self._transfers.values())
+
     def get_metrics(self, elapsed_time: float) -> MetricsDTO:
         """Create a :class:`MetricsDTO` instance from the collected values."""
 
@@ -40,4 +97,22 @@ class MetricsCollector(MetricsCollectorPort):
             elapsed_time=elapsed_time,
             network_bytes=self._network_bytes,
             processing_bytes=self._processing_bytes,
+            write_queue_peak=self._write_queue_peak,
+            commits=self._commits,
+            commit_time=self._commit_time,
+            commit_latency_max=self._commit_latency_max,
+            cache_hits=self._cache_hits,
+            cache_misses=self._cache_misses,
+            wire_bytes=self.wire_bytes,
+            decoded_bytes=self.decoded_bytes,
+            endpoint_bytes=self.endpoint_bytes(),
         )
+
+    def endpoint_bytes(self) -> Dict[str, Tuple[int, int]]:
+        """Return ``(wire, decoded)`` byte totals per endpoint."""
+
+        with self._transfers_lock:
+            return {
+                endpoint: (wire, decoded)
+                for endpoint, (wire, decoded) in self._transfers.items()
+            }
@@ -0,0 +1,170 @@
+"""Single background thread that owns repository writes."""
+
+from __future__ import annotations
+
+import threading
+import time
+from queue import Empty, Queue
+from typing import Any, Callable, List, Optional, Tuple
+
+from domain.ports import LoggerPort, MetricsCollectorPort
+from infrastructure.config import Config
+
+SaveCallback = Callable[[List[Any]], None]
+
+# How often the writer wakes up to check whether it was closed
+_POLL_INTERVAL = 0.1
+
+
+class PersistenceWriter:
+    """Run every ``save_all`` on one thread fed by a bounded queue.
+
+    Worker pools call ``on_result`` under their shared lock, so a
+    :class:`SaveStrategy` that committed inline stalled every fetch worker
+    for the duration of the SQLite commit. Strategies built with a writer
+    only hand their buffer over with :meth:`submit` and return at once.
+
+    The writer merges consecutive queued batches that target the same
+    callback (up to ``batch_size`` items), so several strategies flushing
+    small buffers share one commit. ``queue_size`` bounds the batches
+    waiting; producers only block when the database falls that far behind,
+    which keeps memory flat during a full backfill.
+
+    Queue depth and commit latency are reported to ``metrics_collector``.
+    A failed commit is logged and re-raised by the next :meth:`flush`.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: LoggerPort,
+        metrics_collector: Optional[MetricsCollectorPort] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """Start the writer thread.
+
+        Args:
+            config: Application configuration.
+            logger: Logger for commit failures.
+            metrics_collector: Optional collector for queue depth and commit
+                latency.
+            queue_size: Maximum batches waiting, defaulting to
+                ``global_settings.writer_queue_size``.
+            batch_size: Maximum items merged into one commit, defaulting to
+                ``global_settings.batch_size``.
+        """
+        self.config = config
+        self.logger = logger
+        self.metrics_collector = metrics_collector
+        self.queue_size = max(
+            queue_size or config.global_settings.writer_queue_size or 1, 1
+        )
+        self.batch_size = batch_size or config.global_settings.batch_size or 100
+
+        self._queue: Queue[Tuple[SaveCallback, List[Any]]] = Queue(self.queue_size)
+        self._carry: Optional[Tuple[SaveCallback, List[Any]]] = None
+        self._errors: List[Exception] = []
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._consume, name="persistence-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def depth(self) -> int:
+        """Return the number of batches waiting to be written."""
+        return self._queue.qsize()
+
+    def submit(self, save_callback: SaveCallback, items: List[Any]) -> None:
+        """Queue ``items`` to be written by ``save_callback``.
+
+        Args:
+            save_callback: Repository method such as ``save_all``.
+            items: Batch to persist; the list is copied, so the caller may
+                reuse its buffer.
+
+        Raises:
+            RuntimeError: If the writer was closed.
+        """
+        if self._closed.is_set():
+            raise RuntimeError("PersistenceWriter is closed")
+        if not items:
+            return
+        self._queue.put((save_callback, list(items)))
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_write_queue_depth(self._queue.qsize())
+
+    def flush(self) -> None:
+        """Block until every submitted batch is committed.
+
+        Raises:
+            Exception: The first commit error since the previous flush.
+        """
+        self._queue.join()
+        if self._errors:
+            error = self._errors[0]
+            self._errors.clear()
+            raise error
+
+    def close(self) -> None:
+        """Write what is queued and stop the thread."""
+        if self._closed.is_set():
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed.set()
+            self._thread.join()
+
+    def __enter__(self) -> "PersistenceWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _next(self) -> Optional[Tuple[SaveCallback, List[Any]]]:
+        """Return the next queued batch, or ``None`` after a quiet poll."""
+        if self._carry is not None:
+            batch, self._carry = self._carry, None
+            return batch
+        try:
+            return self._queue.get(timeout=_POLL_INTERVAL)
+        except Empty:
+            return None
+
+    def _consume(self) -> None:
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._next()
+            if batch is None:
+                continue
+            save_callback, items = batch
+            taken = 1
+
+            # Merge whatever else is waiting for the same callback
+            while len(items) < self.batch_size:
+                try:
+                    following = self._queue.get_nowait()
+                except Empty:
+                    break
+                if following[0] != save_callback:
+                    # Keep it for the next commit; task_done when written
+                    self._carry = following
+                    break
+                items.extend(following[1])
+                taken += 1
+
+            self._write(save_callback, items)
+            for _ in range(taken):
+                self._queue.task_done()
+
+    def _write(self, save_callback: SaveCallback, items: List[Any]) -> None:
+        start = time.perf_counter()
+        try:
+            save_callback(items)
+        except Exception as exc:  # noqa: BLE001
+            self.logger.log(f"Persistence writer error: {exc}", level="warning")
+            self._errors.append(exc)
+        finally:
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_commit(time.perf_counter() - start)
@@ -0,0 +1,282 @@
+"""Stages connected by bounded queues, each with its own concurrency."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from queue import Queue
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from domain.dto import ExecutionResultDTO, FailedTaskDTO, WorkerTaskDTO
+from domain.ports import LoggerPort, MetricsCollectorPort
+from infrastructure.config import Config
+from infrastructure.helpers.process_worker_pool import ProcessWorkerPool
+from infrastructure.helpers.task_scheduler import StopFlag, TaskScheduler
+
+T = WorkerTaskDTO
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of a :class:`Pipeline`.
+
+    Attributes:
+        name: Label used in worker ids, dead letters and :meth:`Pipeline.stats`.
+        processor: Called with a ``WorkerTaskDTO`` whose ``data`` is the
+            previous stage's output. Returning ``None`` drops the item.
+        workers: Threads running ``processor`` concurrently.
+        pool: Optional process pool. Each stage thread then hands its task
+            to ``pool`` and waits, so ``processor`` must be picklable and
+            ``workers`` bounds the parses in flight.
+    """
+
+    name: str
+    processor: Callable[[T], Any]
+    workers: int = 1
+    pool: Optional[ProcessWorkerPool] = None
+
+
+@dataclass
+class StageStats:
+    """Counters of one stage, updated by its threads."""
+
+    processed: int = 0
+    failed: int = 0
+    busy_time: float = 0.0
+    queue_peak: int = 0
+
+
+class Pipeline:
+    """Run items through ``stages`` with every stage working at once.
+
+    Each stage reads from its own queue bounded by ``queue_size`` and writes
+    into the next one. A stage that falls behind fills its queue, which
+    blocks the stage before it, down to the feeder: the slowest stage sets
+    the pace and memory stays flat. The statement sync uses threads to
+    fetch and parse pages and one thread to write SQLite, so pages are
+    downloaded while earlier ones are saved.
+
+    A processor or ``on_result`` error sends the item to ``dead_letters``
+    (``worker_id`` is the stage name) and the stage moves on. :meth:`stop`,
+    or a set ``shutdown`` flag, stops feeding new items; what is already
+    inside the pipeline drains normally.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        stages: Sequence[Stage],
+        logger: LoggerPort,
+        metrics_collector: MetricsCollectorPort,
+        queue_size: Optional[int] = None,
+        shutdown: Optional[StopFlag] = None,
+    ) -> None:
+        """Store the stages and the queue bound.
+
+        Args:
+            config: Application configuration.
+            stages: Steps in execution order; at least one.
+            logger: Logger for processor errors.
+            metrics_collector: Collector packaged into the execution result.
+            queue_size: Items waiting in front of each stage, defaulting to
+                ``global_settings.queue_size``.
+            shutdown: Optional ``ShutdownSignal`` that stops feeding.
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.config = config
+        self.stages = list(stages)
+        self.logger = logger
+        self.metrics_collector = metrics_collector
+        self.queue_size = max(queue_size or config.global_settings.queue_size or 1, 1)
+        self.shutdown = shutdown
+        self._stats: Dict[str, StageStats] = {}
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+
+    def stop(self) -> None:
+        """Stop feeding new items; in-flight items still finish."""
+        self._stopped.set()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return processed and failed counts, busy seconds and queue peak
+        per stage."""
+        with self._lock:
+            return {
+                name: {
+                    "processed": stats.processed,
+                    "failed": stats.failed,
+                    "busy_time": stats.busy_time,
+                    "queue_peak": stats.queue_peak,
+                }
+                for name, stats in self._stats.items()
+            }
+
+    def run(
+        self,
+        items: Iterable[Tuple[int, Any]],
+        on_result: Optional[Callable[[Any], None]] = None,
+        keep_results: bool = True,
+        time_budget: Optional[float] = None,
+    ) -> ExecutionResultDTO:
+        """Push ``(index, data)`` pairs through every stage.
+
+        Args:
+            items: Lazy iterable consumed as the first queue frees up.
+            on_result: Called with each output of the last stage, on the
+                last stage's threads.
+            keep_results: Return the last stage's outputs in ``items``.
+            time_budget: Seconds after which feeding stops, defaulting to
+                ``global_settings.time_budget``.
+
+        Returns:
+            ExecutionResultDTO: Outputs, metrics, dead letters and whether
+            the time budget cut the run short.
+        """
+        self._stopped.clear()
+        scheduler = TaskScheduler(
+            time_budget=(
+                self.config.global_settings.time_budget
+                if time_budget is None
+                else time_budget
+            ),
+            shutdown=self.shutdown,
+        )
+        self._stats = {stage.name: StageStats() for stage in self.stages}
+        queues: List[Queue] = [Queue(self.queue_size) for _ in self.stages]
+        sentinel = object()
+        results: List[Any] = []
+        dead_letters: List[FailedTaskDTO] = []
+        remaining = [stage.workers for stage in self.stages]
+        start_time = time.perf_counter()
+
+        def execute(stage: Stage, task: WorkerTaskDTO) -> Any:
+            if stage.pool is not None:
+                return stage.pool.call(stage.processor, task)
+            return stage.processor(task)
+
+        def emit(position: int, index: int, value: Any) -> None:
+            if position + 1 < len(self.stages):
+                queues[position + 1].put((index, value))
+                self._record_depth(self.stages[position + 1], queues[position + 1])
+                return
+            if callable(on_result):
+                on_result(value)
+            with self._lock:
+                if keep_results:
+                    results.append(value)
+
+        def fail(
+            stage: Stage, index: int, data: Any, exc: Exception, worker_id: str
+        ) -> None:
+            self.logger.log(
+                f"{stage.name} error: {exc}",
+                level="warning",
+                worker_id=worker_id,
+            )
+            with self._lock:
+                self._stats[stage.name].failed += 1
+                dead_letters.append(
+                    FailedTaskDTO(
+                        index=index,
+                        data=data,
+                        error=f"{type(exc).__name__}: {exc}",
+                        attempts=1,
+                        worker_id=stage.name,
+                    )
+                )
+
+        def work(position: int, worker_id: str) -> None:
+            stage = self.stages[position]
+            stats = self._stats[stage.name]
+            inbox = queues[position]
+            try:
+                while True:
+                    item = inbox.get()
+                    if item is sentinel:
+                        break
+                    index, data = item
+                    task = WorkerTaskDTO(index=index, data=data, worker_id=worker_id)
+                    started = time.perf_counter()
+                    try:
+                        value = execute(stage, task)
+                    except Exception as exc:  # noqa: BLE001
+                        fail(stage, index, data, exc, worker_id)
+                        continue
+                    finally:
+                        with self._lock:
+                            stats.busy_time += time.perf_counter() - started
+                    # on_result runs here too; its errors dead-letter the item
+                    try:
+                        if value is not None:
+                            emit(position, index, value)
+                    except Exception as exc:  # noqa: BLE001
+                        fail(stage, index, data, exc, worker_id)
+                        continue
+                    with self._lock:
+                        stats.processed += 1
+            finally:
+                # The last worker of a stage closes the next stage, even if
+                # this one died, so the join below never hangs
+                with self._lock:
+                    remaining[position] -= 1
+                    last = remaining[position] == 0
+                if last and position + 1 < len(self.stages):
+                    for _ in range(self.stages[position + 1].workers):
+                        queues[position + 1].put(sentinel)
+
+        threads = [
+            threading.Thread(
+                target=work,
+                args=(position, f"{stage.name}-{n}"),
+                name=f"pipeline-{stage.name}-{n}",
+                daemon=True,
+            )
+            for position, stage in enumerate(self.stages)
+            for n in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            for index, data in items:
+                if self._stopped.is_set() or scheduler.expired():
+                    break
+                queues[0].put((index, data))
+                self._record_depth(self.stages[0], queues[0])
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(sentinel)
+            for thread in threads:
+                thread.join()
+
+        elapsed = time.perf_counter() - start_time
+
+        deadline_reached = scheduler.deadline_passed()
+        interrupted = scheduler.interrupted() or self._stopped.is_set()
+        if interrupted:
+            self.logger.log(
+                "Pipeline stopped, in-flight items drained", level="warning"
+            )
+        elif deadline_reached:
+            self.logger.log(
+                f"Time budget of {scheduler.time_budget}s reached", level="warning"
+            )
+
+        metrics = self.metrics_collector.get_metrics(elapsed_time=elapsed)
+        metrics = replace(metrics, failures=metrics.failures + len(dead_letters))
+
+        return ExecutionResultDTO(
+            items=results,
+            metrics=metrics,
+            dead_letters=dead_letters,
+            deadline_reached=deadline_reached,
+            interrupted=interrupted,
+        )
+
+    def _record_depth(self, stage: Stage, queue: Queue) -> None:
+        depth = queue.qsize()
+        with self._lock:
+            stats = self._stats[stage.name]
+            stats.queue_peak = max(stats.queue_peak, depth)
@@ -0,0 +1,264 @@
+"""Process-based implementation of the domain ``WorkerPoolPort``."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import replace
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from domain.dto import (
+    ExecutionResultDTO,
+    FailedTaskDTO,
+    WorkerResultDTO,
+    WorkerTaskDTO,
+)
+from domain.ports import LoggerPort, MetricsCollectorPort, WorkerPoolPort
+from infrastructure.config import Config
+from infrastructure.helpers.result_stream import stream_results
+from infrastructure.helpers.task_scheduler import PriorityFn, StopFlag, TaskScheduler
+
+T = WorkerTaskDTO
+R = TypeVar("R")
+
+
+def _ignore_sigint() -> None:
+    """Leave Ctrl+C to the parent, which drains and checkpoints the run."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _execute(processor: Callable[[T], R], task: T) -> WorkerResultDTO:
+    """Run ``processor`` in a child process and wrap its outcome."""
+    worker_id = f"pid{os.getpid()}"
+    try:
+        value = processor(replace(task, worker_id=worker_id))
+    except Exception as exc:  # noqa: BLE001
+        return WorkerResultDTO(
+            index=task.index,
+            value=None,
+            worker_id=worker_id,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    return WorkerResultDTO(index=task.index, value=value, worker_id=worker_id)
+
+
+class ProcessWorkerPool(WorkerPoolPort):
+    """Worker pool that fans CPU-bound processors out across processes.
+
+    BeautifulSoup parsing holds the GIL, so threads stop scaling once pages
+    arrive faster than one core can parse them. Here ``processor`` and every
+    task travel to a ``ProcessPoolExecutor``; both must be picklable, i.e. a
+    module-level function (or ``functools.partial`` of one) and plain data.
+
+    Besides :meth:`run`, fetch threads can offload a single parse with
+    :meth:`call` and keep network I/O on their own threads.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        metrics_collector: MetricsCollectorPort,
+        max_workers: Optional[int] = None,
+        shutdown: Optional[StopFlag] = None,
+    ) -> None:
+        """Initialize the pool with configuration and metrics.
+
+        Args:
+            config: Application configuration.
+            metrics_collector: Collector packaged into the execution result.
+            max_workers: Process count, defaulting to the number of cores.
+            shutdown: Optional ``ShutdownSignal``; once set, runs stop
+                submitting new tasks and let in-flight ones finish.
+        """
+        self.config = config
+        self.metrics_collector = metrics_collector
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shutdown = shutdown
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Return the process pool, starting it on first use."""
+        with self._lock:
+            if self._executor is None:
+                # Workers share the terminal's process group; without this a
+                # Ctrl+C would kill in-flight parses and break the pool
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_ignore_sigint
+                )
+            return self._executor
+
+    def submit(self, func: Callable[..., R], *args: Any) -> Future:
+        """Schedule ``func(*args)`` on a worker process."""
+        return self.executor.submit(func, *args)
+
+    def call(self, func: Callable[..., R], *args: Any) -> R:
+        """Run ``func(*args)`` on a worker process and wait for the result.
+
+        Safe to call from many threads at once; the calling thread only
+        blocks on the result while the parse runs on another core.
+        """
+        return self.submit(func, *args).result()
+
+    async def call_async(self, func: Callable[..., R], *args: Any) -> R:
+        """Await ``func(*args)`` on a worker process without blocking the
+        event loop."""
+        return await asyncio.wrap_future(self.submit(func, *args))
+
+    def run(
+        self,
+        tasks: Iterable[Tuple[int, Any]],
+        processor: Callable[[T], R],
+        logger: LoggerPort,
+        on_result: Optional[Callable[[R], None]] = None,
+        post_callback: Optional[Callable[[List[R]], None]] = None,
+        keep_results: bool = True,
+        priority: Optional[PriorityFn] = None,
+        time_budget: Optional[float] = None,
+        shutdown: Optional[StopFlag] = None,
+    ) -> ExecutionResultDTO[R]:
+        """Process ``tasks`` on worker processes using ``processor``.
+
+        At most ``max_workers + queue_size`` tasks are submitted at a time,
+        so lazy task iterators stay lazy. ``on_result`` runs in the calling
+        process, in completion order. Parsing is deterministic, so failed
+        tasks go straight to ``dead_letters`` without retries. ``priority``
+        sorts the tasks up front and ``time_budget`` stops submissions once
+        spent, as in :meth:`WorkerPool.run`. Once ``shutdown`` (defaulting
+        to the pool's) is set, no new task is submitted, in-flight ones
+        finish and the result reports ``interrupted``.
+        """
+        scheduler = TaskScheduler(
+            priority,
+            (
+                self.config.global_settings.time_budget
+                if time_budget is None
+                else time_budget
+            ),
+            self.shutdown if shutdown is None else shutdown,
+        )
+        if priority is not None:
+            tasks = sorted(tasks, key=lambda item: priority(item[1]))
+        results: List[R] = []
+        dead_letters: List[FailedTaskDTO] = []
+        submitted: Dict[Future, WorkerTaskDTO] = {}
+        pending: Set[Future] = set()
+        limit = self.max_workers + (self.config.global_settings.queue_size or 1)
+        start_time = time.perf_counter()
+
+        def drain() -> None:
+            nonlocal pending
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = submitted.pop(future)
+                envelope: WorkerResultDTO = future.result()
+                if envelope.error is not None:
+                    logger.log(
+                        f"worker error: {envelope.error}",
+                        level="warning",
+                        worker_id=envelope.worker_id,
+                    )
+                    dead_letters.append(
+                        FailedTaskDTO(
+                            index=task.index,
+                            data=task.data,
+                            error=envelope.error,
+                            attempts=1,
+                            worker_id=envelope.worker_id,
+                        )
+                    )
+                    continue
+                if keep_results:
+                    results.append(envelope.value)
+                if callable(on_result):
+                    on_result(envelope.value)
+
+        for index, data in tasks:
+            if scheduler.expired():
+                break
+            task = WorkerTaskDTO(index=index, data=data, worker_id="")
+            future = self.executor.submit(_execute, processor, task)
+            submitted[future] = task
+            pending.add(future)
+            if len(pending) >= limit:
+                drain()
+
+        while pending:
+            drain()
+
+        elapsed = time.perf_counter() - start_time
+
+        deadline_reached = scheduler.deadline_passed()
+        interrupted = scheduler.interrupted()
+        if deadline_reached or interrupted:
+            reason = (
+                "Shutdown requested"
+                if interrupted
+                else f"Time budget of {scheduler.time_budget}s reached"
+            )
+            logger.log(f"{reason}, remaining tasks not submitted", level="warning")
+
+        # Package execution metrics (network and processing bytes)
+        metrics = self.metrics_collector.get_metrics(elapsed_time=elapsed)
+        metrics = replace(metrics, failures=metrics.failures + len(dead_letters))
+
+        # Final callback after all tasks are done
+        if callable(post_callback):
+            post_callback(results)
+
+        return ExecutionResultDTO(
+            items=results,
+            metrics=metrics,
+            dead_letters=dead_letters,
+            deadline_reached=deadline_reached,
+            interrupted=interrupted,
+        )
+
+    def stream(
+        self,
+        tasks: Iterable[Tuple[int, Any]],
+        processor: Callable[[T], R],
+        logger: LoggerPort,
+        on_result: Optional[Callable[[R], None]] = None,
+        shutdown: Optional[StopFlag] = None,
+    ) -> Iterator[R]:
+        """Yield results as worker processes complete them; ``shutdown``
+        stops submissions as in :meth:`run`."""
+        return stream_results(
+            partial(self.run, shutdown=shutdown),
+            tasks,
+            processor,
+            logger,
+            on_result=on_result,
+            queue_size=self.config.global_settings.queue_size,
+        )
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> "ProcessWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,114 @@
+"""Token-bucket request rate limits shared by every worker."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+from infrastructure.config import Config
+
+
+class TokenBucket:
+    """Token bucket that hands out evenly spaced reservations.
+
+    Tokens refill at ``rate`` per second up to ``burst``. Taking a token
+    when none is left reserves a future one: the balance goes negative and
+    the caller is told how long to wait. Concurrent callers therefore leave
+    at ``1 / rate`` intervals instead of all retrying at once.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        self.rate = float(rate)
+        self.burst = max(float(burst), 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Per-host request rates read from ``config.scraping``.
+
+    ``rate_limits`` maps a host to the requests per second it tolerates;
+    other hosts use ``rate_limit_default`` (``0`` means unlimited). Each
+    host gets one :class:`TokenBucket` holding up to ``rate_burst`` tokens.
+    The limiter is thread-safe, and :meth:`acquire_async` waits without
+    blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        rates: Optional[Mapping[str, float]] = None,
+        default_rate: Optional[float] = None,
+        burst: Optional[float] = None,
+    ) -> None:
+        """Read rates from ``config.scraping`` unless given explicitly."""
+        scraping = config.scraping
+        self.rates: Dict[str, float] = dict(
+            scraping.rate_limits if rates is None else rates
+        )
+        self.default_rate = (
+            scraping.rate_limit_default if default_rate is None else default_rate
+        )
+        self.burst = scraping.rate_burst if burst is None else burst
+
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the host part of ``url`` used as the bucket key."""
+        return urlsplit(url).hostname or url
+
+    def _bucket(self, url: str) -> Optional[TokenBucket]:
+        host = self.host_of(url)
+        with self._lock:
+            if host not in self._buckets:
+                rate = self.rates.get(host, self.default_rate)
+                self._buckets[host] = (
+                    TokenBucket(rate, self.burst) if rate and rate > 0 else None
+                )
+            return self._buckets[host]
+
+    def reserve(self, url: str) -> float:
+        """Reserve a request to ``url`` and return the seconds to wait."""
+        bucket = self._bucket(url)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to ``url`` may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Event-loop counterpart of :meth:`acquire`."""
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def rate(self, url: str) -> float:
+        """Return the configured requests per second for ``url`` (``0`` if
+        unlimited)."""
+        bucket = self._bucket(url)
+        return bucket.rate if bucket is not None else 0.0
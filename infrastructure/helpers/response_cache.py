@@ -0,0 +1,272 @@
+"""Compressed on-disk cache of HTTP responses with per-endpoint TTLs."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from domain.ports import MetricsCollectorPort
+from infrastructure.config import Config
+
+# Sentinel TTL of a policy whose pages never change
+FOREVER: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Body and charset of a response served from the cache."""
+
+    url: str
+    content: bytes
+    encoding: Optional[str]
+    stored_at: float
+
+
+class ResponseCache:
+    """Content-addressed response cache stored under ``paths.cache_dir``.
+
+    Bodies are zlib-compressed into ``blobs/`` under the SHA-256 of their
+    content, so identical pages are stored once. A small SQLite index maps
+    each URL key to its blob, charset and store time.
+
+    Only URLs matching a policy in ``scraping.cache_policies`` are cached.
+    A policy maps a URL fragment (page name or host) to a TTL in seconds,
+    ``None`` meaning the page never changes. Query parameters listed in
+    ``scraping.cache_ignored_params``, such as the per-session ``Hash`` of
+    statement pages, are left out of the key. When the blobs exceed
+    ``max_bytes`` the least recently read entries are evicted.
+
+    Hits and misses are reported to ``metrics_collector``. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        metrics_collector: Optional[MetricsCollectorPort] = None,
+        directory: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        policies: Optional[Mapping[str, Optional[float]]] = None,
+        ignored_params: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Open or create the cache index.
+
+        Args:
+            config: Application configuration.
+            metrics_collector: Optional collector of hit and miss counts.
+            directory: Cache folder, defaulting to ``paths.cache_dir``.
+            max_bytes: Compressed size kept on disk, defaulting to
+                ``scraping.cache_max_bytes``.
+            policies: URL fragment to TTL mapping, defaulting to
+                ``scraping.cache_policies``.
+            ignored_params: Query parameters dropped from the key.
+        """
+        scraping = config.scraping
+        self.directory = Path(directory or config.paths.cache_dir)
+        self.max_bytes = scraping.cache_max_bytes if max_bytes is None else max_bytes
+        self.policies = dict(scraping.cache_policies if policies is None else policies)
+        self.ignored_params = frozenset(
+            scraping.cache_ignored_params if ignored_params is None else ignored_params
+        )
+        self.metrics_collector = metrics_collector
+
+        self.blob_dir = self.directory / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.directory / "index.sqlite"), check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, url TEXT, digest TEXT, encoding TEXT, "
+            "stored_at REAL, accessed_at REAL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER)"
+        )
+        self._db.commit()
+        self._size = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM blobs"
+        ).fetchone()[0]
+
+    @property
+    def size(self) -> int:
+        """Return the compressed bytes currently stored."""
+        return self._size
+
+    def policy(self, url: str) -> Tuple[bool, Optional[float]]:
+        """Return whether ``url`` is cacheable and its TTL."""
+        for fragment, ttl in self.policies.items():
+            if fragment in url:
+                return True, ttl
+        return False, None
+
+    def key(self, url: str) -> str:
+        """Return the cache key of ``url`` without volatile parameters."""
+        parts = urlsplit(url)
+        query = [
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if name not in self.ignored_params
+        ]
+        normalized = urlunsplit(parts._replace(query=urlencode(query), fragment=""))
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for ``url`` if present and fresh."""
+        cacheable, ttl = self.policy(url)
+        if not cacheable:
+            return None
+
+        key = self.key(url)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest, encoding, stored_at FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and ttl is not FOREVER and now - row[2] > ttl:
+                self._delete(key)
+                row = None
+            if row is not None:
+                self._db.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+                self._db.commit()
+
+        content = self._read_blob(row[0]) if row is not None else None
+        if content is None:
+            self._record(hit=False)
+            return None
+        self._record(hit=True)
+        return CachedResponse(
+            url=url, content=content, encoding=row[1], stored_at=row[2]
+        )
+
+    def put(self, url: str, content: bytes, encoding: Optional[str] = None) -> bool:
+        """Store ``content`` for ``url`` when a policy covers it.
+
+        Returns:
+            bool: ``True`` if the response was stored.
+        """
+        if not self.policy(url)[0]:
+            return False
+
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        key = self.key(url)
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT digest FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            known = self._db.execute(
+                "SELECT 1 FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+            if known is None:
+                data = zlib.compress(content)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(data)
+                tmp.replace(path)
+                self._db.execute(
+                    "INSERT INTO blobs (digest, size) VALUES (?, ?)",
+                    (digest, len(data)),
+                )
+                self._size += len(data)
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, url, digest, encoding, now, now),
+            )
+            # Release the old blob only once the entry points elsewhere
+            if previous is not None and previous[0] != digest:
+                self._release_blob(previous[0])
+            if self.max_bytes and self._size > self.max_bytes:
+                self._evict()
+            self._db.commit()
+        return True
+
+    def delete(self, url: str) -> None:
+        """Forget ``url``, e.g. when it turned out to be a block page."""
+        with self._lock:
+            self._delete(self.key(url))
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove every entry and blob."""
+        with self._lock:
+            digests = [row[0] for row in self._db.execute("SELECT digest FROM blobs")]
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM blobs")
+            self._db.commit()
+            self._size = 0
+        for digest in digests:
+            self._blob_path(digest).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._db.close()
+
+    def _record(self, hit: bool) -> None:
+        if self.metrics_collector is None:
+            return
+        if hit:
+            self.metrics_collector.record_cache_hit()
+        else:
+            self.metrics_collector.record_cache_miss()
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.z"
+
+    def _read_blob(self, digest: str) -> Optional[bytes]:
+        try:
+            return zlib.decompress(self._blob_path(digest).read_bytes())
+        except (OSError, zlib.error):
+            return None
+
+    def _delete(self, key: str) -> None:
+        """Remove ``key`` and its blob once nothing else points to it.
+
+        Callers hold ``_lock`` and commit.
+        """
+        row = self._db.execute(
+            "SELECT digest FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return
+        self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._release_blob(row[0])
+
+    def _release_blob(self, digest: str) -> None:
+        shared = self._db.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if shared is not None:
+            return
+        size = self._db.execute(
+            "SELECT size FROM blobs WHERE digest = ?", (digest,)
+        ).fetchone()
+        self._db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        if size is not None:
+            self._size -= size[0]
+        self._blob_path(digest).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Drop least recently read entries down to 90% of ``max_bytes``."""
+        target = self.max_bytes * 0.9
+        oldest = self._db.execute(
+            "SELECT key FROM entries ORDER BY accessed_at"
+        ).fetchall()
+        for (key,) in oldest:
+            if self._size <= target:
+                break
+            self._delete(key)
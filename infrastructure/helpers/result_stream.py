@@ -0,0 +1,113 @@
+"""Adapt a callback-based worker pool run into a bounded result iterator."""
+
+from __future__ import annotations
+
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from domain.dto import ExecutionResultDTO, WorkerTaskDTO
+from domain.ports import LoggerPort
+
+T = WorkerTaskDTO
+R = TypeVar("R")
+
+RunCallable = Callable[..., ExecutionResultDTO]
+
+# How often blocked producers re-check whether the consumer went away
+_POLL_INTERVAL = 0.1
+
+
+def stream_results(
+    run: RunCallable,
+    tasks: Iterable[Tuple[int, Any]],
+    processor: Callable[[T], R],
+    logger: LoggerPort,
+    on_result: Optional[Callable[[R], None]] = None,
+    queue_size: int = 1,
+) -> Iterator[R]:
+    """Yield results of ``run`` as they complete, holding at most
+    ``queue_size`` of them in memory.
+
+    ``run`` executes on a background thread with ``keep_results=False``.
+    When the output queue is full the pool's workers wait, so a slow
+    consumer throttles the producers instead of growing memory. Closing the
+    iterator early stops feeding new tasks; in-flight tasks finish and their
+    results are dropped.
+
+    Args:
+        run: Bound ``WorkerPoolPort.run`` of the pool doing the work.
+        tasks: Lazy iterable of ``(index, data)`` pairs.
+        processor: Function applied to each task.
+        logger: Logger forwarded to ``run``.
+        on_result: Optional callback invoked before a result is yielded.
+        queue_size: Maximum number of completed results waiting for the
+            consumer.
+
+    Yields:
+        Processor results in completion order.
+
+    Raises:
+        Exception: Any error raised by ``run`` itself is re-raised here.
+    """
+    results: Queue = Queue(max(queue_size, 1))
+    closed = threading.Event()
+    done = object()
+    failure: list[BaseException] = []
+
+    def feed() -> Iterator[Tuple[int, Any]]:
+        for task in tasks:
+            if closed.is_set():
+                return
+            yield task
+
+    def publish(result: R) -> None:
+        if callable(on_result):
+            on_result(result)
+        while not closed.is_set():
+            try:
+                results.put(result, timeout=_POLL_INTERVAL)
+                return
+            except Full:
+                continue
+
+    def produce() -> None:
+        try:
+            run(
+                tasks=feed(),
+                processor=processor,
+                logger=logger,
+                on_result=publish,
+                keep_results=False,
+            )
+        except BaseException as exc:  # noqa: BLE001
+            failure.append(exc)
+        finally:
+            while True:
+                try:
+                    results.put(done, timeout=_POLL_INTERVAL)
+                    break
+                except Full:
+                    if closed.is_set():
+                        break
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            try:
+                item = results.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                if not producer.is_alive() and results.empty():
+                    break
+                continue
+            if item is done:
+                break
+            yield item
+    finally:
+        closed.set()
+        producer.join()
+
+    if failure:
+        raise failure[0]
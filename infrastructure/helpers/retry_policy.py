@@ -0,0 +1,141 @@
+"""Bounded retries with decorrelated jitter and a per-run retry budget."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+from infrastructure.config import Config
+
+
+class RetryExhaustedError(RuntimeError):
+    """Raised when a request used all its attempts or the run's budget."""
+
+
+class RetryPolicy:
+    """Decide how long to wait before a retry and when to give up.
+
+    Waits follow the decorrelated jitter schedule
+    ``min(cap, uniform(base, previous * 3))``, so consecutive retries of
+    many workers spread out instead of arriving together, and no single
+    wait exceeds ``cap``. Each request gets at most ``max_attempts``
+    attempts.
+
+    All requests of a run share one budget: retries may not exceed
+    ``budget_min`` plus ``budget_ratio`` times the requests started. Once
+    it is spent every failing request gives up at once, so a run against a
+    site that stopped answering ends instead of retrying forever.
+
+    Thread-safe; one policy is shared by every fetch helper of a run.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        max_attempts: Optional[int] = None,
+        base: Optional[float] = None,
+        cap: Optional[float] = None,
+        budget_ratio: Optional[float] = None,
+        budget_min: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Read the limits from ``config.scraping``.
+
+        Args:
+            config: Application configuration.
+            max_attempts: Attempts per request, first one included
+                (``0`` disables the cap).
+            base: Shortest wait in seconds.
+            cap: Longest wait in seconds.
+            budget_ratio: Retries allowed per request started
+                (negative disables the budget).
+            budget_min: Retries always allowed on top of the ratio.
+            rng: Random source, for reproducible schedules.
+        """
+        scraping = config.scraping
+        self.max_attempts = (
+            scraping.max_attempts if max_attempts is None else max_attempts
+        )
+        self.base = scraping.retry_base if base is None else base
+        self.cap = scraping.retry_cap if cap is None else cap
+        self.budget_ratio = (
+            scraping.retry_budget_ratio if budget_ratio is None else budget_ratio
+        )
+        self.budget_min = (
+            scraping.retry_budget_min if budget_min is None else budget_min
+        )
+        self.random = rng or random.Random()
+
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> "RetryState":
+        """Count a new request and return its retry state."""
+        with self._lock:
+            self.requests += 1
+        return RetryState(self)
+
+    @property
+    def budget_left(self) -> Optional[float]:
+        """Return the retries still allowed in this run, ``None`` if unlimited."""
+        if self.budget_ratio < 0:
+            return None
+        return self.budget_min + self.budget_ratio * self.requests - self.retries
+
+    def reset(self) -> None:
+        """Forget the requests and retries of the previous run."""
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+
+    def next_wait(self, previous: float) -> float:
+        """Return the wait following one of ``previous`` seconds."""
+        upper = max(self.base, previous * 3)
+        return min(self.cap, self.random.uniform(self.base, upper))
+
+    def _spend(self) -> None:
+        """Take one retry from the budget or raise when it is spent."""
+        with self._lock:
+            left = self.budget_left
+            if left is not None and left < 1:
+                raise RetryExhaustedError(
+                    f"retry budget spent ({self.retries} retries "
+                    f"for {self.requests} requests)"
+                )
+            self.retries += 1
+
+
+class RetryState:
+    """Attempts and last wait of one request under a :class:`RetryPolicy`."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.attempt = 1
+        self.wait = 0.0
+
+    def next_delay(self) -> float:
+        """Account for one more attempt and return the wait before it.
+
+        Raises:
+            RetryExhaustedError: The request used ``max_attempts`` attempts
+                or the run's retry budget is spent.
+        """
+        policy = self.policy
+        if policy.max_attempts and self.attempt >= policy.max_attempts:
+            raise RetryExhaustedError(f"gave up after {self.attempt} attempts")
+        policy._spend()
+        self.attempt += 1
+        self.wait = policy.next_wait(self.wait or policy.base)
+        return self.wait
+
+    def sleep(self) -> None:
+        """Sleep before the next attempt; see :meth:`next_delay`."""
+        time.sleep(self.next_delay())
+
+    async def sleep_async(self) -> None:
+        """Event-loop counterpart of :meth:`sleep`."""
+        await asyncio.sleep(self.next_delay())
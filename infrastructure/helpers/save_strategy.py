@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import Callable, Generic, List, Optional, TypeVar
+from typing import TYPE_CHECKING, Callable, Generic, List, Optional, TypeVar
 
 from infrastructure.config import Config
 
+if TYPE_CHECKING:
+    from infrastructure.helpers.persistence_writer import PersistenceWriter
+
 T = TypeVar("T")
 
 
 class SaveStrategy(Generic[T]):
-    """Buffers items and flushes them via a callback."""
+    """Buffers items and flushes them via a callback.
+
+    With a ``writer`` the callback runs on the writer's thread: flushing
+    only queues the buffer, so callers holding a worker pool lock are not
+    held up by the database.
+    """
 
     def __init__(
         self,
         save_callback: Optional[Callable[[List[T]], None]] = None,
         threshold: Optional[int] = None,
         config: Optional[Config] = None,
+        writer: Optional["PersistenceWriter"] = None,
     ) -> None:
         """Create a new strategy instance.
 
@@ -26,12 +35,15 @@ class SaveStrategy(Generic[T]):
             threshold: Number of items to collect before flushing.
             config: Configuration object used when ``threshold`` is not
                 provided.
+            writer: Optional :class:`PersistenceWriter` that performs the
+                saves in the background.
         """
         self.config = config
         self.save_callback = save_callback or (lambda buffer: None)
         self.threshold = threshold or (
             config.global_settings.threshold if config else 50
         )
+        self.writer = writer
         self.buffer: List[T] = []
 
     def handle(
@@ -63,9 +75,17 @@ class SaveStrategy(Generic[T]):
     def flush(self) -> None:
         """Invoke the callback with all buffered items and clear the buffer."""
         if self.buffer:
-            self.save_callback(self.buffer)
+            if self.writer is not None:
+                self.writer.submit(self.save_callback, self.buffer)
+            else:
+                self.save_callback(self.buffer)
             self.buffer.clear()
 
     def finalize(self) -> None:
-        """Flush any remaining items at the end of processing."""
+        """Flush any remaining items at the end of processing.
+
+        With a writer, also wait until everything queued is committed.
+        """
         self.flush()
+        if self.writer is not None:
+            self.writer.flush()
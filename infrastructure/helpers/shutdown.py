@@ -0,0 +1,73 @@
+"""SIGINT/SIGTERM handling that lets long runs stop cleanly."""
+
+from __future__ import annotations
+
+import signal
+import threading
+from typing import Any, Dict, Optional
+
+from domain.ports import LoggerPort
+
+_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+class ShutdownSignal:
+    """Flag set by SIGINT/SIGTERM and polled by the worker pools.
+
+    The first signal only sets the flag: pools stop taking new tasks,
+    in-flight tasks finish, strategies flush and checkpoints are written.
+    A second signal restores the default handlers and interrupts at once.
+
+    Handlers can only be installed from the main thread; elsewhere
+    :meth:`install` is a no-op and :meth:`request` still works.
+    """
+
+    def __init__(self, logger: Optional[LoggerPort] = None) -> None:
+        self.logger = logger
+        self._event = threading.Event()
+        self._previous: Dict[int, Any] = {}
+
+    def is_set(self) -> bool:
+        """Return ``True`` once a shutdown was requested."""
+        return self._event.is_set()
+
+    def request(self) -> None:
+        """Ask every run watching this signal to stop."""
+        self._event.set()
+
+    def clear(self) -> None:
+        """Reset the flag for a new run."""
+        self._event.clear()
+
+    def install(self) -> "ShutdownSignal":
+        """Register the handlers for SIGINT and SIGTERM."""
+        if threading.current_thread() is not threading.main_thread():
+            return self
+        for signum in _SIGNALS:
+            self._previous[signum] = signal.signal(signum, self._handle)
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the handlers that were active before :meth:`install`."""
+        for signum, handler in self._previous.items():
+            signal.signal(signum, handler)
+        self._previous.clear()
+
+    def _handle(self, signum: int, frame: Any) -> None:
+        if self._event.is_set():
+            # Second signal: give up on the graceful path
+            self.uninstall()
+            raise KeyboardInterrupt
+        self._event.set()
+        if self.logger is not None:
+            self.logger.log(
+                f"{signal.Signals(signum).name} received, finishing in-flight "
+                "tasks (send again to abort)",
+                level="warning",
+            )
+
+    def __enter__(self) -> "ShutdownSignal":
+        return self.install()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.uninstall()
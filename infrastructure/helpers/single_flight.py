@@ -0,0 +1,88 @@
+"""Coalesce concurrent calls for the same key into one in-flight call."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent callers of the same key.
+
+    The first caller of a key runs the function; callers arriving while it
+    runs wait for it and receive the same result or exception instead of
+    repeating the work. Nothing is kept once the call finishes, so a later
+    caller runs the function again.
+
+    :meth:`do` serves threads; :meth:`do_async` serves coroutines and keeps
+    its in-flight calls per event loop.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._async_calls: Dict[
+            Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future
+        ] = {}
+        self._lock = threading.Lock()
+        # Calls answered from another caller's flight
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """Run ``fn`` unless a call for ``key`` is already in flight.
+
+        Returns:
+            tuple: The result and whether this caller ran ``fn``.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return call.result(), False
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            call.set_exception(exc)
+            raise
+        else:
+            call.set_result(result)
+            return result, True
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Event-loop counterpart of :meth:`do`."""
+        loop = asyncio.get_running_loop()
+        flight = (loop, key)
+        call = self._async_calls.get(flight)
+        if call is not None:
+            self.shared += 1
+            # Shielded so a cancelled follower does not cancel the leader
+            return await asyncio.shield(call), False
+
+        call = self._async_calls[flight] = loop.create_future()
+        try:
+            result = await fn()
+        except BaseException as exc:
+            if not call.done():
+                call.set_exception(exc)
+                # Followers may be absent; mark the exception as retrieved
+                call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result, True
+        finally:
+            self._async_calls.pop(flight, None)
@@ -0,0 +1,137 @@
+"""Ready-to-use HTTP sessions kept aside for instant rotation."""
+
+from __future__ import annotations
+
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Optional
+
+from domain.ports import LoggerPort
+
+SessionFactory = Callable[[], Any]
+
+
+class SpareSessions:
+    """Keep ``size`` sessions built ahead of time for blocked workers.
+
+    Building a cloudscraper session is slow: connectivity check, cipher
+    setup and, with ``warm_url``, a TLS handshake. A worker rotating after
+    a block takes a spare with :meth:`take` at once, and a background
+    thread builds its replacement. Only when every spare is gone does
+    :meth:`take` build a session inline.
+
+    Sessions are built by ``factory`` on the refill thread, which starts on
+    first use and exits once the reserve is full again.
+    """
+
+    def __init__(
+        self,
+        factory: SessionFactory,
+        size: int,
+        logger: Optional[LoggerPort] = None,
+        warm_url: Optional[str] = None,
+        timeout: float = 5,
+    ) -> None:
+        """Store the factory; no session is built until :meth:`start`.
+
+        Args:
+            factory: Callable returning a new session.
+            size: Spare sessions to keep ready.
+            logger: Optional logger for refill failures.
+            warm_url: Optional URL requested once per spare so its
+                connection is already open when handed out.
+            timeout: Timeout in seconds of the warm-up request.
+        """
+        self.factory = factory
+        self.size = max(size, 0)
+        self.logger = logger
+        self.warm_url = warm_url
+        self.timeout = timeout
+        self._spares: Queue = Queue(max(self.size, 1))
+        self._lock = threading.Lock()
+        self._refill_thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def ready(self) -> int:
+        """Return how many spares are waiting."""
+        return self._spares.qsize()
+
+    def start(self) -> None:
+        """Fill the reserve in the background."""
+        with self._lock:
+            if self._closed or not self.size:
+                return
+            if self._refill_thread is not None and self._refill_thread.is_alive():
+                return
+            self._refill_thread = threading.Thread(
+                target=self._refill, name="spare-sessions", daemon=True
+            )
+            self._refill_thread.start()
+
+    def take(self) -> Any:
+        """Return a spare session at once, or build one if none is ready."""
+        try:
+            session = self._spares.get_nowait()
+        except Empty:
+            session = self.factory()
+        self.start()
+        return session
+
+    def take_ready(self) -> Optional[Any]:
+        """Return a spare session at once, or ``None`` without building one.
+
+        An empty reserve starts refilling in the background.
+        """
+        try:
+            return self._spares.get_nowait()
+        except Empty:
+            self.start()
+            return None
+
+    def give_back(self, session: Any) -> None:
+        """Return a session to the reserve, closing it if the reserve is
+        already full."""
+        try:
+            self._spares.put_nowait(session)
+        except Full:
+            session.close()
+
+    def close(self) -> None:
+        """Stop refilling and close every spare."""
+        with self._lock:
+            self._closed = True
+            thread = self._refill_thread
+        if thread is not None:
+            thread.join()
+        while True:
+            try:
+                self._spares.get_nowait().close()
+            except Empty:
+                break
+
+    def _build(self) -> Any:
+        session = self.factory()
+        if self.warm_url:
+            try:
+                session.head(self.warm_url, timeout=self.timeout)
+            except Exception:  # noqa: BLE001
+                # A cold spare is still faster than building one inline
+                pass
+        return session
+
+    def _refill(self) -> None:
+        while not self._closed and not self._spares.full():
+            try:
+                session = self._build()
+            except Exception as exc:  # noqa: BLE001
+                if self.logger is not None:
+                    self.logger.log(
+                        f"Spare session refill failed: {exc}", level="warning"
+                    )
+                return
+            try:
+                self._spares.put_nowait(session)
+            except Full:
+                session.close()
+                return
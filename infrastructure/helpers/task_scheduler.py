@@ -0,0 +1,76 @@
+"""Ordering and time budget shared by the worker pool implementations."""
+
+from __future__ import annotations
+
+import itertools
+import time
+from typing import Any, Callable, Optional, Protocol, Tuple
+
+# Sentinels rank after every task so workers drain the queue before exiting
+_TASK_RANK = 0
+_SENTINEL_RANK = 1
+
+PriorityFn = Callable[[Any], Any]
+
+
+class StopFlag(Protocol):
+    """Anything exposing ``is_set()``, such as a ``ShutdownSignal``."""
+
+    def is_set(self) -> bool: ...
+
+
+class TaskScheduler:
+    """Decide the order in which queued tasks run and when a run must stop.
+
+    Queue entries are ``(rank, key, seq, item)`` tuples meant for a priority
+    queue. Without a ``priority`` function every key is equal, so ``seq``
+    keeps FIFO order; with one, the smallest ``priority(data)`` runs first
+    and ``seq`` breaks ties. Keys are only compared with other task keys.
+
+    ``time_budget`` (seconds) starts counting when the scheduler is created.
+    Once it is spent, or once ``shutdown`` is set, :meth:`expired` turns
+    ``True`` and the pools stop taking new tasks.
+    """
+
+    def __init__(
+        self,
+        priority: Optional[PriorityFn] = None,
+        time_budget: Optional[float] = None,
+        shutdown: Optional[StopFlag] = None,
+    ) -> None:
+        self.priority = priority
+        self.shutdown = shutdown
+        self.time_budget = time_budget or None
+        self.deadline = (
+            time.perf_counter() + self.time_budget if self.time_budget else None
+        )
+        self._seq = itertools.count()
+
+    def queue_size(self, queue_size: int) -> int:
+        """Return the queue bound to use.
+
+        Priorities only matter among tasks that are already queued, so the
+        priority mode buffers every task descriptor (never the results).
+        """
+        return 0 if self.priority is not None else queue_size
+
+    def entry(self, item: Tuple[int, Any, int]) -> Tuple[int, Any, int, Any]:
+        """Wrap an ``(index, data, attempt)`` item for the queue."""
+        key = self.priority(item[1]) if self.priority is not None else 0
+        return (_TASK_RANK, key, next(self._seq), item)
+
+    def sentinel(self, sentinel: object) -> Tuple[int, Any, int, Any]:
+        """Wrap a stop marker so it sorts after every task."""
+        return (_SENTINEL_RANK, 0, next(self._seq), sentinel)
+
+    def deadline_passed(self) -> bool:
+        """Return ``True`` once the time budget is spent."""
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def interrupted(self) -> bool:
+        """Return ``True`` once a shutdown was requested."""
+        return self.shutdown is not None and self.shutdown.is_set()
+
+    def expired(self) -> bool:
+        """Return ``True`` when no new task should start."""
+        return self.interrupted() or self.deadline_passed()
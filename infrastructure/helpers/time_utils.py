@@ -5,18 +5,27 @@ from typing import Optional
 import psutil
 
 from infrastructure.config import Config
+from infrastructure.helpers.cpu_sampler import CpuSampler
 
 
 class TimeUtils:
-    """Helper for dynamic sleep intervals based on CPU usage."""
+    """Helper for dynamic sleep intervals based on CPU usage.
 
-    def __init__(self, config: Config) -> None:
+    CPU usage comes from the shared background :class:`CpuSampler`, so
+    deciding how long to sleep never blocks.
+    """
+
+    def __init__(self, config: Config, sampler: Optional[CpuSampler] = None) -> None:
         self.config = config
+        settings = config.global_settings
+        self.sampler = sampler or CpuSampler.shared(
+            settings.cpu_sample_interval, settings.cpu_smoothing
+        )
 
-    def sleep_dynamic(
+    def dynamic_wait(
         self, wait: Optional[float] = None, cpu_interval: Optional[float] = None,
-        multiplier: Optional[int] = 1) -> None:
-        """Sleep for a dynamically adjusted time based on CPU utilization.
+        multiplier: Optional[int] = 1) -> float:
+        """Return the dynamically adjusted wait time without sleeping.
 
         The logic adjusts the delay as follows:
         - High CPU (>80%): randomly increases the wait time.
@@ -25,10 +34,19 @@ class TimeUtils:
 
         Args:
             wait: Base wait time in seconds.
-            cpu_interval: Sampling interval for ``psutil.cpu_percent``.
+            cpu_interval: Sampling interval for ``psutil.cpu_percent``. ``None``
+                reads the sampler's smoothed load without blocking; ``0``
+                compares against the previous call.
+            multiplier: Retry attempt; the wait grows linearly with it.
+
+        Returns:
+            float: Number of seconds to wait.
         """
         wait = wait or self.config.global_settings.wait or 2
-        cpu_usage = psutil.cpu_percent(interval=cpu_interval or 0.25)
+        if cpu_interval is None:
+            cpu_usage = self.sampler.load
+        else:
+            cpu_usage = psutil.cpu_percent(interval=cpu_interval)
 
         if cpu_usage > 50:
             wait *= random.uniform(0.3, 1.5)
@@ -37,6 +55,18 @@ class TimeUtils:
         else:
             wait *= random.uniform(0.1, 0.5)
 
-        wait_multiplier = wait ** multiplier if multiplier else wait
+        # Linear growth: ``wait ** multiplier`` shrank sub-second waits and
+        # blew up longer ones
+        return wait * multiplier if multiplier else wait
+
+    def sleep_dynamic(
+        self, wait: Optional[float] = None, cpu_interval: Optional[float] = None,
+        multiplier: Optional[int] = 1) -> None:
+        """Sleep for a dynamically adjusted time based on CPU utilization.
 
-        time.sleep(wait_multiplier)
+        Args:
+            wait: Base wait time in seconds.
+            cpu_interval: Sampling interval for ``psutil.cpu_percent``.
+            multiplier: Retry attempt used to grow the wait time.
+        """
+        time.sleep(self.dynamic_wait(wait, cpu_interval, multiplier))
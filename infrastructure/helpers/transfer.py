@@ -0,0 +1,98 @@
+"""Negotiated response compression and per-endpoint transfer labels."""
+
+from __future__ import annotations
+
+import re
+import zlib
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Path segments this long are payloads (B3 base64 JSON), not endpoint names
+PAYLOAD_SEGMENT = re.compile(r"^[A-Za-z0-9+/=_-]{32,}$")
+
+
+def accept_encoding(configured: str = "") -> str:
+    """Return the ``Accept-Encoding`` header value to send.
+
+    Args:
+        configured: Value from ``scraping.accept_encoding``; empty means
+            every encoding the installed decoders support (gzip and
+            deflate, plus br when ``brotli`` is installed).
+    """
+    if configured:
+        return configured
+    return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+
+def endpoint_of(url: str) -> str:
+    """Return the host and path of ``url`` used to group transfer metrics.
+
+    The query string is dropped and payload segments, such as the base64
+    JSON of B3 calls, are replaced by ``*``.
+    """
+    parts = urlsplit(url)
+    segments = [
+        "*" if PAYLOAD_SEGMENT.match(segment) else segment
+        for segment in parts.path.split("/")
+    ]
+    return parts.netloc + "/".join(segments).rstrip("/")
+
+
+def decode_body(content: bytes, content_encoding: Optional[str]) -> bytes:
+    """Undo the ``Content-Encoding`` of a body read off the wire.
+
+    Args:
+        content: Body bytes as transferred.
+        content_encoding: Value of the response's ``Content-Encoding``.
+
+    Returns:
+        bytes: The decoded body; unknown encodings are returned unchanged.
+    """
+    encodings = [
+        encoding.strip().lower()
+        for encoding in (content_encoding or "").split(",")
+        if encoding.strip()
+    ]
+    # Encodings are listed in the order they were applied
+    for encoding in reversed(encodings):
+        if encoding in ("gzip", "x-gzip"):
+            content = zlib.decompress(content, 16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            try:
+                content = zlib.decompress(content)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib header
+                content = zlib.decompress(content, -zlib.MAX_WBITS)
+        elif encoding == "br" and brotli is not None:
+            content = brotli.decompress(content)
+    return content
+
+
+def wire_size(response: object) -> Tuple[int, int]:
+    """Return the transferred and decoded body sizes of a ``requests`` response.
+
+    ``urllib3`` counts the bytes it read from the socket before decoding.
+    Responses not read through ``urllib3`` report the decoded size twice.
+    """
+    decoded = len(response.content)
+    raw = getattr(response, "raw", None)
+    try:
+        wire = int(raw.tell()) if raw is not None else 0
+    except (AttributeError, OSError, TypeError, ValueError):
+        wire = 0
+    return (wire or decoded), decoded
+
+
+def downloaded_size(response: object) -> int:
+    """Return the decoded body size of ``response``, or 0 when it was served
+    from the response cache or shared from another caller's download."""
+    if response is None:
+        return 0
+    if getattr(response, "from_cache", False) or getattr(response, "shared", False):
+        return 0
+    return len(response.content)
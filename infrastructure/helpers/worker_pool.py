@@ -4,13 +4,16 @@ import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
-from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar
+from dataclasses import replace
+from queue import PriorityQueue
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
-from domain.dto import ExecutionResultDTO, WorkerTaskDTO
+from domain.dto import ExecutionResultDTO, FailedTaskDTO, WorkerTaskDTO
 from domain.ports import LoggerPort, MetricsCollectorPort, WorkerPoolPort
 from infrastructure.config import Config
 from infrastructure.helpers.byte_formatter import ByteFormatter
+from infrastructure.helpers.result_stream import stream_results
+from infrastructure.helpers.task_scheduler import PriorityFn, StopFlag, TaskScheduler
 
 T = WorkerTaskDTO
 R = TypeVar("R")
@@ -25,12 +28,35 @@ class WorkerPool(WorkerPoolPort):
         config: Config,
         metrics_collector: MetricsCollectorPort,
         max_workers: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        shutdown: Optional[StopFlag] = None,
     ) -> None:
-        """Initialize the worker pool with configuration and metrics."""
+        """Initialize the worker pool with configuration and metrics.
+
+        Args:
+            config: Application configuration.
+            metrics_collector: Collector packaged into the execution result.
+            max_workers: Number of worker threads.
+            max_retries: Extra attempts for a task whose processor raised.
+            retry_backoff: Seconds before the first retry, doubled on each
+                following retry.
+            shutdown: Optional ``ShutdownSignal``; once set, runs stop
+                taking new tasks and let in-flight ones finish.
+        """
 
         self.config = config
         self.metrics_collector = metrics_collector
         self.max_workers = max_workers or config.global_settings.max_workers or 1
+        self.max_retries = (
+            config.global_settings.task_retries if max_retries is None else max_retries
+        )
+        self.retry_backoff = (
+            config.global_settings.retry_backoff
+            if retry_backoff is None
+            else retry_backoff
+        )
+        self.shutdown = shutdown
         self.byte_formatter = ByteFormatter()
 
     def run(
@@ -40,33 +66,126 @@ class WorkerPool(WorkerPoolPort):
         logger: LoggerPort,
         on_result: Optional[Callable[[R], None]] = None,
         post_callback: Optional[Callable[[List[R]], None]] = None,
+        keep_results: bool = True,
+        priority: Optional[PriorityFn] = None,
+        time_budget: Optional[float] = None,
     ) -> ExecutionResultDTO[R]:
-        """Process ``tasks`` concurrently using ``processor``."""
+        """Process ``tasks`` concurrently using ``processor``.
+
+        ``tasks`` is consumed lazily through a queue bounded by
+        ``queue_size``. With ``keep_results=False`` each result is dropped
+        once ``on_result`` returns, so ``items`` comes back empty and memory
+        stays flat however many tasks are processed.
+
+        A task whose processor raises goes back to the queue after
+        ``retry_backoff * 2**(attempt - 1)`` seconds, up to ``max_retries``
+        times; the worker moves on to the next task meanwhile. Tasks that
+        keep failing end up in ``dead_letters`` and are counted in
+        ``metrics.failures``.
+
+        ``priority`` maps a task's data to a sort key; the smallest key runs
+        first. ``time_budget`` (seconds, default
+        ``global_settings.time_budget``) stops the run cleanly once spent:
+        no new task is started, in-flight tasks finish and
+        ``deadline_reached`` is set on the result.
+        """
 
         # Inform about the worker pool startup
         # logger.log("Run  Method worker_pool_executor().run()", level="info")
 
+        scheduler = TaskScheduler(
+            priority,
+            (
+                self.config.global_settings.time_budget
+                if time_budget is None
+                else time_budget
+            ),
+            self.shutdown,
+        )
         results: List[R] = []
-        queue: Queue = Queue(self.config.global_settings.queue_size)
+        dead_letters: List[FailedTaskDTO] = []
+        queue: PriorityQueue = PriorityQueue(
+            scheduler.queue_size(self.config.global_settings.queue_size)
+        )
+        skipped = 0
         lock = threading.Lock()
+        # Signals the feeder whenever a scheduled retry reaches the queue
+        retries_settled = threading.Condition(lock)
+        scheduled_retries = 0
         sentinel = object()
         start_time = time.perf_counter()
 
+        def requeue(item: Tuple[int, Any, int]) -> None:
+            nonlocal scheduled_retries
+            queue.put(scheduler.entry(item))
+            with retries_settled:
+                scheduled_retries -= 1
+                retries_settled.notify_all()
+
+        def handle_failure(
+            index: int, entry: Any, attempt: int, worker_id: str, exc: Exception
+        ) -> None:
+            nonlocal scheduled_retries
+            if attempt <= self.max_retries and not scheduler.expired():
+                delay = self.retry_backoff * 2 ** (attempt - 1)
+                logger.log(
+                    f"task {index} failed (attempt {attempt}), retrying in "
+                    f"{delay:.2f}s: {exc}",
+                    level="warning",
+                    worker_id=worker_id,
+                )
+                with lock:
+                    scheduled_retries += 1
+                timer = threading.Timer(delay, requeue, ((index, entry, attempt + 1),))
+                timer.daemon = True
+                timer.start()
+                return
+
+            logger.log(
+                f"task {index} failed after {attempt} attempts: {exc}",
+                level="warning",
+                worker_id=worker_id,
+            )
+            with lock:
+                dead_letters.append(
+                    FailedTaskDTO(
+                        index=index,
+                        data=entry,
+                        error=f"{type(exc).__name__}: {exc}",
+                        attempts=attempt,
+                        worker_id=worker_id,
+                    )
+                )
+
         def worker(worker_id: str) -> None:
             # logger.log("Run  Method worker_pool_executor().worker()", level="info")
+            nonlocal skipped
             while True:
-                item = queue.get()
+                item = queue.get()[-1]
                 if item is sentinel:
                     queue.task_done()
                     # logger.log("End  Method worker_pool_executor().worker()", level="info")
                     break
-                index, entry = item
+                if scheduler.expired():
+                    # Out of time: drain the queue without starting new work
+                    with lock:
+                        skipped += 1
+                    queue.task_done()
+                    continue
+                index, entry, attempt = item
                 task = WorkerTaskDTO(index=index, data=entry, worker_id=worker_id)
                 # logger.log(f"task: {task}", level="info")
-                result = processor(task)
                 try:
+                    # A failing task must never take its worker thread down
+                    try:
+                        result = processor(task)
+                    except Exception as exc:  # noqa: BLE001
+                        handle_failure(index, entry, attempt, worker_id, exc)
+                        continue
+
                     with lock:
-                        results.append(result)
+                        if keep_results:
+                            results.append(result)
                         if callable(on_result):
                             on_result(result)
                 except Exception as exc:  # noqa: BLE001
@@ -82,11 +201,22 @@ class WorkerPool(WorkerPoolPort):
                 for _ in range(self.max_workers)
             ]
 
-            for task in tasks:
-                queue.put(task)
+            for index, entry in tasks:
+                if scheduler.expired():
+                    break
+                queue.put(scheduler.entry((index, entry, 1)))
+
+            # Retries are re-queued before their failed attempt is marked
+            # done, so an empty queue with no scheduled retry means finished
+            while True:
+                queue.join()
+                with retries_settled:
+                    if not scheduled_retries:
+                        break
+                    retries_settled.wait()
 
             for _ in range(self.max_workers):
-                queue.put(sentinel)
+                queue.put(scheduler.sentinel(sentinel))
 
             queue.join()
 
@@ -95,8 +225,19 @@ class WorkerPool(WorkerPoolPort):
 
         elapsed = time.perf_counter() - start_time
 
+        deadline_reached = scheduler.deadline_passed()
+        interrupted = scheduler.interrupted()
+        if deadline_reached or interrupted:
+            reason = (
+                "Shutdown requested"
+                if interrupted
+                else f"Time budget of {scheduler.time_budget}s reached"
+            )
+            logger.log(f"{reason}, {skipped} queued tasks skipped", level="warning")
+
         # Package execution metrics (network and processing bytes)
         metrics = self.metrics_collector.get_metrics(elapsed_time=elapsed)
+        metrics = replace(metrics, failures=metrics.failures + len(dead_letters))
 
         # Final callback after all tasks are done
         if callable(post_callback):
@@ -104,4 +245,31 @@ class WorkerPool(WorkerPoolPort):
             post_callback(results)
 
         # logger.log("End  Method worker_pool_executor().run()", level="info")
-        return ExecutionResultDTO(items=results, metrics=metrics)
+        return ExecutionResultDTO(
+            items=results,
+            metrics=metrics,
+            dead_letters=dead_letters,
+            deadline_reached=deadline_reached,
+            interrupted=interrupted,
+        )
+
+    def stream(
+        self,
+        tasks: Iterable[Tuple[int, Any]],
+        processor: Callable[[T], R],
+        logger: LoggerPort,
+        on_result: Optional[Callable[[R], None]] = None,
+    ) -> Iterator[R]:
+        """Yield results as workers complete them, in completion order.
+
+        At most ``queue_size`` finished results wait for the consumer; a slow
+        consumer pauses the workers instead of accumulating results.
+        """
+        return stream_results(
+            self.run,
+            tasks,
+            processor,
+            logger,
+            on_result=on_result,
+            queue_size=self.config.global_settings.queue_size,
+        )
@@ -21,7 +21,7 @@ class CompanyDataModel(BaseModel):
     cvm_code: Mapped[str] = mapped_column(primary_key=True)
     issuing_company: Mapped[Optional[str]] = mapped_column()
     trading_name: Mapped[Optional[str]] = mapped_column()
-    company_name: Mapped[Optional[str]] = mapped_column()
+    company_name: Mapped[Optional[str]] = mapped_column(index=True)
     cnpj: Mapped[Optional[str]] = mapped_column()
 
     ticker_codes: Mapped[Optional[str]] = mapped_column()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from domain.dto.nsd_dto import NsdDTO
@@ -15,6 +15,9 @@ class NSDModel(BaseModel):
     """ORM model for the tbl_nsd table."""
 
     __tablename__ = "tbl_nsd"
+    # Statement targets are looked up by company and document type; the
+    # trailing nsd lets the anti-join run before the row is read
+    __table_args__ = (Index("ix_nsd_company_type", "company_name", "nsd_type", "nsd"),)
 
     nsd: Mapped[str] = mapped_column(String, primary_key=True)
     company_name: Mapped[Optional[str]] = mapped_column()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from sqlalchemy import Index
+
 from domain.dto.raw_statement_dto import RawStatementDTO
 
 from .abstract_statement_model import AbstractStatementModel
@@ -9,6 +11,11 @@ class RawStatementModel(AbstractStatementModel):
     """ORM model for raw statement rows."""
 
     __tablename__ = "tbl_raw_statements"
+    # Narrow index for "has this NSD been fetched" probes; the primary key
+    # also starts with nsd but carries every key column
+    __table_args__ = AbstractStatementModel.__table_args__ + (
+        Index("ix_raw_statements_nsd", "nsd"),
+    )
 
     @staticmethod
     def from_dto(dto: RawStatementDTO) -> "RawStatementModel":
@@ -1,6 +1,7 @@
 """Persistence layer repositories."""
 
 from .company_repository import SqlAlchemyCompanyDataRepository
+from .engine_registry import EngineRegistry
 from .nsd_repository import SqlAlchemyNsdRepository
 from .parsed_statement_repository import SqlAlchemyParsedStatementRepository
 from .raw_statement_repository import SqlAlchemyRawStatementRepository
@@ -10,4 +11,5 @@ __all__ = [
     "SqlAlchemyNsdRepository",
     "SqlAlchemyRawStatementRepository",
     "SqlAlchemyParsedStatementRepository",
+    "EngineRegistry",
 ]
@@ -29,6 +29,8 @@ class SqlAlchemyCompanyDataRepository(
         Write-Ahead Logging (WAL) mode is enabled to improve concurrent read/write behavior.
     """
 
+    save_mode = "upsert"
+
     def __init__(self, config: Config, logger: LoggerPort) -> None:
         """Initialize the SQLite-backed company repository.
 
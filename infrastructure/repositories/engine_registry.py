@@ -0,0 +1,92 @@
+"""Process-wide registry of SQLAlchemy engines, one per connection string."""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+from infrastructure.models.base_model import BaseModel
+
+
+class EngineRegistry:
+    """Share one engine, its pool and its schema among all repositories.
+
+    The first repository asking for a connection string creates the
+    engine. SQLite connections are tuned as they are opened: WAL journal,
+    ``synchronous``, page cache, ``mmap``, in-memory temp store and busy
+    timeout. Tables, and indexes missing from older databases, are created
+    once per engine. Engines are keyed by
+    process as well, so a forked worker never reuses its parent's pool.
+    """
+
+    _engines: Dict[Tuple[int, str], Engine] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, database: Any) -> Engine:
+        """Return the engine for ``database.connection_string``.
+
+        Args:
+            database: Database settings, such as ``config.database``.
+
+        Returns:
+            Engine: The engine shared by every caller in this process.
+        """
+        key = (os.getpid(), database.connection_string)
+        with cls._lock:
+            engine = cls._engines.get(key)
+            if engine is None:
+                engine = cls._engines[key] = cls._create(database)
+        return engine
+
+    @classmethod
+    def dispose_all(cls) -> None:
+        """Close every pooled connection and forget the engines."""
+        with cls._lock:
+            engines, cls._engines = list(cls._engines.values()), {}
+        for engine in engines:
+            engine.dispose()
+
+    @staticmethod
+    def pragmas(database: Any) -> List[str]:
+        """Return the ``PRAGMA`` statements run on each SQLite connection."""
+        return [
+            "PRAGMA journal_mode=WAL",
+            f"PRAGMA synchronous={database.sqlite_synchronous}",
+            f"PRAGMA cache_size={int(database.sqlite_cache_size)}",
+            f"PRAGMA mmap_size={int(database.sqlite_mmap_size)}",
+            f"PRAGMA temp_store={database.sqlite_temp_store}",
+            f"PRAGMA busy_timeout={int(database.sqlite_busy_timeout)}",
+        ]
+
+    @classmethod
+    def _create(cls, database: Any) -> Engine:
+        """Create the engine, attach the SQLite profile and build the schema."""
+        engine = create_engine(
+            database.connection_string,
+            # allow usage from multiple threads
+            connect_args={"check_same_thread": False},
+            future=True,
+        )
+
+        if engine.dialect.name == "sqlite":
+            pragmas = cls.pragmas(database)
+
+            @event.listens_for(engine, "connect")
+            def _tune(dbapi_connection: Any, _record: Any) -> None:
+                cursor = dbapi_connection.cursor()
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+                cursor.close()
+
+        # Automatically create all tables defined in the SQLAlchemy models
+        BaseModel.metadata.create_all(engine)
+        # create_all skips existing tables; add indexes declared since then
+        for table in BaseModel.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+        return engine
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from typing import List, Set, Tuple
 
+from sqlalchemy import Integer, cast, select
 from sqlalchemy.orm import Session
 
 from domain.dto.nsd_dto import NsdDTO
 from domain.ports import LoggerPort, NSDRepositoryPort
 from infrastructure.config import Config
+from infrastructure.models.company_data_model import CompanyDataModel
 from infrastructure.models.nsd_model import NSDModel
+from infrastructure.models.raw_statement_model import RawStatementModel
 from infrastructure.repositories.sqlalchemy_repository_base import (
     SqlAlchemyRepositoryBase,
 )
@@ -18,6 +21,9 @@ from infrastructure.repositories.sqlalchemy_repository_base import (
 class SqlAlchemyNsdRepository(SqlAlchemyRepositoryBase[NsdDTO, str], NSDRepositoryPort):
     """Concrete repository for NsdDTO using SQLite via SQLAlchemy."""
 
+    # A filed NSD never changes; stored ones are skipped by later syncs
+    save_mode = "ignore"
+
     def __init__(self, config: Config, logger: LoggerPort) -> None:
         super().__init__(config, logger)
 
@@ -59,3 +65,40 @@ class SqlAlchemyNsdRepository(SqlAlchemyRepositoryBase[NsdDTO, str], NSDReposito
             [nsd.to_dto() for nsd in results],
             key=lambda dto: int(dto.nsd)
         )
+
+    def get_statement_targets(self, valid_types: Set[str]) -> List[NsdDTO]:
+        """Retorna os NSDs cujas demonstrações ainda precisam ser baixadas.
+
+        Uma única consulta substitui o cruzamento em Python: o NSD deve ser
+        de uma empresa cadastrada em ``tbl_company`` e de um dos
+        ``valid_types``, sem nenhuma linha em ``tbl_raw_statements``
+        (anti-join ``NOT EXISTS``). Os índices ``ix_nsd_company_type`` e a
+        chave primária das demonstrações, que começa por ``nsd``, atendem a
+        consulta sem varrer as tabelas nem enviar listas de parâmetros.
+
+        Args:
+            valid_types (Set[str]): Tipos de NSDs aceitos (ex: DFP, ITR...).
+
+        Returns:
+            List[NsdDTO]: NSDs pendentes, em ordem numérica.
+        """
+        known_companies = select(CompanyDataModel.company_name).where(
+            CompanyDataModel.company_name.is_not(None)
+        )
+        # Selecting only nsd keeps the probe inside ix_raw_statements_nsd
+        already_fetched = (
+            select(RawStatementModel.nsd)
+            .where(RawStatementModel.nsd == NSDModel.nsd)
+            .exists()
+        )
+        stmt = (
+            select(NSDModel)
+            .where(
+                NSDModel.company_name.in_(known_companies),
+                NSDModel.nsd_type.in_(valid_types),
+                ~already_fetched,
+            )
+            .order_by(cast(NSDModel.nsd, Integer))
+        )
+        with self.Session() as session:
+            return [nsd.to_dto() for nsd in session.scalars(stmt)]
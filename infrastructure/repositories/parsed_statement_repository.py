@@ -17,6 +17,8 @@ class SqlAlchemyParsedStatementRepository(
 ):
     """SQLite-backed repository for ``ParsedStatementDTO`` objects."""
 
+    save_mode = "upsert"
+
     def __init__(self, config: Config, logger: LoggerPort) -> None:
         super().__init__(config, logger)
 
@@ -1,31 +1,63 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, List, Sequence, Set, Tuple, TypeVar, Union
-
-from sqlalchemy import create_engine, text
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy import Column, MetaData, Table, and_, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import sessionmaker
 
 from domain.ports import LoggerPort
 from domain.ports.base_repository_port import SqlAlchemyRepositoryBasePort
 from infrastructure.config import Config
 from infrastructure.helpers.list_flattener import ListFlattener
-from infrastructure.models.base_model import BaseModel
+from infrastructure.repositories.engine_registry import EngineRegistry
 
 T = TypeVar("T")  # T any DTO.
 K = TypeVar("K")  # Primary key type (e.g., str, int)
 
+# Keys bound per IN (...) query, below SQLite's historical limit of 999
+MAX_BOUND_KEYS = 900
+
 
 class SqlAlchemyRepositoryBase(SqlAlchemyRepositoryBasePort[T, K], ABC, Generic[T, K]):
     """
     Contract - Interface genérica para repositórios de leitura/escrita.
     Pode ser especializada para qualquer tipo de DTO.
+
+    ``save_mode`` chooses how :meth:`save_all` writes a batch:
+
+    - ``"merge"``: ``session.merge`` per row, a SELECT by primary key
+      followed by an INSERT or UPDATE through the unit of work;
+    - ``"upsert"``: one ``INSERT ... ON CONFLICT DO UPDATE`` run with
+      ``executemany``;
+    - ``"ignore"``: one ``INSERT ... ON CONFLICT DO NOTHING``, for rows
+      that never change once stored.
+
+    The bulk modes need a dialect with ``ON CONFLICT`` (SQLite or
+    PostgreSQL); others fall back to ``"merge"``.
     """
 
+    # Subclasses pick the write path suited to their rows
+    save_mode = "merge"
+
     def __init__(self, config: Config, logger: LoggerPort) -> None:
         """Initialize the repository infrastructure: engine, session, and schema.
 
-        This constructor sets up the SQLite engine with threading support,
-        configures the session factory for ORM transactions, and ensures
-        that all declared models are created in the database.
+        The engine comes from :class:`EngineRegistry`, so every repository
+        on the same database shares one connection pool, tuned SQLite
+        connections and a schema created once per process.
 
         Args:
             config (Config): Application configuration containing the database connection string.
@@ -35,16 +67,9 @@ class SqlAlchemyRepositoryBase(SqlAlchemyRepositoryBasePort[T, K], ABC, Generic[
         self.config = config
         self.logger = logger
 
-        # Create SQLAlchemy engine for SQLite with thread-safe settings
-        self.engine = create_engine(
-            config.database.connection_string,
-            connect_args={"check_same_thread": False},  # allow usage from multiple threads
-            future=True,
-        )
-
-        # Enable Write-Ahead Logging mode to support concurrent reads/writes
-        with self.engine.connect() as conn:
-            conn.execute(text("PRAGMA journal_mode=WAL"))
+        # Shared engine for this database; WAL and the rest of the SQLite
+        # profile are applied to each connection it opens
+        self.engine = EngineRegistry.get(config.database)
 
         # Create a session factory for managing DB transactions
         self.Session = sessionmaker(
@@ -53,9 +78,6 @@ class SqlAlchemyRepositoryBase(SqlAlchemyRepositoryBasePort[T, K], ABC, Generic[
             expire_on_commit=True,
         )
 
-        # Automatically create all tables defined in the SQLAlchemy models
-        BaseModel.metadata.create_all(self.engine)
-
         # self.logger.log(f"Create Instance Base Class {self.__class__.__name__}", level="info")
 
     @abstractmethod
@@ -96,9 +118,15 @@ class SqlAlchemyRepositoryBase(SqlAlchemyRepositoryBasePort[T, K], ABC, Generic[
                 if item is not None
             ]
 
-            # Merge each DTO into the current session (insert or update)
-            for dto in valid_items:
-                session.merge(model.from_dto(dto))
+            insert = self._insert_for_dialect()
+            if self.save_mode == "merge" or insert is None:
+                # Merge each DTO into the current session (insert or update)
+                for dto in valid_items:
+                    session.merge(model.from_dto(dto))
+            elif valid_items:
+                # One statement for the whole batch, run with executemany
+                rows = self._rows(model, pk_columns, valid_items)
+                session.execute(self._bulk_statement(insert(model), pk_columns), rows)
 
             # Commit the transaction to persist all changes
             session.commit()
@@ -125,6 +153,42 @@ class SqlAlchemyRepositoryBase(SqlAlchemyRepositoryBasePort[T, K], ABC, Generic[
             # Ensure the session is always closed after execution
             session.close()
 
+    def _insert_for_dialect(self) -> Any:
+        """Return the engine's ``insert`` supporting ``ON CONFLICT``, if any."""
+        return {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(
+            self.engine.dialect.name
+        )
+
+    def _rows(
+        self, model: type, pk_columns: Sequence, items: List[T]
+    ) -> List[Dict[str, Any]]:
+        """Convert DTOs into column dictionaries for ``executemany``.
+
+        Rows sharing a primary key keep the last one, as successive merges
+        would; PostgreSQL rejects a batch that updates a row twice. Keys
+        with a NULL never conflict and are all kept.
+        """
+        attrs = inspect(model).column_attrs
+        rows: Dict[Any, Dict[str, Any]] = {}
+        for index, dto in enumerate(items):
+            obj = model.from_dto(dto)
+            row = {attr.columns[0].key: getattr(obj, attr.key) for attr in attrs}
+            key = tuple(row[col.key] for col in pk_columns)
+            rows[index if None in key else key] = row
+        return list(rows.values())
+
+    def _bulk_statement(self, stmt: Any, pk_columns: Sequence) -> Any:
+        """Add the ``ON CONFLICT`` clause matching :attr:`save_mode`."""
+        index_elements = [col.key for col in pk_columns]
+        updates = {
+            col.key: stmt.excluded[col.key]
+            for col in stmt.table.columns
+            if not col.primary_key
+        }
+        if self.save_mode == "ignore" or not updates:
+            return stmt.on_conflict_do_nothing(index_elements=index_elements)
+        return stmt.on_conflict_do_update(index_elements=index_elements, set_=updates)
+
     def get_all(self) -> List[T]:
         """Retrieve all persisted DTOs from the database.
 
@@ -153,6 +217,68 @@ class SqlAlchemyRepositoryBase(SqlAlchemyRepositoryBasePort[T, K], ABC, Generic[
             # Ensure the session is closed even if an error occurs
             session.close()
 
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[T]:
+        """Stream every persisted DTO, ``batch_size`` rows at a time.
+
+        Rows are fetched with ``yield_per`` and converted one batch at a
+        time; the session's identity map only holds weak references, so
+        memory stays bounded by ``batch_size`` whatever the table size.
+        Rows come in the database's primary-key order; unlike
+        :meth:`get_all`, numeric keys are not re-sorted.
+
+        Args:
+            batch_size (Optional[int]): Rows per fetch, defaulting to
+                ``global_settings.batch_size``.
+
+        Yields:
+            T: One DTO per stored row.
+        """
+        batch_size = batch_size or self.config.global_settings.batch_size or 1000
+
+        # Get the SQLAlchemy model class linked to the current DTO type
+        model, pk_columns = self.get_model_class()
+
+        stmt = (
+            select(model).order_by(*pk_columns).execution_options(yield_per=batch_size)
+        )
+        with self.Session() as session:
+            for batch in session.scalars(stmt).partitions():
+                # Convert the whole batch so its ORM objects can be released
+                yield from [obj.to_dto() for obj in batch]
+
+    def select_columns(
+        self,
+        *column_names: str,
+        distinct: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Tuple]:
+        """Stream raw tuples of the given columns without building ORM objects.
+
+        Examples:
+            names = {name for (name,) in repo.select_columns("company_name")}
+
+        Args:
+            *column_names (str): Model attributes to select, in tuple order.
+            distinct (bool): Whether duplicate tuples are dropped in SQL.
+            batch_size (Optional[int]): Rows per fetch, defaulting to
+                ``global_settings.batch_size``.
+
+        Yields:
+            Tuple: One row per match, NULLs included and in no given order.
+        """
+        batch_size = batch_size or self.config.global_settings.batch_size or 1000
+
+        # Retrieve the SQLAlchemy model class associated with the DTO type
+        model, pk_columns = self.get_model_class()
+
+        stmt = select(*(getattr(model, name) for name in column_names))
+        if distinct:
+            stmt = stmt.distinct()
+        with self.Session() as session:
+            result = session.execute(stmt.execution_options(yield_per=batch_size))
+            for row in result:
+                yield tuple(row)
+
     def get_all_primary_keys(self) -> List[K]:
         """Retrieve all unique primary keys from the database.
 
@@ -305,6 +431,88 @@ class SqlAlchemyRepositoryBase(SqlAlchemyRepositoryBasePort[T, K], ABC, Generic[
             # Ensure the session is closed in all cases
             session.close()
 
+    def get_many(self, identifiers: Iterable[K]) -> Dict[K, T]:
+        """Retrieve the DTOs of many identifiers at once.
+
+        Simple keys are looked up with ``IN`` queries of at most
+        ``MAX_BOUND_KEYS`` keys. Composite keys (tuples) are loaded into a
+        temporary table and joined, so a batch costs one query however many
+        keys it has.
+
+        Args:
+            identifiers (Iterable[K]): Keys to look up; tuples for composite keys.
+
+        Returns:
+            Dict[K, T]: DTO by key, for the keys found. Missing keys are absent.
+        """
+        model, pk_columns = self.get_model_class()
+        with self.Session() as session:
+            rows = self._find_many(session, (model,), identifiers)
+            return {self._key_of(obj, pk_columns): obj.to_dto() for (obj,) in rows}
+
+    def has_many(self, identifiers: Iterable[K]) -> Set[K]:
+        """Return which of the given identifiers are stored.
+
+        Works like :meth:`get_many` but selects only the key columns.
+
+        Args:
+            identifiers (Iterable[K]): Keys to check; tuples for composite keys.
+
+        Returns:
+            Set[K]: The keys that exist in the database.
+        """
+        model, pk_columns = self.get_model_class()
+        with self.Session() as session:
+            rows = self._find_many(session, pk_columns, identifiers)
+            return {self._key_of(row, pk_columns) for row in rows}
+
+    def _find_many(
+        self, session: Any, entities: Sequence, identifiers: Iterable[K]
+    ) -> List[Any]:
+        """Return the rows of ``select(*entities)`` whose key is in ``identifiers``."""
+        model, pk_columns = self.get_model_class()
+        keys = list(dict.fromkeys(identifiers))
+        if not keys:
+            return []
+
+        if len(pk_columns) == 1:
+            # One IN (...) query per chunk of keys
+            rows: List[Any] = []
+            for start in range(0, len(keys), MAX_BOUND_KEYS):
+                chunk = keys[start : start + MAX_BOUND_KEYS]
+                stmt = select(*entities).where(pk_columns[0].in_(chunk))
+                rows.extend(session.execute(stmt).all())
+            return rows
+
+        # Composite keys: fill a temporary table and join it in one query
+        assert all(
+            isinstance(key, tuple) for key in keys
+        ), "Expected tuple for composite key"
+        wanted = Table(
+            f"tmp_keys_{model.__tablename__}",
+            MetaData(),
+            *(Column(col.key, col.type) for col in pk_columns),
+            prefixes=["TEMPORARY"],
+        )
+        connection = session.connection()
+        wanted.create(connection, checkfirst=True)
+        try:
+            connection.execute(
+                wanted.insert(),
+                [dict(zip([col.key for col in pk_columns], key)) for key in keys],
+            )
+            match = and_(*(col == wanted.c[col.key] for col in pk_columns))
+            stmt = select(*entities).join(wanted, match)
+            return session.execute(stmt).all()
+        finally:
+            wanted.drop(connection)
+
+    @staticmethod
+    def _key_of(obj: Any, pk_columns: Sequence) -> Any:
+        """Return the identifier of ``obj``: a scalar, or a tuple for composite keys."""
+        values = tuple(getattr(obj, col.key) for col in pk_columns)
+        return values[0] if len(values) == 1 else values
+
     def _safe_cast(self, value: Any) -> Union[int, str]:
         try:
             return int(value)
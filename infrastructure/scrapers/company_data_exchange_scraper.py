@@ -21,9 +21,15 @@ from domain.ports import (
     WorkerPoolPort,
 )
 from infrastructure.config import Config
-from infrastructure.helpers import FetchUtils, SaveStrategy
+from infrastructure.helpers import (
+    AsyncWorkerPool,
+    FetchUtils,
+    PersistenceWriter,
+    SaveStrategy,
+)
 from infrastructure.helpers.byte_formatter import ByteFormatter
 from infrastructure.helpers.data_cleaner import DataCleaner
+from infrastructure.helpers.transfer import downloaded_size
 from infrastructure.scrapers.company_data_processors import (
     CompanyDataDetailProcessor,
     CompanyDataMerger,
@@ -47,12 +53,18 @@ class CompanyDataScraper(CompanyDataScraperPort):
         mapper: CompanyDataMapper,
         worker_pool_executor: WorkerPoolPort,
         metrics_collector: MetricsCollectorPort,
+        fetch_utils: Optional[FetchUtils] = None,
+        writer: Optional[PersistenceWriter] = None,
     ):
         """Set up configuration, logger and helper utilities for the scraper.
 
         Args:
             config (Config): Global configuration with exchange endpoints.
             logger (Logger): Logger used for progress and error messages.
+            fetch_utils (FetchUtils): Optional shared HTTP helper, so every
+                scraper reports to the same per-host concurrency controller.
+            writer (PersistenceWriter): Optional background writer that runs
+                ``save_callback`` off the worker pool threads.
 
         Attributes:
             config (Config): Stored configuration instance.
@@ -79,9 +91,10 @@ class CompanyDataScraper(CompanyDataScraperPort):
         self.mapper = mapper
         self.worker_pool_executor = worker_pool_executor
         self._metrics_collector = metrics_collector
+        self.writer = writer
 
         # Initialize FetchUtils for HTTP request utilities
-        self.fetch_utils = FetchUtils(config, logger)
+        self.fetch_utils = fetch_utils or FetchUtils(config, logger)
 
         # Set language and API company_data_endpoint from configuration
         self.language = config.exchange.language
@@ -89,8 +102,7 @@ class CompanyDataScraper(CompanyDataScraperPort):
         self.endpoint_detail = config.exchange.company_data_endpoint["detail"]
         self.endpoint_financial = config.exchange.company_data_endpoint["financial"]
 
-        # Initialize a requests session for HTTP requests
-        self.session = self.fetch_utils.create_scraper()
+        # Requests use the calling thread's keep-alive session from fetch_utils
 
         self.byte_formatter = ByteFormatter()
 
@@ -100,7 +112,6 @@ class CompanyDataScraper(CompanyDataScraperPort):
         self.entry_cleaner = EntryCleaner(self.data_cleaner)
         self.detail_fetcher = DetailFetcher(
             fetch_utils=self.fetch_utils,
-            session=self.session,
             endpoint_detail=self.endpoint_detail,
             language=self.language,
             metrics_collector=self.metrics_collector,
@@ -181,7 +192,7 @@ class CompanyDataScraper(CompanyDataScraperPort):
         # self.logger.log("Run  Method sync_companies_usecase.run().fetch_all(save_callback, max_workers)._fetch_companies_list(save_callback, max_workers, threshold)", level="info")
 
         strategy: SaveStrategy[Dict] = SaveStrategy(
-            save_callback, self.threshold, config=self.config
+            save_callback, self.threshold, config=self.config, writer=self.writer
         )
         page_exec = ExecutionResultDTO(
             items=[], metrics=self.metrics_collector.get_metrics(0)
@@ -298,7 +309,7 @@ class CompanyDataScraper(CompanyDataScraperPort):
         # self.logger.log("Run  Method sync_companies_usecase.run().fetch_all(save_callback, max_workers)._fetch_companies_details(save_callback, max_workers, threshold)", level="info")
 
         strategy: SaveStrategy[CompanyDataRawDTO] = SaveStrategy(
-            save_callback, self.threshold, config=self.config
+            save_callback, self.threshold, config=self.config, writer=self.writer
         )
         detail_exec: ExecutionResultDTO[Optional[CompanyDataRawDTO]] = ExecutionResultDTO(
             items=[], metrics=self.metrics_collector.get_metrics(0)
@@ -308,69 +319,74 @@ class CompanyDataScraper(CompanyDataScraperPort):
         tasks = list(enumerate(companies_list))
         start_time = time.perf_counter()
 
-        def processor(task: WorkerTaskDTO) -> Optional[CompanyDataRawDTO]:
-            # self.logger.log("Run  Method CompanyDataScraper._fetch_companies_details().processor()", level="info")
-            index = task.index
+        def skip(task: WorkerTaskDTO) -> bool:
             entry = task.data
-            worker_id = task.worker_id
-
             code_cvm = entry.get("codeCVM")
-            if code_cvm in self.skip_codes:
-                # download_bytes_pre = self._metrics_collector.network_bytes
-                # download_bytes_pos = self._metrics_collector.network_bytes - download_bytes_pre
-
-                # Log and skip already persisted companies
-                extra_info = {
-                    "issuingCompany": entry["issuingCompany"],
-                    "trading_name": entry["tradingName"],
-                    # "Download": self.byte_formatter.format_bytes(download_bytes_pos),
-                    # "Total download": self.byte_formatter.format_bytes(self.metrics_collector.network_bytes),
-                    }
-                self.logger.log(
-                    f"{code_cvm}",
-                    level="info",
-                    progress={
-                        "index": index,
-                        "size": len(tasks),
-                        "start_time": start_time,
-                    },
-                    extra=extra_info,
-                    worker_id=worker_id,
-                )
-
-                return None
-
-            download_bytes_pre = self._metrics_collector.network_bytes
-
-            # self.logger.log("Call Method CompanyDataScraper._fetch_companies_details().processor().self.detail_processor.run(entry)", level="info")
-            result = self.detail_processor.process_entry(entry)
-            # self.logger.log("End  Method CompanyDataScraper._fetch_companies_details().processor().self.detail_processor.run(entry)", level="info")
+            if code_cvm not in self.skip_codes:
+                return False
 
-            download_bytes_pos = self._metrics_collector.network_bytes - download_bytes_pre
-
-            issuingCompany = entry.get("issuingCompany")
-            tradingName = entry.get("tradingName")
+            # Log and skip already persisted companies
             extra_info = {
-                "issuingCompany": issuingCompany,
-                "trading_name": tradingName,
-                "Download": self.byte_formatter.format_bytes(download_bytes_pos),
-                "Total download": self.byte_formatter.format_bytes(
-                    self.metrics_collector.network_bytes
-                ),
+                "issuingCompany": entry["issuingCompany"],
+                "trading_name": entry["tradingName"],
             }
             self.logger.log(
                 f"{code_cvm}",
                 level="info",
                 progress={
-                    "index": index,
+                    "index": task.index,
+                    "size": len(tasks),
+                    "start_time": start_time,
+                },
+                extra=extra_info,
+                worker_id=task.worker_id,
+            )
+            return True
+
+        def report(task: WorkerTaskDTO, download_bytes: Optional[int]) -> None:
+            entry = task.data
+            extra_info = {
+                "issuingCompany": entry.get("issuingCompany"),
+                "trading_name": entry.get("tradingName"),
+            }
+            if download_bytes is not None:
+                extra_info["Download"] = self.byte_formatter.format_bytes(
+                    download_bytes
+                )
+            extra_info["Total download"] = self.byte_formatter.format_bytes(
+                self.metrics_collector.network_bytes
+            )
+            self.logger.log(
+                f"{entry.get('codeCVM')}",
+                level="info",
+                progress={
+                    "index": task.index,
                     "size": len(tasks),
                     "start_time": start_time,
                 },
                 extra=extra_info,
-                worker_id=worker_id,
+                worker_id=task.worker_id,
             )
 
-            # self.logger.log("End  Method CompanyDataScraper._fetch_companies_details().processor()", level="info")
+        def processor(task: WorkerTaskDTO) -> Optional[CompanyDataRawDTO]:
+            if skip(task):
+                return None
+
+            download_bytes_pre = self._metrics_collector.network_bytes
+            result = self.detail_processor.process_entry(task.data)
+            report(task, self._metrics_collector.network_bytes - download_bytes_pre)
+
+            return result
+
+        async def async_processor(task: WorkerTaskDTO) -> Optional[CompanyDataRawDTO]:
+            if skip(task):
+                return None
+
+            # Byte deltas overlap between coroutines, so only the total is shown
+            result = await self.detail_processor.process_entry_async(
+                task.data, async_fetch_utils
+            )
+            report(task, None)
 
             return result
 
@@ -381,9 +397,16 @@ class CompanyDataScraper(CompanyDataScraperPort):
                 strategy.handle([item])
             # self.logger.log("End  Method strategy.handle()", level="info")
 
+        # The asyncio engine fetches details without one thread per request
+        async_fetch_utils = (
+            self.worker_pool_executor.fetch_utils
+            if isinstance(self.worker_pool_executor, AsyncWorkerPool)
+            else None
+        )
+
         detail_exec = self.worker_pool_executor.run(
             tasks=tasks,
-            processor=processor,
+            processor=async_processor if async_fetch_utils else processor,
             logger=self.logger,
             on_result=handle_batch,
         )
@@ -415,8 +438,8 @@ class CompanyDataScraper(CompanyDataScraperPort):
         }
         token = self._encode_payload(payload)
         url = self.endpoint_companies_list + token
-        response, self.session = self.fetch_utils.fetch_with_retry(self.session, url)
-        bytes_downloaded = len(response.content if response else b"")
+        response, _ = self.fetch_utils.fetch_with_retry(None, url)
+        bytes_downloaded = downloaded_size(response)
         self.metrics_collector.record_network_bytes(bytes_downloaded)
         data = response.json()
         results = data.get("results", [])
@@ -9,8 +9,9 @@ from typing import Dict, List, Optional, Type, Union, cast
 from application import CompanyDataMapper
 from domain.dto import CompanyDataDetailDTO, CompanyDataListingDTO, CompanyDataRawDTO
 from domain.ports import LoggerPort, MetricsCollectorPort
-from infrastructure.helpers import FetchUtils
+from infrastructure.helpers import AsyncFetchUtils, FetchUtils
 from infrastructure.helpers.data_cleaner import DataCleaner
+from infrastructure.helpers.transfer import downloaded_size
 
 
 class EntryCleaner:
@@ -41,7 +42,6 @@ class DetailFetcher:
     def __init__(
         self,
         fetch_utils: FetchUtils,
-        session,
         endpoint_detail: str,
         language: str,
         metrics_collector: MetricsCollectorPort,
@@ -49,22 +49,34 @@ class DetailFetcher:
     ) -> None:
         """Store HTTP utilities and configuration."""
         self.fetch_utils = fetch_utils
-        self.session = session
         self.endpoint_detail = endpoint_detail
         self.language = language
         self.metrics_collector = metrics_collector
         self.data_cleaner = data_cleaner
 
-    def fetch_detail(self, cvm_code: str) -> Dict:
-        """Fetch detail JSON and normalize fields."""
+    def _detail_url(self, cvm_code: str) -> str:
+        """Return the detail endpoint URL for ``cvm_code``."""
         payload = {"codeCVM": cvm_code, "language": self.language}
         token = base64.b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8")
-        url = self.endpoint_detail + token
-        response, self.session = self.fetch_utils.fetch_with_retry(self.session, url)
-        self.metrics_collector.record_network_bytes(len(response.content))
+        return self.endpoint_detail + token
+
+    def fetch_detail(self, cvm_code: str) -> Dict:
+        """Fetch detail JSON and normalize fields."""
+        url = self._detail_url(cvm_code)
+        response, _ = self.fetch_utils.fetch_with_retry(None, url)
+        self.metrics_collector.record_network_bytes(downloaded_size(response))
         raw = response.json()
         return raw
 
+    async def fetch_detail_async(
+        self, cvm_code: str, async_fetch_utils: AsyncFetchUtils
+    ) -> Dict:
+        """Event-loop counterpart of :meth:`fetch_detail`."""
+        url = self._detail_url(cvm_code)
+        response, _ = await async_fetch_utils.fetch_with_retry(None, url)
+        self.metrics_collector.record_network_bytes(downloaded_size(response))
+        return response.json()
+
 
 class CompanyDataMerger:
     """Merge base and detail DTOs."""
@@ -98,56 +110,78 @@ class CompanyDataDetailProcessor:
         self.fetcher = fetcher
         self.merger = merger
 
+    def _clean_listing(self, entry: Dict) -> CompanyDataListingDTO:
+        """Return the cleaned listing DTO for ``entry``."""
+        text_keys = [
+            "issuingCompany",
+            "companyName",
+            "tradingName",
+            "segment",
+            "segmentEng",
+            "market",
+        ]
+        date_keys = ["dateListing"]
+        number_keys = []
+        return cast(
+            CompanyDataListingDTO,
+            self.cleaner.clean_entry(
+                entry=entry,
+                text_keys=text_keys,
+                date_keys=date_keys,
+                number_keys=number_keys,
+                dto_class=CompanyDataListingDTO,
+            ),
+        )
+
+    def _merge_detail(
+        self, listing: CompanyDataListingDTO, detail: Dict
+    ) -> Optional[CompanyDataRawDTO]:
+        """Clean the fetched ``detail`` and merge it into ``listing``."""
+        text_keys = [
+            "issuingCompany",
+            "companyName",
+            "tradingName",
+            "IndustryClassificationEng",
+            "market",
+            "institutionCommon",
+            "institutionPreferred",
+            "market",
+            "institutionCommon",
+            "institutionPreffered",
+        ]
+        date_keys = ["lastDate", "dateQuotation"]
+        number_keys = []
+        detail_dto = cast(
+            CompanyDataDetailDTO,
+            self.cleaner.clean_entry(
+                entry=detail,
+                text_keys=text_keys,
+                date_keys=date_keys,
+                number_keys=number_keys,
+                dto_class=CompanyDataDetailDTO,
+            ),
+        )
+
+        return self.merger.merge_details(listing, detail_dto)
+
     def process_entry(self, entry: Dict) -> Optional[CompanyDataRawDTO]:
         """Clean, fetch details, and merge into a raw DTO."""
         try:
-            text_keys = [
-                "issuingCompany",
-                "companyName",
-                "tradingName",
-                "segment",
-                "segmentEng",
-                "market",
-            ]
-            date_keys = ["dateListing"]
-            number_keys = []
-            listing = cast(
-                CompanyDataListingDTO,
-                self.cleaner.clean_entry(
-                    entry=entry,
-                    text_keys=text_keys,
-                    date_keys=date_keys,
-                    number_keys=number_keys,
-                    dto_class=CompanyDataListingDTO,
-                ),
-            )
-
+            listing = self._clean_listing(entry)
             detail = self.fetcher.fetch_detail(str(listing.cvm_code))
-            text_keys = [
-                "issuingCompany",
-                "companyName",
-                "tradingName",
-                "IndustryClassificationEng",
-                "market",
-                "institutionCommon",
-                "institutionPreferred",
-                "market",
-                "institutionCommon",
-                "institutionPreffered",
-            ]
-            date_keys = ["lastDate", "dateQuotation"]
-            number_keys = []
-            detail = cast(
-                CompanyDataDetailDTO,
-                self.cleaner.clean_entry(
-                    entry=detail,
-                    text_keys=text_keys,
-                    date_keys=date_keys,
-                    number_keys=number_keys,
-                    dto_class=CompanyDataDetailDTO,
-                ),
-            )
-
-            return self.merger.merge_details(listing, detail)
+            return self._merge_detail(listing, detail)
         except Exception:
             pass
+
+    async def process_entry_async(
+        self, entry: Dict, async_fetch_utils: AsyncFetchUtils
+    ) -> Optional[CompanyDataRawDTO]:
+        """Event-loop counterpart of :meth:`process_entry`."""
+        try:
+            listing = self._clean_listing(entry)
+            detail = await self.fetcher.fetch_detail_async(
+                str(listing.cvm_code), async_fetch_utils
+            )
+            return self._merge_detail(listing, detail)
+        except Exception:
+            return None
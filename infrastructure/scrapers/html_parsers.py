@@ -0,0 +1,201 @@
+"""Module-level HTML parsers for CVM pages.
+
+The functions take and return plain, picklable values only so they can be
+shipped to a :class:`ProcessWorkerPool` and run on every core, while the
+scrapers keep fetching pages on their I/O threads.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+from domain.ports.data_cleaner_port import DataCleanerPort
+
+BLOCKED_MARKER = "MensagemModal"
+BLOCKED_TEXT = "acesse este conteúdo pela página principal dos documentos"
+
+
+def parse_nsd_html(nsd: int, html: str, data_cleaner: DataCleanerPort) -> Dict:
+    """Parse NSD HTML into a dictionary.
+
+    Args:
+        nsd: Sequence number of the document.
+        html: Raw page content.
+        data_cleaner: Cleaner used to normalize text and dates.
+
+    Returns:
+        Dict: Parsed fields, or an empty dict when the NSD does not exist.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    def text_of(selector: str) -> Optional[str]:
+        el = soup.select_one(selector)
+        return el.get_text(strip=True) if el else None
+
+    sent_date = text_of("#lblDataEnvio")
+    if not sent_date:
+        return {}
+
+    # from DTO
+    data: Dict[str, str | int | datetime | None] = {
+        "nsd": nsd,
+        "company_name": data_cleaner.clean_text(text_of("#lblNomeCompanhia")),
+        # quarter e sent_date serão preenchidos depois
+        "quarter": None,
+        "version": None,
+        "nsd_type": None,
+        "dri": None,
+        "auditor": None,
+        "responsible_auditor": data_cleaner.clean_text(
+            text_of("#lblResponsavelTecnico")
+        ),
+        "protocol": text_of("#lblProtocolo"),
+        "sent_date": None,
+        "reason": data_cleaner.clean_text(
+            text_of("#lblMotivoCancelamentoReapresentacao")
+        ),
+    }
+
+    # Limpeza do padrão FCA
+    dri = data_cleaner.clean_text(text_of("#lblNomeDRI")) or ""
+    dri_pattern = r"\s+FCA(?:\s+V\d+)?\b"
+    data["dri"] = re.sub(dri_pattern, "", dri)
+    data["dri"] = re.sub(r"\s{2,}", " ", data["dri"]).strip()
+
+    auditor = data_cleaner.clean_text(text_of("#lblAuditor")) or ""
+    auditor_pattern = r"\s+FCA\s+\d{4}(?:\s+V\d+)?\b"
+    data["auditor"] = re.sub(auditor_pattern, "", auditor)
+    data["auditor"] = re.sub(r"\s{2,}", " ", data["auditor"]).strip()
+
+    quarter = text_of("#lblDataDocumento")
+    if quarter and quarter.strip().isdigit() and len(quarter.strip()) == 4:
+        quarter = f"31/12/{quarter.strip()}"
+    data["quarter"] = data_cleaner.clean_date(quarter) if quarter else None
+
+    nsd_type_version = text_of("#lblDescricaoCategoria")
+    if nsd_type_version:
+        parts = [p.strip() for p in nsd_type_version.split(" - ")]
+        if len(parts) >= 2:
+            data["version"] = data_cleaner.clean_text(parts[-1]) if parts[-1] else None
+            data["nsd_type"] = data_cleaner.clean_text(parts[0]) if parts[0] else None
+
+    data["sent_date"] = data_cleaner.clean_date(sent_date) if sent_date else None
+
+    return data
+
+
+def extract_hash(html: str) -> str:
+    """Extract the hidden hash value from a statement index page."""
+    soup = BeautifulSoup(html, "html.parser")
+    # hash in element
+    element = soup.select_one("#hdnHash")
+    if element:
+        value = element.get("value")
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+
+    # hash in form
+    form = soup.select_one("form[action*='Hash=']")
+    if form:
+        action_url = form.get("action", "")
+        match = re.search(r"[?&]Hash=([a-zA-Z0-9_-]+)", str(action_url))
+        if match:
+            return match.group(1)
+
+    return ""
+
+
+def is_blocked(html: str, soup: BeautifulSoup) -> bool:
+    """Return ``True`` when the server answered with its block page."""
+    return BLOCKED_MARKER in html or BLOCKED_TEXT in soup.get_text()
+
+
+def parse_statement_soup(
+    soup: BeautifulSoup,
+    group: str,
+    capital_items: Sequence[Dict[str, str]],
+    data_cleaner: DataCleanerPort,
+) -> List[Dict[str, Any]]:
+    """Return parsed rows from a statement ``soup``."""
+    rows: List[Dict[str, Any]] = []
+
+    # Default parsing for Capital Composition page
+    if group == "Dados da Empresa":
+        thousand = 1
+        table = soup.find("div", id="UltimaTabela")
+        if isinstance(table, Tag):
+            text = table.get_text()
+            if "Mil" in text:
+                thousand = 1000
+
+        def value_from(elem_id: str) -> float:
+            element = soup.find(id=elem_id)
+            if element is None:
+                return 0.0
+            value = data_cleaner.clean_number(element.get_text())
+            result = thousand * value
+            return result if result is not None else 0.0
+
+        for item in capital_items:
+            rows.append(
+                {
+                    "account": item["account"],
+                    "description": item["description"],
+                    "value": value_from(item["elem_id"]),
+                }
+            )
+        return rows
+
+    # Default parsing for DFs pages
+    thousand = 1
+    title_element = soup.find(id="TituloTabelaSemBorda")
+    if isinstance(title_element, Tag):
+        title = title_element.get_text(strip=True)
+        if "Mil" in title:
+            thousand = 1000
+
+    table = soup.find("table", id="ctl00_cphPopUp_tbDados")
+    if not table:
+        return rows
+
+    if isinstance(table, Tag):
+        table_rows = table.find_all("tr")
+        for row in table_rows:
+            cols = [c.get_text(strip=True) for c in row.find_all("td")]
+            # ignora linhas cujo account não começa com dígito
+            if len(cols) < 3:
+                continue
+            if not cols[0] or not cols[0][0].isdigit():
+                continue
+            account, account_description, account_value = cols[0], cols[1], cols[2]
+            rows.append(
+                {
+                    "account": account,
+                    "description": account_description,
+                    "value": (data_cleaner.clean_number(account_value) or 0.0)
+                    * thousand,
+                }
+            )
+
+    return rows
+
+
+def parse_statement_html(
+    html: str,
+    group: str,
+    capital_items: Sequence[Dict[str, str]],
+    data_cleaner: DataCleanerPort,
+) -> Tuple[bool, List[Dict[str, Any]]]:
+    """Parse a statement page once and report whether it was blocked.
+
+    Returns:
+        tuple: ``(blocked, rows)``; ``rows`` is empty when ``blocked``.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    if is_blocked(html, soup):
+        return True, []
+    return False, parse_statement_soup(soup, group, capital_items, data_cleaner)
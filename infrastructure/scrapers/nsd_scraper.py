@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import re
+import threading
 import time
 from datetime import datetime
-from typing import Callable, Dict, List, Optional, Set
-
-from bs4 import BeautifulSoup
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from domain.dto import ExecutionResultDTO, NsdDTO, WorkerTaskDTO
 from domain.ports import (
@@ -18,8 +16,17 @@ from domain.ports import (
     WorkerPoolPort,
 )
 from infrastructure.config import Config
-from infrastructure.helpers import FetchUtils, SaveStrategy
+from infrastructure.helpers import (
+    AsyncWorkerPool,
+    CheckpointStore,
+    FetchUtils,
+    PersistenceWriter,
+    ProcessWorkerPool,
+    SaveStrategy,
+)
 from infrastructure.helpers.data_cleaner import DataCleaner
+from infrastructure.helpers.transfer import downloaded_size
+from infrastructure.scrapers.html_parsers import parse_nsd_html
 
 
 class NsdScraper(NSDSourcePort):
@@ -33,9 +40,24 @@ class NsdScraper(NSDSourcePort):
         worker_pool_executor: WorkerPoolPort,
         metrics_collector: MetricsCollectorPort,
         repository: NSDRepositoryPort,
+        parse_pool: Optional[ProcessWorkerPool] = None,
+        fetch_utils: Optional[FetchUtils] = None,
+        writer: Optional[PersistenceWriter] = None,
+        checkpoint: Optional[CheckpointStore] = None,
     ):
         """Set up configuration, logger, and helper utilities for the
-        scraper."""
+        scraper.
+
+        ``parse_pool`` moves HTML parsing to worker processes while pages
+        are still fetched on the worker pool threads. ``fetch_utils`` lets
+        scrapers share one HTTP helper and its per-host controller.
+        ``writer`` runs the saves on a background thread. ``checkpoint``
+        records finished NSDs when a run is interrupted so the next one
+        resumes without probing or downloading them again. Pages parsed
+        while probing for the last NSD are kept for ``scraping.probe_memo_ttl``
+        seconds and handed to :meth:`fetch_all` instead of being downloaded
+        again.
+        """
         # Store configuration and logger for use throughout the scraper
         self.config = config
         self.logger = logger
@@ -43,12 +65,20 @@ class NsdScraper(NSDSourcePort):
         self.worker_pool_executor = worker_pool_executor
         self._metrics_collector = metrics_collector
         self.repository = repository
+        self.parse_pool = parse_pool
+        self.writer = writer
+        self.checkpoint = checkpoint
 
-        self.fetch_utils = FetchUtils(config, logger)
-        self.session = self.fetch_utils.create_scraper()
+        # Each worker thread uses its own keep-alive session from fetch_utils
+        self.fetch_utils = fetch_utils or FetchUtils(config, logger)
 
         self.nsd_endpoint = self.config.exchange.nsd_endpoint
 
+        # Probed pages by NSD: (time parsed, bytes downloaded, page size,
+        # parsed page); the response itself is not kept
+        self._probed: Dict[int, Tuple[float, int, int, Dict]] = {}
+        self._probed_lock = threading.Lock()
+
         # self.logger.log(f"Load Class {self.__class__.__name__}", level="info")
 
     @property
@@ -63,9 +93,19 @@ class NsdScraper(NSDSourcePort):
         save_callback: Optional[Callable[[List[NsdDTO]], None]] = None,
         start: int = 1,
         max_nsd: Optional[int] = None,
+        keep_results: bool = True,
         **kwargs,
     ) -> ExecutionResultDTO[NsdDTO]:
-        """Fetch and parse NSD pages using a worker queue."""
+        """Fetch and parse NSD pages using a worker queue.
+
+        With ``keep_results=False`` parsed pages are only handed to
+        ``save_callback`` and the returned ``items`` list is empty, keeping
+        memory flat over arbitrarily large NSD ranges.
+
+        When a previous run was interrupted and ``global_settings.resume``
+        is on, its checkpointed range is reused (no probing) and NSDs it
+        already finished are not requested again.
+        """
 
         # self.logger.log(
         #     "Run  Method controller.run()._nsd_service().run().sync_nsd_usecase.run().fetch_all()",
@@ -76,6 +116,18 @@ class NsdScraper(NSDSourcePort):
 
         start = max(start, max(self.skip_codes, default=0) + 1)
 
+        checkpoint = self.checkpoint
+        if checkpoint is not None and not self.config.global_settings.resume:
+            checkpoint.clear()
+        elif checkpoint is not None and checkpoint.load():
+            start = checkpoint.get("start", start)
+            max_nsd = checkpoint.get("max_nsd", max_nsd)
+            self.logger.log(
+                f"Resuming NSD {start}-{max_nsd}, "
+                f"{len(checkpoint.completed)} already done",
+                level="info",
+            )
+
         max_nsd_existing = max_nsd or self._find_last_existing_nsd(start=start) or 50
         max_nsd_probable = max_nsd or self._find_next_probable_nsd(start=start) or 50
         max_nsd = max(max_nsd_existing, max_nsd_probable)
@@ -85,56 +137,57 @@ class NsdScraper(NSDSourcePort):
         self.logger.log("Fetch NSD list", level="info")
 
         strategy: SaveStrategy[NsdDTO] = SaveStrategy(
-            save_callback, threshold, config=self.config
+            save_callback, threshold, config=self.config, writer=self.writer
         )
 
-        tasks = list(enumerate(range(start, max_nsd + 1)))
+        # Lazy task iterator; the pool pulls NSD numbers as workers free up
+        tasks = (
+            (index, nsd)
+            for index, nsd in enumerate(range(start, max_nsd + 1))
+            if checkpoint is None or not checkpoint.is_done(nsd)
+        )
+        size = max(max_nsd - start + 1, 0)
         start_time = time.perf_counter()
 
-        def processor(task: WorkerTaskDTO) -> Optional[NsdDTO]:
-            # self.logger.log(
-            #     "Run  Method controller.run()._nsd_service().run().sync_nsd_usecase.run().processor()",
-            #     level="info",
-            # )
-            nsd = task.data
-
-            progress = {
+        def progress_of(task: WorkerTaskDTO) -> Dict:
+            return {
                 "index": task.index,
-                "size": len(tasks),
+                "size": size,
                 "start_time": start_time,
             }
 
-            if nsd in self.skip_codes:
-                self.logger.log(
-                    f"{nsd}", level="info", progress=progress, worker_id=task.worker_id
-                )
-                return None
+        def done(nsd: int) -> None:
+            if checkpoint is not None:
+                checkpoint.mark(nsd)
 
-            url = self.nsd_endpoint.format(nsd=nsd)
+        def skip(task: WorkerTaskDTO) -> bool:
+            if task.data not in self.skip_codes:
+                return False
+            done(task.data)
+            self.logger.log(
+                f"{task.data}",
+                level="info",
+                progress=progress_of(task),
+                worker_id=task.worker_id,
+            )
+            return True
 
-            try:
-                response, self.session = self.fetch_utils.fetch_with_retry(
-                    self.session, url
-                )
-                self.metrics_collector.record_network_bytes(len(response.content))
+        def fail(task: WorkerTaskDTO, error: Exception) -> None:
+            self.logger.log(
+                f"Failed to fetch NSD {task.data}: {error}",
+                level="warning",
+                progress=progress_of(task),
+                worker_id=task.worker_id,
+            )
+            return None
 
-                # self.logger.log(
-                #     "Call Method controller.run()._nsd_service().run().sync_nsd_usecase.run().processor()_parse_html()",
-                #     level="info",
-                # )
-                parsed = self._parse_html(nsd, response.text)
-                # self.logger.log(
-                #     "End  Method controller.run()._nsd_service().run().sync_nsd_usecase.run().processor()._parse_html()",
-                #     level="info",
-                # )
-            except Exception as e:
-                self.logger.log(
-                    f"Failed to fetch NSD {nsd}: {e}",
-                    level="warning",
-                    progress=progress,
-                    worker_id=task.worker_id,
-                )
-                return None
+        def finish(task: WorkerTaskDTO, size: int, parsed: Dict) -> Optional[NsdDTO]:
+            nsd = task.data
+            progress = progress_of(task)
+
+            # A document not filed yet must be downloaded again next time
+            if not (parsed or {}).get("sent_date"):
+                self.fetch_utils.forget(self.nsd_endpoint.format(nsd=nsd))
 
             if parsed:
                 extra_info = [
@@ -147,7 +200,7 @@ class NsdScraper(NSDSourcePort):
                     parsed["sent_date"].strftime("%Y-%m-%d %H:%M:%S")
                     if parsed.get("sent_date") is not None
                     else "",
-                    str(len(response.content)),
+                    str(size),
                 ]
             else:
                 extra_info = []
@@ -159,13 +212,59 @@ class NsdScraper(NSDSourcePort):
                 worker_id=task.worker_id,
             )
 
-            # self.logger.log(
-            #     "End  Method controller.run()._nsd_service().run().sync_nsd_usecase.run().processor()",
-            #     level="info",
-            # )
-
+            done(nsd)
             return NsdDTO.from_dict(parsed)
 
+        def reuse(
+            task: WorkerTaskDTO, downloaded: int, size: int, parsed: Dict
+        ) -> NsdDTO:
+            # Pages already parsed by the probe are not requested again
+            self.metrics_collector.record_network_bytes(downloaded)
+            return finish(task, size, parsed)
+
+        def processor(task: WorkerTaskDTO) -> Optional[NsdDTO]:
+            if skip(task):
+                return None
+            probe = self._recall_probe(task.data)
+            if probe is not None:
+                return reuse(task, *probe)
+
+            url = self.nsd_endpoint.format(nsd=task.data)
+
+            try:
+                response, _ = self.fetch_utils.fetch_with_retry(None, url)
+                self.metrics_collector.record_network_bytes(downloaded_size(response))
+                parsed = self._parse_page(task.data, response.text)
+            except Exception as e:
+                return fail(task, e)
+
+            return finish(task, len(response.content), parsed)
+
+        async def async_processor(task: WorkerTaskDTO) -> Optional[NsdDTO]:
+            if skip(task):
+                return None
+            probe = self._recall_probe(task.data)
+            if probe is not None:
+                return reuse(task, *probe)
+
+            url = self.nsd_endpoint.format(nsd=task.data)
+
+            try:
+                response, _ = await async_fetch_utils.fetch_with_retry(
+                    None, url, worker_id=task.worker_id
+                )
+                self.metrics_collector.record_network_bytes(downloaded_size(response))
+                if self.parse_pool is not None:
+                    parsed = await self.parse_pool.call_async(
+                        parse_nsd_html, task.data, response.text, self.data_cleaner
+                    )
+                else:
+                    parsed = self._parse_html(task.data, response.text)
+            except Exception as e:
+                return fail(task, e)
+
+            return finish(task, len(response.content), parsed)
+
         def handle_batch(item: Optional[NsdDTO]) -> None:
             if item is not None:
                 strategy.handle([item])
@@ -176,11 +275,19 @@ class NsdScraper(NSDSourcePort):
         #     "Call Method controller.run()._nsd_service().run().sync_nsd_usecase.run().worker_pool_executor.run()",
         #     level="info",
         # )
+        # The asyncio engine keeps hundreds of probes in flight on one thread
+        async_fetch_utils = (
+            self.worker_pool_executor.fetch_utils
+            if isinstance(self.worker_pool_executor, AsyncWorkerPool)
+            else None
+        )
+
         exec_result = self.worker_pool_executor.run(
             tasks=tasks,
-            processor=processor,
+            processor=async_processor if async_fetch_utils else processor,
             logger=self.logger,
             on_result=handle_batch,
+            keep_results=keep_results,
         )
         # self.logger.log(
         #     "End  Method controller.run()._nsd_service().run().sync_nsd_usecase.run().worker_pool_executor.run()",
@@ -189,6 +296,17 @@ class NsdScraper(NSDSourcePort):
 
         strategy.finalize()
 
+        # Probes outside the fetched range are of no further use
+        with self._probed_lock:
+            self._probed.clear()
+
+        # Everything marked done is saved now; keep the position if stopped
+        if checkpoint is not None:
+            if exec_result.interrupted:
+                checkpoint.save(start=start, max_nsd=max_nsd)
+            else:
+                checkpoint.clear()
+
         # self.logger.log(
         #     f"Downloaded {self.metrics_collector.network_bytes} bytes",
         #     level="info",
@@ -201,72 +319,23 @@ class NsdScraper(NSDSourcePort):
         #     level="info",
         # )
 
-        return ExecutionResultDTO(items=results, metrics=exec_result.metrics)
+        return ExecutionResultDTO(
+            items=results,
+            metrics=exec_result.metrics,
+            dead_letters=exec_result.dead_letters,
+            deadline_reached=exec_result.deadline_reached,
+            interrupted=exec_result.interrupted,
+        )
 
     def _parse_html(self, nsd: int, html: str) -> Dict:
         """Parse NSD HTML into a dictionary."""
-        soup = BeautifulSoup(html, "html.parser")
-
-        def text_of(selector: str) -> Optional[str]:
-            el = soup.select_one(selector)
-            return el.get_text(strip=True) if el else None
-
-        sent_date = text_of("#lblDataEnvio")
-        if not sent_date:
-            return {}
-
-        # from DTO
-        data: Dict[str, str | int | datetime | None] = {
-            "nsd": nsd,
-            "company_name": self.data_cleaner.clean_text(text_of("#lblNomeCompanhia")),
-            # quarter e sent_date serão preenchidos depois
-            "quarter": None,
-            "version": None,
-            "nsd_type": None,
-            "dri": None,
-            "auditor": None,
-            "responsible_auditor": self.data_cleaner.clean_text(
-                text_of("#lblResponsavelTecnico")
-            ),
-            "protocol": text_of("#lblProtocolo"),
-            "sent_date": None,
-            "reason": self.data_cleaner.clean_text(
-                text_of("#lblMotivoCancelamentoReapresentacao")
-            ),
-        }
-
-        # Limpeza do padrão FCA
-        dri = self.data_cleaner.clean_text(text_of("#lblNomeDRI")) or ""
-        dri_pattern = r"\s+FCA(?:\s+V\d+)?\b"
-        data["dri"] = re.sub(dri_pattern, "", dri)
-        data["dri"] = re.sub(r"\s{2,}", " ", data["dri"]).strip()
-
-        auditor = self.data_cleaner.clean_text(text_of("#lblAuditor")) or ""
-        auditor_pattern = r"\s+FCA\s+\d{4}(?:\s+V\d+)?\b"
-        data["auditor"] = re.sub(auditor_pattern, "", auditor)
-        data["auditor"] = re.sub(r"\s{2,}", " ", data["auditor"]).strip()
-
-        quarter = text_of("#lblDataDocumento")
-        if quarter and quarter.strip().isdigit() and len(quarter.strip()) == 4:
-            quarter = f"31/12/{quarter.strip()}"
-        data["quarter"] = self.data_cleaner.clean_date(quarter) if quarter else None
-
-        nsd_type_version = text_of("#lblDescricaoCategoria")
-        if nsd_type_version:
-            parts = [p.strip() for p in nsd_type_version.split(" - ")]
-            if len(parts) >= 2:
-                data["version"] = (
-                    self.data_cleaner.clean_text(parts[-1]) if parts[-1] else None
-                )
-                data["nsd_type"] = (
-                    self.data_cleaner.clean_text(parts[0]) if parts[0] else None
-                )
-
-        data["sent_date"] = (
-            self.data_cleaner.clean_date(sent_date) if sent_date else None
-        )
+        return parse_nsd_html(nsd, html, self.data_cleaner)
 
-        return data
+    def _parse_page(self, nsd: int, html: str) -> Dict:
+        """Parse NSD HTML on ``parse_pool`` when available, else inline."""
+        if self.parse_pool is not None:
+            return self.parse_pool.call(parse_nsd_html, nsd, html, self.data_cleaner)
+        return self._parse_html(nsd, html)
 
     def _find_last_existing_nsd(self, start: int = 1, max_limit: int = 10**10) -> int:
         """Return the nsd_highest NSD number that exists.
@@ -328,21 +397,61 @@ class NsdScraper(NSDSourcePort):
         return nsd_low
 
     def _try_nsd(self, nsd: int) -> Optional[dict]:
-        """Attempt to fetch and parse a single NSD page."""
+        """Attempt to fetch and parse a single NSD page.
+
+        Parsed pages, valid or not, are remembered for :meth:`fetch_all`;
+        a page probed twice is only downloaded once.
+        """
         try:
-            # Request the NSD page and parse its HTML
             url = self.nsd_endpoint.format(nsd=nsd)
-            response, self.session = self.fetch_utils.fetch_with_retry(
-                self.session, url
-            )
-            parsed = self._parse_html(nsd, response.text)
+            probe = self._recall_probe(nsd, consume=False)
+            if probe is not None:
+                _, _, parsed = probe
+            else:
+                # Request the NSD page and parse its HTML
+                response, _ = self.fetch_utils.fetch_with_retry(None, url)
+                parsed = self._parse_html(nsd, response.text)
+                with self._probed_lock:
+                    self._probed[nsd] = (
+                        time.monotonic(),
+                        downloaded_size(response),
+                        len(response.content),
+                        parsed,
+                    )
 
             # Only return results if the page contains a "sent_date" field
-            return parsed if parsed.get("sent_date") else None
+            if not parsed.get("sent_date"):
+                self.fetch_utils.forget(url)
+                return None
+            return parsed
         except Exception:
             # Ignore any network or parsing errors
             return None
 
+    def _recall_probe(
+        self, nsd: int, consume: bool = True
+    ) -> Optional[Tuple[int, int, Dict]]:
+        """Return the bytes downloaded, page size and parsed page probed
+        for ``nsd``.
+
+        Args:
+            nsd: NSD number probed by :meth:`_try_nsd`.
+            consume: Whether to drop the entry once returned.
+
+        Returns:
+            Optional[Tuple[int, int, Dict]]: ``None`` when ``nsd`` was not probed
+            or its entry is older than ``scraping.probe_memo_ttl``.
+        """
+        with self._probed_lock:
+            entry = self._probed.pop(nsd, None) if consume else self._probed.get(nsd)
+            if entry is None:
+                return None
+            parsed_at, downloaded, size, parsed = entry
+            if time.monotonic() - parsed_at > self.config.scraping.probe_memo_ttl:
+                self._probed.pop(nsd, None)
+                return None
+        return downloaded, size, parsed
+
     def _find_next_probable_nsd(
         self,
         start: int = 1,
@@ -371,8 +480,10 @@ class NsdScraper(NSDSourcePort):
 
         first_pk = min(self.skip_codes, key=lambda n: int(n))
         last_pk = max(self.skip_codes, key=lambda n: int(n))
-        first_date = self.repository.get_by_id(str(first_pk)).sent_date
-        last_date = self.repository.get_by_id(str(last_pk)).sent_date
+        # Both records in one query
+        bounds = self.repository.get_many([str(first_pk), str(last_pk)])
+        first_date = bounds[str(first_pk)].sent_date
+        last_date = bounds[str(last_pk)].sent_date
 
         # Days span between dates
         total_span_days = (last_date - first_date).days or 1  # type: ignore[assignment]
@@ -2,23 +2,34 @@
 
 from __future__ import annotations
 
-import re
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 
 # import pandas as pd
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 
 from domain.dto import WorkerTaskDTO
 from domain.dto.nsd_dto import NsdDTO
 from domain.dto.raw_statement_dto import RawStatementDTO
-from domain.ports import LoggerPort, MetricsCollectorPort, RawStatementScraperPort
+from domain.ports import (
+    LoggerPort,
+    MetricsCollectorPort,
+    RawStatementScraperPort,
+    WorkerPoolPort,
+)
 from infrastructure.config import Config
-from infrastructure.helpers import WorkerPool
+from infrastructure.helpers import AsyncWorkerPool, ProcessWorkerPool
 from infrastructure.helpers.data_cleaner import DataCleaner
 from infrastructure.helpers.fetch_utils import FetchUtils
 from infrastructure.helpers.time_utils import TimeUtils
+from infrastructure.helpers.transfer import downloaded_size
+from infrastructure.scrapers.html_parsers import (
+    extract_hash,
+    is_blocked,
+    parse_statement_html,
+    parse_statement_soup,
+)
 from infrastructure.utils.id_generator import IdGenerator
 
 
@@ -31,17 +42,25 @@ class RawStatementScraper(RawStatementScraperPort):
         logger: LoggerPort,
         data_cleaner: DataCleaner,
         metrics_collector: MetricsCollectorPort,
-        worker_pool_executor: WorkerPool,
+        worker_pool_executor: WorkerPoolPort,
+        parse_pool: Optional[ProcessWorkerPool] = None,
+        fetch_utils: Optional[FetchUtils] = None,
     ) -> None:
-        """Create the adapter with its configuration and logger."""
+        """Create the adapter with its configuration and logger.
+
+        ``parse_pool`` moves BeautifulSoup parsing to worker processes while
+        statement pages are still fetched on the worker pool threads.
+        ``fetch_utils`` lets scrapers share one HTTP helper and therefore
+        one per-host concurrency controller.
+        """
         self.config = config
         self.logger = logger
         self.data_cleaner = data_cleaner
         self._metrics_collector = metrics_collector
         self.worker_pool_executor = worker_pool_executor
-        self.fetch_utils = FetchUtils(config, logger)
+        self.parse_pool = parse_pool
+        self.fetch_utils = fetch_utils or FetchUtils(config, logger)
         self.time_utils = TimeUtils(self.config)
-        self.session = self.fetch_utils.create_scraper()
         self.endpoint = f"{self.config.exchange.nsd_endpoint}"
         self.statements_config = self.config.statements
         self.id_generator = IdGenerator(config=config)
@@ -58,87 +77,41 @@ class RawStatementScraper(RawStatementScraperPort):
         self, soup: BeautifulSoup, group: str
     ) -> List[Dict[str, Any]]:
         """Return parsed rows from a statement ``soup``."""
-        rows: List[Dict[str, Any]] = []
-
-        # Default parsing for Capital Composition page
-        if group == "Dados da Empresa":
-            thousand = 1
-            table = soup.find("div", id="UltimaTabela")
-            if isinstance(table, Tag):
-                text = table.get_text()
-                if "Mil" in text:
-                    thousand = 1000
-
-            def value_from(elem_id: str) -> float:
-                element = soup.find(id=elem_id)
-                if element is None:
-                    return 0.0
-                value = self.data_cleaner.clean_number(element.get_text())
-                result = thousand * value
-                return result if result is not None else 0.0
-
-            for item in self.statements_config.capital_items:
-                rows.append(
-                    {
-                        "account": item["account"],
-                        "description": item["description"],
-                        "value": value_from(item["elem_id"]),
-                    }
-                )
-            return rows
-
-        # Default parsing for DFs pages
-        thousand = 1
-        title_element = soup.find(id="TituloTabelaSemBorda")
-        if isinstance(title_element, Tag):
-            title = title_element.get_text(strip=True)
-            if "Mil" in title:
-                thousand = 1000
-
-        table = soup.find("table", id="ctl00_cphPopUp_tbDados")
-        if not table:
-            return rows
-
-        if isinstance(table, Tag):
-            table_rows = table.find_all("tr")
-            for row in table_rows:
-                cols = [c.get_text(strip=True) for c in row.find_all("td")]
-                # ignora linhas cujo account não começa com dígito
-                if len(cols) < 3:
-                    continue
-                if not cols[0] or not cols[0][0].isdigit():
-                    continue
-                account, account_description, account_value = cols[0], cols[1], cols[2]
-                rows.append(
-                    {
-                        "account": account,
-                        "description": account_description,
-                        "value": (self.data_cleaner.clean_number(account_value) or 0.0)
-                        * thousand,
-                    }
-                )
-
-        return rows
+        return parse_statement_soup(
+            soup, group, self.statements_config.capital_items, self.data_cleaner
+        )
 
     def _extract_hash(self, html: str) -> str:
         """Extract the hidden hash value from the HTML response."""
-        soup = BeautifulSoup(html, "html.parser")
-        # hash in element
-        element = soup.select_one("#hdnHash")
-        if element:
-            value = element.get("value")
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-
-        # hash in form
-        form = soup.select_one("form[action*='Hash=']")
-        if form:
-            action_url = form.get("action", "")
-            match = re.search(r"[?&]Hash=([a-zA-Z0-9_-]+)", str(action_url))
-            if match:
-                return match.group(1)
-
-        return ""
+        if self.parse_pool is not None:
+            return self.parse_pool.call(extract_hash, html)
+        return extract_hash(html)
+
+    def _parse_page(self, html: str, group: str) -> Tuple[bool, List[Dict[str, Any]]]:
+        """Parse a statement page on ``parse_pool`` when available.
+
+        Returns:
+            tuple: ``(blocked, rows)`` as produced by ``parse_statement_html``.
+        """
+        args = (html, group, self.statements_config.capital_items, self.data_cleaner)
+        if self.parse_pool is not None:
+            return self.parse_pool.call(parse_statement_html, *args)
+        return parse_statement_html(*args)
+
+    async def _extract_hash_async(self, html: str) -> str:
+        """Event-loop counterpart of :meth:`_extract_hash`."""
+        if self.parse_pool is not None:
+            return await self.parse_pool.call_async(extract_hash, html)
+        return extract_hash(html)
+
+    async def _parse_page_async(
+        self, html: str, group: str
+    ) -> Tuple[bool, List[Dict[str, Any]]]:
+        """Event-loop counterpart of :meth:`_parse_page`."""
+        args = (html, group, self.statements_config.capital_items, self.data_cleaner)
+        if self.parse_pool is not None:
+            return await self.parse_pool.call_async(parse_statement_html, *args)
+        return parse_statement_html(*args)
 
     def _build_urls(
         self, row: NsdDTO, items: list, hash_value: str
@@ -195,19 +168,53 @@ class RawStatementScraper(RawStatementScraperPort):
             print(e)
         return result
 
+    def _blocked(self, html: str, soup: BeautifulSoup) -> bool:
+        """Return ``True`` when the server answered with its block page."""
+        return is_blocked(html, soup)
+
+    def _build_rows(
+        self, row: NsdDTO, item: dict[str, str], parsed: List[Dict[str, Any]]
+    ) -> List[RawStatementDTO]:
+        """Convert parsed statement rows into ``RawStatementDTO`` rows."""
+        quarter = row.quarter.strftime("%Y-%m-%d") if row.quarter else None
+
+        return [
+            RawStatementDTO(
+                nsd=row.nsd,
+                company_name=row.company_name,
+                quarter=quarter,
+                version=row.version,
+                grupo=item["grupo"],
+                quadro=item["quadro"],
+                account=r["account"],
+                description=r["description"],
+                value=r["value"],
+            )
+            for r in parsed
+        ]
+
     def fetch(self, task: WorkerTaskDTO) -> dict[str, Any]:
         """Fetch statement pages for the given NSD and return parsed rows."""
+        # Hand the I/O to the event loop when running on the asyncio engine
+        if (
+            isinstance(self.worker_pool_executor, AsyncWorkerPool)
+            and self.worker_pool_executor.fetch_utils is not None
+        ):
+            return self.worker_pool_executor.run_coroutine(self.fetch_async(task))
+
         # self.logger.log("Run  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all().processor().source.fetch()", level="info")
         row = task.data
 
         url = self.endpoint.format(nsd=row.nsd)
         start = time.perf_counter()
 
-        response, self.session = self.fetch_utils.fetch_with_retry(
-            self.session, url, cache_bypass=True
+        # The worker thread's own keep-alive session
+        session = self.fetch_utils.session()
+        response, session = self.fetch_utils.fetch_with_retry(
+            session, url, cache_bypass=True
         )
 
-        download = len(response.content)
+        download = downloaded_size(response)
         self.metrics_collector.record_network_bytes(download)
 
         hash_value = self._extract_hash(response.text)
@@ -222,50 +229,39 @@ class RawStatementScraper(RawStatementScraperPort):
         for i in range(len(statements_urls)):
             item = statements_urls[i]
 
-            quarter = row.quarter.strftime("%Y-%m-%d") if row.quarter else None
-            attempt = 0
-            # loop infinito até conseguir um response não bloqueado
+            # repete até um response não bloqueado, dentro da política de retry
+            retry = self.fetch_utils.retry_policy.start()
             while True:
-                attempt += 1
-                # 1) tentativa de fetch
-                response, self.session = self.fetch_utils.fetch_with_retry(
-                    self.session,
+                # 1) tentativa de fetch (páginas entregues vêm do cache)
+                response, session = self.fetch_utils.fetch_with_retry(
+                    session,
                     url=item["url"],
-                    cache_bypass=True,
                     worker_id=task.worker_id,
                 )
                 # 2) registra bytes baixados
-                download = len(response.content)
+                download = downloaded_size(response)
                 self.metrics_collector.record_network_bytes(download)
 
-                # 3) parse do HTML
-                soup = BeautifulSoup(response.text, "html.parser")
+                # 3) parse do HTML (em outro processo quando houver parse_pool)
+                blocked, parsed = self._parse_page(response.text, item["grupo"])
 
                 # 4) checa se houve bloqueio
-                blocked = (
-                    "MensagemModal" in response.text
-                    or "acesse este conteúdo pela página principal dos documentos"
-                    in soup.get_text()
-                )
-
                 if not blocked:
                     # Sucesso: podemos sair do loop
-                    # self.logger.log(
-                    #     f"{row.nsd} {row.company_name} {quarter} {row.version} - {i} {item['grupo']} {item['quadro']}",
-                    #     level="info",
-                    #     worker_id=task.worker_id,
-                    # )
                     break
 
                 # --- caso de bloqueio: prepara nova tentativa ---
-                # 5) recria a sessão (novo scraper)
-                self.session = self.fetch_utils.create_scraper()
+                # 4b) avisa o controlador: todos os workers do host pausam
+                self.fetch_utils.report_block(item["url"])
+
+                # 5) recria a sessão (novo scraper) desta thread
+                session = self.fetch_utils.rotate_session()
 
                 # 6) faz um novo fetch para extrair o hash atualizado
-                response_retry, self.session = self.fetch_utils.fetch_with_retry(
-                    self.session, url, cache_bypass=True
+                response_retry, session = self.fetch_utils.fetch_with_retry(
+                    session, url, cache_bypass=True
                 )
-                download = len(response_retry.content)
+                download = downloaded_size(response_retry)
                 self.metrics_collector.record_network_bytes(download)
 
                 # 7) extrai novo hash
@@ -278,40 +274,14 @@ class RawStatementScraper(RawStatementScraperPort):
                     )
                     item = statements_urls[i]
 
-                # self.logger.log(
-                #     f"{row.nsd} {row.company_name} {quarter} {row.version} - {i} {item['grupo']} {item['quadro']} retry {attempt}",
-                #     level="warning",
-                #     worker_id=task.worker_id
-                # )
-
-                # 8) espera dinamicamente, aumentando o multiplicador a cada retry
-                self.time_utils.sleep_dynamic(multiplier=attempt)
+                # 9) espera com backoff e jitter; desiste ao fim das tentativas
+                retry.sleep()
                 # e repete até obter sucesso
 
             # A partir daqui, `response` e `item` já estão válidos (não bloqueados)
-            result: dict[str, Any] = {"nsd": row, "statements": []}
-
-            rows = self._parse_statement_page(soup, item["grupo"])
-            parsed_rows = []
-
-            for r in rows:
-                dto = RawStatementDTO(
-                    nsd=row.nsd,
-                    company_name=row.company_name,
-                    quarter=quarter,
-                    version=row.version,
-                    grupo=item["grupo"],
-                    quadro=item["quadro"],
-                    account=r["account"],
-                    description=r["description"],
-                    value=r["value"],
-                )
-                parsed_rows.append(dto)
-
-            statements_rows_dto.extend(parsed_rows)
+            statements_rows_dto.extend(self._build_rows(row, item, parsed))
 
         _elapsed = time.perf_counter() - start
-        quarter = row.quarter.strftime("%Y-%m-%d") if row.quarter else None
         # self.logger.log(
         #     f"{row.nsd} {row.company_data_name} {quarter} {row.version} in {elapsed:.2f}s",
         #     level="info",
@@ -321,3 +291,63 @@ class RawStatementScraper(RawStatementScraperPort):
         # self.logger.log("End  Method controller.run()._statement_service().statements_fetch_service.run().fetch_usecase.run().fetch_all().processor().source.fetch()", level="info")
 
         return result
+
+    async def fetch_async(self, task: WorkerTaskDTO) -> dict[str, Any]:
+        """Event-loop counterpart of :meth:`fetch` for the asyncio engine."""
+        fetch_utils = self.worker_pool_executor.fetch_utils
+        row = task.data
+
+        url = self.endpoint.format(nsd=row.nsd)
+
+        response, session = await fetch_utils.fetch_with_retry(
+            None, url, cache_bypass=True, worker_id=task.worker_id
+        )
+        self.metrics_collector.record_network_bytes(downloaded_size(response))
+
+        hash_value = await self._extract_hash_async(response.text)
+
+        statement_items = self.config.statements.statement_items
+        statements_urls = self._build_urls(row, statement_items, hash_value)
+
+        statements_rows_dto: List[RawStatementDTO] = []
+
+        for i in range(len(statements_urls)):
+            item = statements_urls[i]
+
+            retry = fetch_utils.retry_policy.start()
+            while True:
+                # Filed statement pages may come from the response cache
+                response, session = await fetch_utils.fetch_with_retry(
+                    session, url=item["url"], worker_id=task.worker_id
+                )
+                self.metrics_collector.record_network_bytes(downloaded_size(response))
+
+                blocked, parsed = await self._parse_page_async(
+                    response.text, item["grupo"]
+                )
+                if not blocked:
+                    break
+
+                # Blocked: pause the host for every worker, start a fresh
+                # session and refresh the hash
+                fetch_utils.report_block(item["url"])
+                session = await fetch_utils.rotate_session(session)
+                response_retry, session = await fetch_utils.fetch_with_retry(
+                    session, url, cache_bypass=True, worker_id=task.worker_id
+                )
+                self.metrics_collector.record_network_bytes(
+                    downloaded_size(response_retry)
+                )
+
+                hash_retry_value = await self._extract_hash_async(response_retry.text)
+                if hash_value != hash_retry_value:
+                    statements_urls = self._build_urls(
+                        row, statement_items, hash_retry_value or hash_value
+                    )
+                    item = statements_urls[i]
+
+                await retry.sleep_async()
+
+            statements_rows_dto.extend(self._build_rows(row, item, parsed))
+
+        return {"nsd": row, "statements": statements_rows_dto}
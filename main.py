@@ -47,6 +47,9 @@ def main() -> None:
             "Finish Project FLY",
             level="info",
         )
+    except KeyboardInterrupt:  # pragma: no cover
+        # Second signal: the graceful shutdown was abandoned
+        logger.log("Interrupted", level="warning")
     except Exception as e:  # pragma: no cover
         logger.log(f"Erro {e}", level="info", show_path=True)
 
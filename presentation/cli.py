@@ -8,9 +8,26 @@ from application.services.statement_fetch_service import StatementFetchService
 # from application.services.statement_parse_service import StatementParseService
 from domain.ports import LoggerPort
 from infrastructure.config import Config
-from infrastructure.helpers import WorkerPool
+from infrastructure.helpers import (
+    AsyncFetchUtils,
+    AsyncWorkerPool,
+    CheckpointStore,
+    ConnectivityMonitor,
+    FetchUtils,
+    HostConcurrencyController,
+    PersistenceWriter,
+    ProcessWorkerPool,
+    RateLimiter,
+    RequestHedger,
+    ResponseCache,
+    RetryPolicy,
+    ShutdownSignal,
+    SingleFlight,
+    WorkerPool,
+)
 from infrastructure.helpers.metrics_collector import MetricsCollector
 from infrastructure.repositories import (
+    EngineRegistry,
     SqlAlchemyCompanyDataRepository,
     SqlAlchemyNsdRepository,
     SqlAlchemyParsedStatementRepository,
@@ -49,15 +66,110 @@ class CLIAdapter:
         self.collector = MetricsCollector()
         # self.logger.log("End Instance collector", level="info")
 
-        # Build worker pool for concurrent task execution
-        # self.logger.log("Instantiate worker_pool_executor", level="info")
-        self.worker_pool_executor = WorkerPool(
+        # SIGINT/SIGTERM stop the pools cleanly instead of killing the run
+        self.shutdown = ShutdownSignal(self.logger)
+
+        # Shared AIMD controller: per-host limits adapt to blocks and latency
+        max_workers = self.config.global_settings.max_workers or 1
+        self.concurrency_controller = None
+        if self.config.scraping.adaptive_concurrency:
+            self.concurrency_controller = HostConcurrencyController(self.config)
+            # The pool only bounds the controller, which picks the real limit
+            max_workers = max(max_workers, self.config.scraping.concurrency_max)
+
+        # Token buckets spread requests evenly at each host's tolerated rate
+        self.rate_limiter = RateLimiter(self.config)
+
+        # One connectivity verdict shared by every worker and helper
+        self.connectivity = ConnectivityMonitor(self.config)
+
+        # Filed documents never change, so re-runs read them from disk
+        self.response_cache = (
+            ResponseCache(self.config, metrics_collector=self.collector)
+            if self.config.scraping.response_cache
+            else None
+        )
+
+        # Bounded, jittered retries drawing on one budget for the whole run
+        self.retry_policy = RetryPolicy(self.config)
+
+        # Slow requests get a duplicate on another session, capped per run
+        self.hedger = (
+            RequestHedger(self.config) if self.config.scraping.hedge_requests else None
+        )
+
+        # Concurrent downloads of the same URL share one request
+        self.flights = SingleFlight()
+
+        # One HTTP helper for every scraper so they report to one controller
+        self.fetch_utils = FetchUtils(
             self.config,
+            self.logger,
+            controller=self.concurrency_controller,
+            rate_limiter=self.rate_limiter,
+            pool_size=max_workers,
+            connectivity=self.connectivity,
+            cache=self.response_cache,
             metrics_collector=self.collector,
-            max_workers=self.config.global_settings.max_workers or 1,
+            retry_policy=self.retry_policy,
+            hedger=self.hedger,
+            flights=self.flights,
         )
+
+        # Build worker pool for concurrent task execution
+        # self.logger.log("Instantiate worker_pool_executor", level="info")
+        if self.config.global_settings.execution_backend == "async":
+            # Event-loop engine: hundreds of requests in flight on one thread
+            self.worker_pool_executor = AsyncWorkerPool(
+                self.config,
+                metrics_collector=self.collector,
+                max_workers=max_workers,
+                fetch_utils=AsyncFetchUtils(
+                    self.config,
+                    self.logger,
+                    controller=self.concurrency_controller,
+                    rate_limiter=self.rate_limiter,
+                    connectivity=self.connectivity,
+                    cache=self.response_cache,
+                    metrics_collector=self.collector,
+                    retry_policy=self.retry_policy,
+                    hedger=self.hedger,
+                    flights=self.flights,
+                ),
+                shutdown=self.shutdown,
+            )
+        else:
+            self.worker_pool_executor = WorkerPool(
+                self.config,
+                metrics_collector=self.collector,
+                max_workers=max_workers,
+                shutdown=self.shutdown,
+            )
         # self.logger.log("End Instance worker_pool_executor", level="info")
 
+        # Optional process pool so HTML parsing runs on every core
+        parse_workers = self.config.global_settings.parse_workers
+        self.parse_pool = (
+            ProcessWorkerPool(
+                self.config,
+                metrics_collector=self.collector,
+                max_workers=parse_workers,
+                shutdown=self.shutdown,
+            )
+            if parse_workers
+            else None
+        )
+
+        # One writer thread owns every repository save, so SQLite commits
+        # never hold the worker pool lock
+        self.writer = (
+            PersistenceWriter(
+                self.config, self.logger, metrics_collector=self.collector
+            )
+            if self.config.global_settings.writer_queue_size
+            else None
+        )
+
         # self.logger.log(f"Load Class {self.__class__.__name__}", level="info")
 
     def start_fly(self) -> None:
@@ -77,7 +189,21 @@ class CLIAdapter:
 
         # Fetch and optionally parse statements
         # self.logger.log("Call Method controller.run()._statement_service()", level="info")
-        self._statement_service()
+        # The first signal drains in-flight work, flushes every strategy and
+        # writes checkpoints; the next run resumes from them
+        try:
+            with self.shutdown:
+                self._statement_service()
+        finally:
+            self.fetch_utils.close()
+            if self.response_cache is not None:
+                self.response_cache.close()
+            if self.writer is not None:
+                self.writer.close()
+            if self.parse_pool is not None:
+                self.parse_pool.close()
+            # After the writer drained, so no save loses its connection
+            EngineRegistry.dispose_all()
         # self.logger.log("End  Method controller.run()._statement_service()", level="info")
 
         # self.logger.log("End  Method controller.run()", level="info")
@@ -108,6 +234,8 @@ class CLIAdapter:
             mapper=mapper,
             worker_pool_executor=self.worker_pool_executor,
             metrics_collector=self.collector,
+            fetch_utils=self.fetch_utils,
+            writer=self.writer,
         )
         # self.logger.log("End Instance company_scraper (mapper, worker_pool_executor, collector)", level="info")
 
@@ -146,6 +274,10 @@ class CLIAdapter:
             repository=nsd_repo,
             worker_pool_executor=self.worker_pool_executor,
             metrics_collector=self.collector,
+            parse_pool=self.parse_pool,
+            fetch_utils=self.fetch_utils,
+            writer=self.writer,
+            checkpoint=CheckpointStore(self.config, "nsd"),
         )
         # self.logger.log("End Instance nsd_scraper (worker_pool_executor, collector, nsd_repo)", level="info")
 
@@ -200,6 +332,8 @@ class CLIAdapter:
             data_cleaner=self.data_cleaner,
             metrics_collector=self.collector,
             worker_pool_executor=self.worker_pool_executor,
+            parse_pool=self.parse_pool,
+            fetch_utils=self.fetch_utils,
         )
         # self.logger.log("End Instance source", level="info")
 
@@ -215,15 +349,42 @@ class CLIAdapter:
             parsed_statements_repo=parsed_statement_repo,
             metrics_collector=self.collector,
             worker_pool_executor=self.worker_pool_executor,
+            writer=self.writer,
+            checkpoint=CheckpointStore(self.config, "statements"),
+            shutdown=self.shutdown,
+            retry_policy=self.retry_policy,
         )
 
-        # Execute fetch process and log total rows fetched
+        # Fetch, parse and persist in one overlapped pass: fetch threads
+        # (parsing HTML on parse_pool), a parse thread and one SQLite writer
+        # connected by bounded queues
         # self.logger.log("Call Method controller.run()._statement_service().statements_fetch_service.run()", level="info")
-        raw_rows = statements_fetch_service.fetch_statements()
-
-        self.logger.log(f"total {len(raw_rows)}")
+        statements_fetch_service.sync_statements()
+
+        self.logger.log(f"total {self.collector.network_bytes} bytes")
+        metrics = self.collector.get_metrics(elapsed_time=0)
+        self.logger.log(
+            f"{metrics.commits} commits in {metrics.commit_time:.2f}s "
+            f"(max {metrics.commit_latency_max:.2f}s), "
+            f"write queue peak {metrics.write_queue_peak}"
+        )
+        self.logger.log(
+            f"response cache: {metrics.cache_hits} hits, "
+            f"{metrics.cache_misses} misses"
+        )
+        self.logger.log(
+            f"{self.retry_policy.retries} retries for "
+            f"{self.retry_policy.requests} requests"
+        )
+        if self.hedger is not None:
+            self.logger.log(
+                f"{self.hedger.hedges} hedged requests, "
+                f"{self.hedger.hedge_wins} answered first"
+            )
+        self.logger.log(f"{self.flights.shared} requests shared an in-flight download")
+        for endpoint, (wire, decoded) in sorted(metrics.endpoint_bytes.items()):
+            self.logger.log(f"{endpoint}: {wire} bytes on the wire, {decoded} decoded")
         # self.logger.log("End  Method controller.run()._statement_service().statements_fetch_service.run()", level="info")
 
-        # Parsing step is not yet enabled
-        # parse_service = StatementParseService(...)
-        # parse_service.parse_statements(raw_rows)
+        # Parsing runs as the pipeline's parse stage; StatementParseService
+        # remains for parsing rows fetched earlier
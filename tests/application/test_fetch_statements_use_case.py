@@ -1,6 +1,10 @@
+from datetime import datetime
 from unittest.mock import MagicMock
 
-from application.usecases.fetch_statements import FetchStatementsUseCase
+from application.usecases.fetch_statements import (
+    FetchStatementsUseCase,
+    statement_priority,
+)
 from domain.dto.nsd_dto import NsdDTO
 from domain.ports import (
     RawStatementScraperPort,
@@ -10,18 +14,18 @@ from infrastructure.repositories import SqlAlchemyRawStatementRepository
 from tests.conftest import DummyConfig, DummyLogger
 
 
-def _make_nsd(nsd: int) -> NsdDTO:
+def _make_nsd(nsd: int, version=None, sent_date=None) -> NsdDTO:
     return NsdDTO(
         nsd=str(nsd),
         company_name=None,
         quarter=None,
-        version=None,
+        version=version,
         nsd_type=None,
         dri=None,
         auditor=None,
         responsible_auditor=None,
         protocol=None,
-        sent_date=None,
+        sent_date=sent_date,
         reason=None,
     )
 
@@ -54,6 +58,128 @@ def test_fetch_statement_rows_skips_existing(monkeypatch):
 
     stmt_repo.get_all_primary_keys.assert_not_called()
     mock_fetch_all.assert_called_once_with(
-        targets=targets, save_callback="cb", threshold=5
+        targets=targets, save_callback="cb", threshold=5, keep_results=True
     )
     assert result == mock_fetch_all.return_value
+
+
+def test_statement_priority_prefers_new_filings_then_representations():
+    now = datetime(2024, 6, 1)
+    old_gap = _make_nsd(1, version="1", sent_date=datetime(2020, 5, 1))
+    representation = _make_nsd(2, version="2", sent_date=datetime(2024, 5, 20))
+    older_new = _make_nsd(3, version="1", sent_date=datetime(2024, 4, 1))
+    newest = _make_nsd(4, version="1", sent_date=datetime(2024, 5, 30))
+    undated = _make_nsd(5)
+
+    targets = [old_gap, undated, representation, older_new, newest]
+    ranked = sorted(targets, key=statement_priority(now=now))
+
+    assert [t.nsd for t in ranked] == ["4", "3", "2", "1", "5"]
+
+
+def test_sync_statements_persists_raw_and_parsed_rows_in_one_pass():
+    from domain.dto.raw_statement_dto import RawStatementDTO
+    from infrastructure.helpers import MetricsCollector
+
+    def fetch(task):
+        row = RawStatementDTO(
+            nsd=task.data.nsd,
+            company_name="ACME",
+            quarter="2024-03-31",
+            version="1",
+            grupo="DFs",
+            quadro="BPA",
+            account="1.01",
+            description="Ativo",
+            value=10.0,
+        )
+        return {"nsd": task.data, "statements": [row]}
+
+    source = MagicMock(spec=RawStatementScraperPort)
+    source.fetch.side_effect = fetch
+    raw_saved, parsed_saved = [], []
+    raw_repo = MagicMock()
+    raw_repo.save_all.side_effect = lambda buffer: raw_saved.extend(sum(buffer, []))
+    parsed_repo = MagicMock()
+    parsed_repo.save_all.side_effect = lambda buffer: parsed_saved.extend(
+        sum(buffer, [])
+    )
+
+    usecase = FetchStatementsUseCase(
+        logger=DummyLogger(),
+        source=source,
+        parsed_statements_repo=parsed_repo,
+        raw_statement_repository=raw_repo,
+        metrics_collector=MetricsCollector(),
+        worker_pool_executor=MagicMock(max_workers=2),
+        config=DummyConfig(),
+    )
+
+    targets = [_make_nsd(i) for i in range(5)]
+    result = usecase.sync_statements(targets, threshold=2, keep_results=True)
+
+    assert sorted(n.nsd for n in result.items) == [str(i) for i in range(5)]
+    assert len(raw_saved) == 5
+    assert {p.nsd for p in parsed_saved} == {str(i) for i in range(5)}
+
+
+def test_sync_statements_checkpoints_on_shutdown_and_resumes(tmp_path):
+    from domain.dto.raw_statement_dto import RawStatementDTO
+    from infrastructure.helpers import CheckpointStore, MetricsCollector, ShutdownSignal
+
+    class Config(DummyConfig):
+        class Paths:
+            checkpoint_dir = tmp_path
+
+        paths = Paths()
+
+    shutdown = ShutdownSignal()
+    fetched = []
+
+    def fetch(task):
+        fetched.append(task.data.nsd)
+        if len(fetched) == 2:
+            shutdown.request()
+        row = RawStatementDTO(
+            nsd=task.data.nsd,
+            company_name="ACME",
+            quarter=None,
+            version="1",
+            grupo="DFs",
+            quadro="BPA",
+            account="1.01",
+            description="Ativo",
+            value=1.0,
+        )
+        return {"nsd": task.data, "statements": [row]}
+
+    source = MagicMock(spec=RawStatementScraperPort)
+    source.fetch.side_effect = fetch
+
+    def usecase():
+        return FetchStatementsUseCase(
+            logger=DummyLogger(),
+            source=source,
+            parsed_statements_repo=MagicMock(),
+            raw_statement_repository=MagicMock(),
+            metrics_collector=MetricsCollector(),
+            worker_pool_executor=MagicMock(max_workers=1),
+            config=Config(),
+            checkpoint=CheckpointStore(Config(), "statements"),
+            shutdown=shutdown,
+        )
+
+    targets = [_make_nsd(i) for i in range(6)]
+    first = usecase().sync_statements(targets, threshold=2)
+    assert first.interrupted
+    assert (tmp_path / "statements.json").exists()
+    done_first = set(fetched)
+
+    shutdown.clear()
+    fetched.clear()
+    second = usecase().sync_statements(targets, threshold=2)
+
+    assert not second.interrupted
+    assert done_first.isdisjoint(fetched)
+    assert done_first | set(fetched) == {str(i) for i in range(6)}
+    assert not (tmp_path / "statements.json").exists()
@@ -26,6 +26,26 @@ def SessionLocal(engine):
     return Session
 
 
+@pytest.fixture(scope="function")
+def make_repo(engine, SessionLocal):
+    # Imported here since the project root joins sys.path after the imports
+    from infrastructure.models.base_model import Base
+
+    # Every test starts from an empty schema
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    def make(cls, save_mode=None):
+        repo = cls(config=DummyConfig(), logger=DummyLogger())
+        repo.engine = engine
+        repo.Session = SessionLocal
+        if save_mode is not None:
+            repo.save_mode = save_mode
+        return repo
+
+    return make
+
+
 class DummyLogger:
     def log(self, *args, **kwargs):
         pass
@@ -34,6 +54,11 @@ class DummyLogger:
 class DummyConfig:
     class Database:
         connection_string = "sqlite:///:memory:"
+        sqlite_synchronous = "NORMAL"
+        sqlite_cache_size = -65536
+        sqlite_mmap_size = 268435456
+        sqlite_temp_store = "MEMORY"
+        sqlite_busy_timeout = 5000
 
     database = Database()
 
@@ -41,5 +66,47 @@ class DummyConfig:
         app_name = "TEST"
         max_workers = 1
         queue_size = 10
+        max_concurrency = 10
+        task_retries = 2
+        retry_backoff = 0.01
+        time_budget = 0
+        threshold = 5
+        batch_size = 100
+        writer_queue_size = 4
+        resume = True
+        cpu_sample_interval = 1.0
+        cpu_smoothing = 0.3
 
     global_settings = Global()
+
+    class Scraping:
+        timeout = 1
+        max_attempts = 5
+        retry_base = 0.01
+        retry_cap = 0.05
+        retry_budget_ratio = 0.2
+        retry_budget_min = 100
+        test_internet = "http://127.0.0.1:9/generate_204"
+        adaptive_concurrency = True
+        concurrency_initial = 2
+        concurrency_min = 1
+        concurrency_max = 8
+        concurrency_increase = 1
+        concurrency_decrease = 0.5
+        block_pause = 0.2
+        latency_factor = 3.0
+        rate_limits = {}
+        rate_limit_default = 0.0
+        rate_burst = 1
+        spare_sessions = 0
+        spare_warm_url = ""
+        connectivity_ttl = 30.0
+        accept_encoding = ""
+        hedge_ratio = 0.05
+        hedge_quantile = 0.95
+        hedge_window = 200
+        hedge_min_samples = 20
+        hedge_sessions = 1
+        probe_memo_ttl = 600
+
+    scraping = Scraping()
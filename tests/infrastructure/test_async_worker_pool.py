@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+
+from domain.dto import WorkerTaskDTO
+from infrastructure.helpers.async_worker_pool import AsyncWorkerPool
+from tests.conftest import DummyConfig, DummyLogger
+from tests.infrastructure.test_worker_pool import DummyMetricsCollector
+
+
+def test_async_pool_runs_coroutines_concurrently():
+    pool = AsyncWorkerPool(
+        config=DummyConfig(),
+        metrics_collector=DummyMetricsCollector(),
+        max_concurrency=50,
+    )
+    threads = set()
+
+    async def processor(task: WorkerTaskDTO) -> int:
+        threads.add(threading.get_ident())
+        await asyncio.sleep(0.1)
+        return task.data * 2
+
+    start = time.perf_counter()
+    result = pool.run(
+        tasks=enumerate(range(50)), processor=processor, logger=DummyLogger()
+    )
+    elapsed = time.perf_counter() - start
+
+    assert sorted(result.items) == [n * 2 for n in range(50)]
+    # All tasks overlap on a single thread instead of running back to back
+    assert elapsed < 1.0
+    assert len(threads) == 1
+
+
+def test_async_pool_accepts_sync_processor_and_run_coroutine():
+    pool = AsyncWorkerPool(
+        config=DummyConfig(),
+        metrics_collector=DummyMetricsCollector(),
+        max_workers=2,
+    )
+    collected = []
+
+    async def double(value: int) -> int:
+        await asyncio.sleep(0)
+        return value * 2
+
+    def processor(task: WorkerTaskDTO) -> int:
+        return pool.run_coroutine(double(task.data))
+
+    result = pool.run(
+        tasks=enumerate([1, 2, 3]),
+        processor=processor,
+        logger=DummyLogger(),
+        on_result=collected.append,
+    )
+
+    assert sorted(result.items) == [2, 4, 6]
+    assert sorted(collected) == [2, 4, 6]
+
+
+def test_serve_shares_one_loop_across_threads():
+    class FakeFetchUtils:
+        closed = 0
+
+        async def aclose(self):
+            self.closed += 1
+
+    fetch_utils = FakeFetchUtils()
+    pool = AsyncWorkerPool(
+        config=DummyConfig(),
+        metrics_collector=DummyMetricsCollector(),
+        fetch_utils=fetch_utils,
+    )
+    loops = []
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    def call():
+        loops.append(pool.run_coroutine(current_loop()))
+
+    with pool.serve():
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(loops) == 3 and len(set(loops)) == 1
+    assert loops[0].is_closed() and fetch_utils.closed == 1
+    assert pool._loop is None
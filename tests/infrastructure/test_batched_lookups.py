@@ -0,0 +1,74 @@
+from sqlalchemy import event
+
+from domain.dto.nsd_dto import NsdDTO
+from domain.dto.raw_statement_dto import RawStatementDTO
+from infrastructure.repositories import sqlalchemy_repository_base
+from infrastructure.repositories.nsd_repository import SqlAlchemyNsdRepository
+from infrastructure.repositories.raw_statement_repository import (
+    SqlAlchemyRawStatementRepository,
+)
+
+
+def _count_selects(engine):
+    selects = []
+
+    def record(conn, cursor, sql, params, *args):
+        if sql.lstrip().startswith("SELECT"):
+            selects.append(sql)
+
+    event.listen(engine, "before_cursor_execute", record)
+    return selects, lambda: event.remove(engine, "before_cursor_execute", record)
+
+
+def test_simple_keys_are_chunked_under_the_variable_limit(
+    make_repo, engine, monkeypatch
+):
+    monkeypatch.setattr(sqlalchemy_repository_base, "MAX_BOUND_KEYS", 2)
+    repo = make_repo(SqlAlchemyNsdRepository)
+    repo.save_all([NsdDTO.from_dict({"nsd": str(n)}) for n in range(1, 6)])
+    selects, stop = _count_selects(engine)
+
+    found = repo.get_many(["1", "3", "5", "9", "3"])
+    existing = repo.has_many(["2", "4", "8"])
+    stop()
+
+    assert sorted(found) == ["1", "3", "5"]
+    assert found["3"].nsd == "3"
+    assert existing == {"2", "4"}
+    # 4 distinct keys in chunks of 2, then 3 keys in chunks of 2
+    assert len(selects) == 4
+
+
+def test_composite_keys_join_a_temporary_table(make_repo, engine):
+    repo = make_repo(SqlAlchemyRawStatementRepository)
+    rows = [
+        RawStatementDTO(
+            nsd="1",
+            company_name=name,
+            quarter="2024-03-31",
+            version="1",
+            grupo="DFs",
+            quadro="BPA",
+            account=account,
+            description="Conta",
+            value=1.0,
+        )
+        for name, account in (("ACME", "1"), ("ACME", "2"), ("ROMI", "1"))
+    ]
+    repo.save_all(rows)
+    keys = [
+        ("1", "ACME", "2024-03-31", "1", "DFs", "BPA", "2"),
+        ("1", "ROMI", "2024-03-31", "1", "DFs", "BPA", "1"),
+        ("1", "ACME", "2024-03-31", "1", "DFs", "BPA", "9"),
+    ]
+    selects, stop = _count_selects(engine)
+
+    found = repo.get_many(keys)
+    existing = repo.has_many(keys)
+    stop()
+
+    assert set(found) == set(keys[:2])
+    assert found[keys[0]].account == "2"
+    assert existing == set(keys[:2])
+    # One joined query per call
+    assert len(selects) == 2
@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import text
+
+from domain.dto.nsd_dto import NsdDTO
+from domain.dto.raw_statement_dto import RawStatementDTO
+from infrastructure.repositories.nsd_repository import SqlAlchemyNsdRepository
+from infrastructure.repositories.raw_statement_repository import (
+    SqlAlchemyRawStatementRepository,
+)
+
+
+def _row(account, value):
+    return RawStatementDTO(
+        nsd="1",
+        company_name="ACME",
+        quarter="2024-03-31",
+        version="1",
+        grupo="DFs",
+        quadro="BPA",
+        account=account,
+        description=f"Conta {account}",
+        value=value,
+    )
+
+
+@pytest.mark.parametrize("save_mode", ["merge", "upsert"])
+def test_statement_rows_are_upserted(make_repo, save_mode):
+    repo = make_repo(SqlAlchemyRawStatementRepository, save_mode)
+
+    repo.save_all([_row("1.01", 1.0), _row("1.02", 2.0)])
+    # The same key twice in one batch keeps the last row
+    repo.save_all([_row("1.01", 10.0), _row("1.03", 3.0), _row("1.03", 30.0)])
+
+    values = {dto.account: dto.value for dto in repo.get_all()}
+    assert values == {"1.01": 10.0, "1.02": 2.0, "1.03": 30.0}
+
+
+def test_stored_nsd_rows_are_left_untouched(make_repo, engine):
+    repo = make_repo(SqlAlchemyNsdRepository, "ignore")
+
+    repo.save_all([NsdDTO.from_dict({"nsd": "7", "company_name": "ACME"})])
+    repo.save_all(
+        [
+            NsdDTO.from_dict({"nsd": "7", "company_name": "OTHER"}),
+            NsdDTO.from_dict({"nsd": "8", "company_name": "ROMI"}),
+        ]
+    )
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT nsd, company_name FROM tbl_nsd ORDER BY nsd")
+        ).all()
+    assert rows == [("7", "ACME"), ("8", "ROMI")]
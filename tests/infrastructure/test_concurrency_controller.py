@@ -0,0 +1,74 @@
+import threading
+import time
+
+from infrastructure.helpers.concurrency_controller import HostConcurrencyController
+from tests.conftest import DummyConfig
+
+CVM = "https://www.rad.cvm.gov.br/ENET/frmGerenciaPaginaFRE.aspx?NumeroSequencialDocumento=1"
+B3 = "https://sistemaswebb3-listados.b3.com.br/listedCompaniesProxy/x"
+
+
+def succeed(controller, url, times, latency=0.01):
+    for _ in range(times):
+        controller.release(controller.acquire(url), latency=latency)
+
+
+def test_limit_grows_additively_on_success():
+    controller = HostConcurrencyController(DummyConfig())
+
+    succeed(controller, CVM, 2 + 3)
+
+    # 2 successes at limit 2, then 3 at limit 3
+    assert controller.limit(CVM) == 4
+
+
+def test_block_halves_limit_and_pauses_only_that_host():
+    controller = HostConcurrencyController(DummyConfig())
+    succeed(controller, CVM, 2 + 3 + 4)
+    assert controller.limit(CVM) == 5
+
+    controller.record_block(CVM)
+    # A second report during the pause is the same event
+    controller.record_block(CVM)
+
+    assert controller.limit(CVM) == 2
+    assert controller.snapshot()["www.rad.cvm.gov.br"]["blocks"] == 1
+
+    start = time.perf_counter()
+    with controller.slot(B3):
+        assert time.perf_counter() - start < 0.1
+    with controller.slot(CVM):
+        assert time.perf_counter() - start >= 0.15
+
+
+def test_rising_latency_holds_the_limit():
+    controller = HostConcurrencyController(DummyConfig())
+
+    succeed(controller, CVM, 1, latency=0.01)
+    succeed(controller, CVM, 20, latency=0.5)
+
+    assert controller.limit(CVM) == 2
+
+
+def test_in_flight_requests_never_exceed_limit():
+    controller = HostConcurrencyController(DummyConfig())
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def worker():
+        with controller.slot(CVM):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(peak) == 2
@@ -0,0 +1,51 @@
+import threading
+import time
+
+from infrastructure.helpers import ConnectivityMonitor
+from tests.conftest import DummyConfig
+
+
+def test_fresh_verdict_skips_the_probe(monkeypatch):
+    monitor = ConnectivityMonitor(DummyConfig(), ttl=60)
+
+    def fail(*args):
+        raise AssertionError("probe should not run")
+
+    monkeypatch.setattr(monitor, "probe", fail)
+
+    monitor.mark_online()
+
+    assert monitor.wait_online() is True
+
+
+def test_expired_verdict_probes_again(monkeypatch):
+    monitor = ConnectivityMonitor(DummyConfig(), ttl=60)
+    calls = []
+    monkeypatch.setattr(monitor, "probe", lambda *a: calls.append(1) or True)
+
+    monitor.wait_online()
+    monitor.wait_online()
+    monitor.invalidate()
+    monitor.wait_online()
+
+    assert len(calls) == 2
+
+
+def test_concurrent_callers_share_one_probe(monkeypatch):
+    monitor = ConnectivityMonitor(DummyConfig(), ttl=60)
+    calls = []
+
+    def slow_probe(*args):
+        calls.append(1)
+        time.sleep(0.1)
+        return True
+
+    monkeypatch.setattr(monitor, "probe", slow_probe)
+    threads = [threading.Thread(target=monitor.wait_online) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert monitor.is_fresh()
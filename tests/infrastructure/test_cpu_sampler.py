@@ -0,0 +1,48 @@
+import time
+
+from infrastructure.helpers import CpuSampler, TimeUtils
+from tests.conftest import DummyConfig
+
+
+def test_record_smooths_samples():
+    sampler = CpuSampler(smoothing=0.5)
+
+    assert sampler.record(80.0) == 80.0
+    assert sampler.record(40.0) == 60.0
+    assert sampler.record(60.0) == 60.0
+
+
+def test_background_thread_publishes_samples(monkeypatch):
+    samples = iter([90.0] * 1000)
+    monkeypatch.setattr(
+        "infrastructure.helpers.cpu_sampler.psutil.cpu_percent",
+        lambda interval: next(samples),
+    )
+    sampler = CpuSampler(interval=0.01, smoothing=1.0)
+
+    assert sampler.load == 0.0
+    deadline = time.monotonic() + 2
+    while sampler.load == 0.0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    sampler.stop()
+
+    assert sampler.load == 90.0
+
+
+def test_dynamic_wait_reads_the_sampler_without_blocking(monkeypatch):
+    def blocking(interval):
+        raise AssertionError("psutil must not be called")
+
+    sampler = CpuSampler()
+    sampler._thread = object()  # pretend the thread is running
+    sampler.record(95.0)
+    monkeypatch.setattr(
+        "infrastructure.helpers.time_utils.psutil.cpu_percent", blocking
+    )
+
+    started = time.perf_counter()
+    wait = TimeUtils(DummyConfig(), sampler=sampler).dynamic_wait(1.0)
+
+    assert time.perf_counter() - started < 0.05
+    # High load draws from the widest range
+    assert 0.3 <= wait <= 1.5
@@ -0,0 +1,55 @@
+from sqlalchemy import text
+
+from infrastructure.models.base_model import BaseModel
+from infrastructure.repositories import (
+    SqlAlchemyNsdRepository,
+    SqlAlchemyRawStatementRepository,
+)
+from infrastructure.repositories.engine_registry import EngineRegistry
+from tests.conftest import DummyConfig, DummyLogger
+
+
+def _config(tmp_path):
+    config = DummyConfig()
+    config.database = type(config.database)()
+    config.database.connection_string = f"sqlite:///{tmp_path / 'fly.db'}"
+    return config
+
+
+def test_repositories_share_one_engine_and_create_the_schema_once(
+    tmp_path, monkeypatch
+):
+    created = []
+    create_all = BaseModel.metadata.create_all
+    monkeypatch.setattr(
+        BaseModel.metadata,
+        "create_all",
+        lambda engine: created.append(engine) or create_all(engine),
+    )
+    config = _config(tmp_path)
+
+    nsd_repo = SqlAlchemyNsdRepository(config, DummyLogger())
+    raw_repo = SqlAlchemyRawStatementRepository(config, DummyLogger())
+    EngineRegistry.dispose_all()
+
+    assert nsd_repo.engine is raw_repo.engine
+    assert created == [nsd_repo.engine]
+
+
+def test_connections_use_the_sqlite_profile(tmp_path):
+    engine = EngineRegistry.get(_config(tmp_path).database)
+
+    with engine.connect() as conn:
+        pragmas = {
+            name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "temp_store", "busy_timeout")
+        }
+    EngineRegistry.dispose_all()
+
+    # synchronous NORMAL is 1, temp_store MEMORY is 2
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "temp_store": 2,
+        "busy_timeout": 5000,
+    }
@@ -0,0 +1,75 @@
+import threading
+
+from infrastructure.helpers import FetchUtils
+from tests.conftest import DummyConfig, DummyLogger
+
+
+def _fetch_utils(monkeypatch, pool_size=4):
+    fetch_utils = FetchUtils(DummyConfig(), DummyLogger(), pool_size=pool_size)
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    return fetch_utils
+
+
+def test_each_thread_keeps_its_own_session(monkeypatch):
+    fetch_utils = _fetch_utils(monkeypatch)
+    sessions = {}
+
+    def worker(name):
+        first = fetch_utils.session()
+        assert fetch_utils.session() is first
+        sessions[name] = first
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(s) for s in sessions.values()}) == 3
+
+
+def test_rotate_replaces_only_the_calling_threads_session(monkeypatch):
+    fetch_utils = _fetch_utils(monkeypatch)
+    first = fetch_utils.session()
+
+    rotated = fetch_utils.rotate_session()
+
+    assert rotated is not first
+    assert fetch_utils.session() is rotated
+
+
+def test_adapters_are_sized_to_pool_size(monkeypatch):
+    fetch_utils = _fetch_utils(monkeypatch, pool_size=12)
+    session = fetch_utils.session()
+
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(prefix + "www.rad.cvm.gov.br")
+        assert adapter._pool_maxsize == 12
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 12
+    # cloudscraper keeps its cipher-suite adapter for HTTPS
+    assert type(session.get_adapter("https://x")).__name__ == "CipherSuiteAdapter"
+
+
+def test_rotation_takes_a_prebuilt_spare(monkeypatch):
+    fetch_utils = _fetch_utils(monkeypatch)
+    fetch_utils.spares.size = 1
+    fetch_utils.session()
+    fetch_utils.spares._refill_thread.join()
+    spare = fetch_utils.spares._spares.queue[0]
+
+    rotated = fetch_utils.rotate_session()
+
+    assert rotated is spare
+    # The reserve is rebuilt in the background
+    fetch_utils.spares._refill_thread.join()
+    assert fetch_utils.spares.ready == 1
+    fetch_utils.close()
+    assert fetch_utils.spares.ready == 0
+
+
+def test_rotation_builds_inline_without_spares(monkeypatch):
+    fetch_utils = _fetch_utils(monkeypatch)
+    first = fetch_utils.session()
+
+    assert fetch_utils.rotate_session() is not first
+    assert fetch_utils.spares.ready == 0
@@ -0,0 +1,128 @@
+import time
+from types import SimpleNamespace
+
+from infrastructure.helpers import FetchUtils, HostConcurrencyController, RequestHedger
+from tests.conftest import DummyConfig, DummyLogger
+
+URL = "http://127.0.0.1:9/ENET/frmDemonstracaoFinanceiraITR.aspx?Grupo=1"
+
+
+class Session:
+    def __init__(self, delay, body):
+        self.delay = delay
+        self.body = body
+        self.closed = False
+
+    def get(self, url, timeout):
+        time.sleep(self.delay)
+        return SimpleNamespace(status_code=200, content=self.body, raw=None)
+
+    def close(self):
+        self.closed = True
+
+
+def _hedger(**kwargs):
+    return RequestHedger(DummyConfig(), min_samples=3, **kwargs)
+
+
+def test_delay_is_the_endpoint_quantile_once_enough_samples():
+    hedger = _hedger(quantile=0.5)
+
+    assert hedger.delay(URL) is None
+    for latency in (0.1, 0.2, 0.3, 0.4):
+        hedger.observe(URL, latency)
+
+    assert hedger.delay(URL) == 0.3
+    assert hedger.delay("http://127.0.0.1:9/other") is None
+
+
+def test_hedges_are_capped_by_ratio():
+    hedger = _hedger(ratio=0.1, burst=1)
+    for _ in range(10):
+        hedger.delay(URL)
+
+    # 0.1 * 10 requests + 1 burst
+    assert hedger.try_hedge()
+    assert hedger.try_hedge()
+    assert not hedger.try_hedge()
+
+
+def test_slow_request_is_hedged_on_another_session(monkeypatch):
+    hedger = _hedger()
+    for _ in range(3):
+        hedger.observe(URL, 0.01)
+    controller = HostConcurrencyController(DummyConfig())
+    fetch_utils = FetchUtils(
+        DummyConfig(), DummyLogger(), controller=controller, hedger=hedger
+    )
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    spares, slots = [], []
+    monkeypatch.setattr(fetch_utils.spares, "take", spares.append)
+    try_slot = controller.try_slot
+    monkeypatch.setattr(
+        controller, "try_slot", lambda url: slots.append(url) or try_slot(url)
+    )
+    hedge_session, slow_session = Session(0.0, b"hedge"), Session(1.0, b"slow")
+    fetch_utils.hedge_sessions.give_back(hedge_session)
+    fetch_utils._local.session = slow_session
+
+    started = time.perf_counter()
+    response, session = fetch_utils.fetch_with_retry(None, URL)
+    elapsed = time.perf_counter() - started
+    # The hedge's slot is released by its completion callback
+    deadline = time.monotonic() + 1
+    while controller.snapshot()["127.0.0.1"]["in_flight"]:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    # The thread moved to the hedge's session while the loser still ran
+    assert session is hedge_session and fetch_utils.session() is hedge_session
+    assert not slow_session.closed
+    # ...and its old session is closed once the loser finishes
+    deadline = time.monotonic() + 2
+    while not slow_session.closed:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    fetch_utils.close()
+
+    assert response.content == b"hedge"
+    assert elapsed < 0.5
+    assert hedger.hedges == 1 and hedger.hedge_wins == 1
+    # The hedge took a controller slot and its own session, not a spare
+    assert slots == [URL] and spares == []
+
+
+def test_no_hedge_while_the_host_has_no_free_slot(monkeypatch):
+    hedger = _hedger()
+    for _ in range(3):
+        hedger.observe(URL, 0.01)
+    config = DummyConfig()
+    controller = HostConcurrencyController(config)
+    fetch_utils = FetchUtils(
+        config, DummyLogger(), controller=controller, hedger=hedger
+    )
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    fetch_utils.hedge_sessions.give_back(Session(0.0, b"hedge"))
+    # Every slot of the host is taken by other requests
+    held = [controller.acquire(URL) for _ in range(controller.limit(URL) - 1)]
+
+    response, _ = fetch_utils.fetch_with_retry(Session(0.2, b"slow"), URL)
+    for host in held:
+        controller.release(host)
+    fetch_utils.close()
+
+    assert response.content == b"slow"
+    assert hedger.hedges == 0
+
+
+def test_fast_request_is_not_hedged(monkeypatch):
+    hedger = _hedger()
+    for _ in range(3):
+        hedger.observe(URL, 0.5)
+    fetch_utils = FetchUtils(DummyConfig(), DummyLogger(), hedger=hedger)
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+
+    response, _ = fetch_utils.fetch_with_retry(Session(0.0, b"fast"), URL)
+    fetch_utils.close()
+
+    assert response.content == b"fast"
+    assert hedger.hedges == 0
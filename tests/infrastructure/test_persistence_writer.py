@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from infrastructure.helpers import MetricsCollector, PersistenceWriter, SaveStrategy
+from tests.conftest import DummyConfig, DummyLogger
+
+
+def test_submit_returns_while_commit_is_running():
+    release = threading.Event()
+    saved = []
+
+    def slow_save(items):
+        release.wait(timeout=2)
+        saved.extend(items)
+
+    with PersistenceWriter(DummyConfig(), DummyLogger()) as writer:
+        start = time.perf_counter()
+        writer.submit(slow_save, [1, 2])
+        writer.submit(slow_save, [3])
+        assert time.perf_counter() - start < 0.5
+        release.set()
+        writer.flush()
+
+    assert saved == [1, 2, 3]
+
+
+def test_queued_batches_for_same_callback_share_a_commit():
+    release = threading.Event()
+    commits = []
+
+    def save(items):
+        release.wait(timeout=2)
+        commits.append(list(items))
+
+    collector = MetricsCollector()
+    writer = PersistenceWriter(
+        DummyConfig(), DummyLogger(), metrics_collector=collector, queue_size=10
+    )
+    for i in range(4):
+        writer.submit(save, [i])
+    release.set()
+    writer.close()
+
+    # The first batch may already be committing; the rest are merged
+    assert sum(commits, []) == [0, 1, 2, 3]
+    assert len(commits) <= 2
+    metrics = collector.get_metrics(elapsed_time=0)
+    assert metrics.commits == len(commits)
+    assert metrics.write_queue_peak >= 2
+    assert metrics.commit_latency_max > 0
+
+
+def test_commit_errors_surface_on_flush():
+    def broken(items):
+        raise ValueError("disk full")
+
+    writer = PersistenceWriter(DummyConfig(), DummyLogger())
+    writer.submit(broken, [1])
+    with pytest.raises(ValueError):
+        writer.flush()
+    writer.close()
+
+    with pytest.raises(RuntimeError):
+        writer.submit(broken, [1])
+
+
+def test_save_strategy_hands_buffers_to_writer():
+    saved = []
+    caller = threading.get_ident()
+    threads = set()
+
+    def save(items):
+        threads.add(threading.get_ident())
+        saved.extend(items)
+
+    with PersistenceWriter(DummyConfig(), DummyLogger()) as writer:
+        strategy = SaveStrategy(save, threshold=2, writer=writer)
+        for i in range(5):
+            strategy.handle(i)
+        strategy.finalize()
+        assert saved == [0, 1, 2, 3, 4]
+
+    assert caller not in threads
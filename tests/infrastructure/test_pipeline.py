@@ -0,0 +1,118 @@
+import threading
+import time
+
+from infrastructure.helpers import MetricsCollector, Pipeline, Stage
+from tests.conftest import DummyConfig, DummyLogger
+
+
+def _pipeline(stages, queue_size=2):
+    return Pipeline(
+        DummyConfig(),
+        stages,
+        logger=DummyLogger(),
+        metrics_collector=MetricsCollector(),
+        queue_size=queue_size,
+    )
+
+
+def test_items_flow_through_every_stage():
+    pipeline = _pipeline(
+        [
+            Stage("double", lambda task: task.data * 2, workers=3),
+            Stage("inc", lambda task: task.data + 1, workers=2),
+            Stage("keep", lambda task: (task.index, task.data)),
+        ]
+    )
+
+    result = pipeline.run(enumerate(range(20)))
+
+    assert sorted(result.items) == [(i, i * 2 + 1) for i in range(20)]
+    stats = pipeline.stats()
+    assert stats["double"]["processed"] == 20
+    assert stats["keep"]["processed"] == 20
+
+
+def test_stages_overlap():
+    first_done = threading.Event()
+    overlap = []
+
+    def fetch(task):
+        if task.index > 0:
+            # Later fetches run while the first item is being written
+            overlap.append(first_done.wait(timeout=1))
+        return task.data
+
+    def write(task):
+        first_done.set()
+        return task.data
+
+    pipeline = _pipeline([Stage("fetch", fetch), Stage("write", write)])
+    pipeline.run(enumerate(range(3)))
+
+    assert overlap and all(overlap)
+
+
+def test_slow_stage_applies_backpressure():
+    fed = []
+
+    def items():
+        for i in range(10):
+            fed.append(i)
+            yield i, i
+
+    def slow(task):
+        time.sleep(0.02)
+        return task.data
+
+    pipeline = _pipeline(
+        [Stage("fast", lambda task: task.data), Stage("slow", slow)], queue_size=1
+    )
+    result = pipeline.run(items(), keep_results=False)
+
+    assert result.items == []
+    assert pipeline.stats()["slow"]["queue_peak"] <= 1
+    assert fed == list(range(10))
+
+
+def test_errors_become_dead_letters_and_none_drops_items():
+    def parse(task):
+        if task.data == 3:
+            raise ValueError("bad page")
+        return None if task.data == 4 else task.data
+
+    pipeline = _pipeline([Stage("parse", parse), Stage("save", lambda t: t.data)])
+    result = pipeline.run(enumerate(range(6)))
+
+    assert sorted(result.items) == [0, 1, 2, 5]
+    assert [(d.index, d.worker_id) for d in result.dead_letters] == [(3, "parse")]
+    assert result.metrics.failures == 1
+
+
+def test_on_result_errors_are_dead_letters_and_do_not_hang():
+    def on_result(value):
+        if value == 2:
+            raise RuntimeError("disk full")
+
+    pipeline = _pipeline(
+        [Stage("fetch", lambda t: t.data), Stage("save", lambda t: t.data)]
+    )
+    result = pipeline.run(enumerate(range(4)), on_result=on_result)
+
+    assert sorted(result.items) == [0, 1, 3]
+    assert [(d.index, d.worker_id) for d in result.dead_letters] == [(2, "save")]
+    stats = pipeline.stats()["save"]
+    assert (stats["processed"], stats["failed"]) == (3, 1)
+
+
+def test_stop_drains_items_already_inside():
+    pipeline = _pipeline([Stage("work", lambda task: task.data)])
+
+    def items():
+        for i in range(100):
+            if i == 5:
+                pipeline.stop()
+            yield i, i
+
+    result = pipeline.run(items())
+
+    assert sorted(result.items) == list(range(5))
@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from domain.dto import WorkerTaskDTO
+from infrastructure.helpers.data_cleaner import DataCleaner
+from infrastructure.helpers.process_worker_pool import ProcessWorkerPool
+from infrastructure.scrapers.html_parsers import parse_statement_html
+from tests.conftest import DummyConfig, DummyLogger
+from tests.infrastructure.test_worker_pool import DummyMetricsCollector
+
+
+def square(task: WorkerTaskDTO) -> tuple:
+    if task.data == 3:
+        raise ValueError("boom")
+    return task.data * task.data, task.worker_id
+
+
+def double(task: WorkerTaskDTO) -> int:
+    return task.data * 2
+
+
+def sleepy(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+SIGINT_SCRIPT = """
+import os, signal, threading
+from infrastructure.helpers.process_worker_pool import ProcessWorkerPool
+from tests.conftest import DummyConfig
+from tests.infrastructure.test_process_worker_pool import sleepy
+from tests.infrastructure.test_worker_pool import DummyMetricsCollector
+
+with ProcessWorkerPool(DummyConfig(), DummyMetricsCollector(), max_workers=1) as pool:
+    pool.call(sleepy, 0)
+    stopped = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stopped.set())
+    threading.Timer(0.2, os.killpg, (os.getpgrp(), signal.SIGINT)).start()
+    print(pool.call(sleepy, 0.5), pool.call(sleepy, 0), stopped.is_set())
+"""
+
+
+class RecordingLogger(DummyLogger):
+    def __init__(self) -> None:
+        self.messages = []
+
+    def log(self, message, level="info", **kwargs):
+        self.messages.append((level, message))
+
+
+def test_process_pool_runs_tasks_in_child_processes():
+    logger = RecordingLogger()
+    with ProcessWorkerPool(
+        config=DummyConfig(), metrics_collector=DummyMetricsCollector(), max_workers=2
+    ) as pool:
+        result = pool.run(tasks=enumerate(range(6)), processor=square, logger=logger)
+
+    values = sorted(value for value, _ in result.items)
+    assert values == [0, 1, 4, 16, 25]
+    assert all(worker_id != f"pid{os.getpid()}" for _, worker_id in result.items)
+    assert logger.messages == [("warning", "worker error: ValueError: boom")]
+
+
+def test_process_pool_call_parses_statement_page():
+    html = (
+        "<table id='ctl00_cphPopUp_tbDados'>"
+        "<tr><td>1.01</td><td>Ativo</td><td>1.234</td></tr>"
+        "<tr><td>x</td><td>skip</td><td>0</td></tr>"
+        "</table>"
+    )
+    cleaner = DataCleaner(DummyConfig(), DummyLogger())
+
+    with ProcessWorkerPool(
+        config=DummyConfig(), metrics_collector=DummyMetricsCollector(), max_workers=1
+    ) as pool:
+        blocked, rows = pool.call(parse_statement_html, html, "DFs", [], cleaner)
+
+    assert blocked is False
+    assert [row["account"] for row in rows] == ["1.01"]
+
+
+def test_process_pool_stops_submitting_on_shutdown():
+    shutdown = threading.Event()
+    logger = RecordingLogger()
+
+    with ProcessWorkerPool(
+        config=DummyConfig(),
+        metrics_collector=DummyMetricsCollector(),
+        max_workers=1,
+        shutdown=shutdown,
+    ) as pool:
+        result = pool.run(
+            tasks=((i, i) for i in range(1000)),
+            processor=double,
+            logger=logger,
+            on_result=lambda value: shutdown.set(),
+        )
+        # A flag given to stream() applies to that stream only
+        streamed = list(
+            pool.stream(enumerate(range(5)), double, logger, shutdown=threading.Event())
+        )
+
+    # Tasks already submitted when the flag was set still finish
+    limit = pool.max_workers + DummyConfig().global_settings.queue_size
+    assert result.interrupted and not result.deadline_reached
+    assert len(result.items) == limit
+    assert ("warning", "Shutdown requested, remaining tasks not submitted") in (
+        logger.messages
+    )
+    assert sorted(streamed) == [0, 2, 4, 6, 8]
+
+
+def test_process_pool_workers_leave_sigint_to_the_parent():
+    # Run in a new session so the signal reaches only that process group
+    done = subprocess.run(
+        [sys.executable, "-c", SIGINT_SCRIPT],
+        cwd=Path(__file__).resolve().parents[2],
+        start_new_session=True,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert done.returncode == 0, done.stderr
+    assert done.stdout.split() == ["0.5", "0", "True"]
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+from infrastructure.helpers import RateLimiter
+from infrastructure.helpers.rate_limiter import TokenBucket
+from tests.conftest import DummyConfig
+
+CVM = "https://www.rad.cvm.gov.br/ENET/frmGerenciaPaginaFRE.aspx?NumeroSequencialDocumento=1"
+B3 = "https://sistemaswebb3-listados.b3.com.br/listedCompaniesProxy/"
+
+
+def test_bucket_spaces_reservations_evenly():
+    bucket = TokenBucket(rate=10, burst=1)
+
+    waits = [bucket.reserve() for _ in range(4)]
+
+    assert waits[0] == 0
+    # Each extra request waits one more interval of 0.1s
+    for n, wait in enumerate(waits[1:], start=1):
+        assert abs(wait - n * 0.1) < 0.02
+
+
+def test_threads_share_the_host_rate():
+    limiter = RateLimiter(DummyConfig(), rates={"www.rad.cvm.gov.br": 50}, burst=1)
+    sent = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire(CVM)
+            with lock:
+                sent.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 requests at 50/s need ~0.38s however many threads send them
+    assert time.monotonic() - start >= 0.3
+    assert len(sent) == 20
+
+
+def test_hosts_are_independent_and_unlisted_hosts_unlimited():
+    limiter = RateLimiter(DummyConfig(), rates={"www.rad.cvm.gov.br": 1}, burst=1)
+
+    assert limiter.reserve(CVM) == 0
+    assert limiter.reserve(CVM) > 0.5
+    assert limiter.reserve(B3) == 0
+    assert limiter.rate(B3) == 0
+
+
+def test_async_acquire_waits_without_blocking_the_loop():
+    limiter = RateLimiter(DummyConfig(), rates={"www.rad.cvm.gov.br": 20}, burst=1)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(*(limiter.acquire_async(CVM) for _ in range(5)))
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(main()) >= 10
@@ -0,0 +1,145 @@
+import time
+
+import requests
+
+from infrastructure.helpers import FetchUtils, MetricsCollector, ResponseCache
+from infrastructure.helpers.transfer import downloaded_size
+from tests.conftest import DummyConfig, DummyLogger
+
+NSD_URL = (
+    "https://www.rad.cvm.gov.br/ENET/frmGerenciaPaginaFRE.aspx?"
+    "NumeroSequencialDocumento=1&CodigoTipoInstituicao=1"
+)
+STATEMENT_URL = (
+    "https://www.rad.cvm.gov.br/ENET/frmDemonstracaoFinanceiraITR.aspx?"
+    "Grupo=DFs&NumeroSequencialDocumento=1&Hash={hash}"
+)
+POLICIES = {
+    "frmGerenciaPaginaFRE.aspx": None,
+    "frmDemonstracaoFinanceiraITR.aspx": None,
+    "b3.com.br": 60,
+}
+
+
+def _cache(tmp_path, **kwargs):
+    kwargs.setdefault("max_bytes", 10**6)
+    return ResponseCache(
+        DummyConfig(),
+        metrics_collector=MetricsCollector(),
+        directory=tmp_path,
+        policies=POLICIES,
+        ignored_params=("Hash",),
+        **kwargs,
+    )
+
+
+def test_put_and_get_round_trip_with_counters(tmp_path):
+    cache = _cache(tmp_path)
+
+    assert cache.get(NSD_URL) is None
+    assert cache.put(NSD_URL, "página".encode("latin-1"), "latin-1")
+    cached = cache.get(NSD_URL)
+
+    assert cached.content == "página".encode("latin-1")
+    assert cached.encoding == "latin-1"
+    metrics = cache.metrics_collector.get_metrics(0)
+    assert (metrics.cache_hits, metrics.cache_misses) == (1, 1)
+
+
+def test_uncovered_urls_are_not_cached(tmp_path):
+    cache = _cache(tmp_path)
+
+    assert not cache.put("https://example.com/a", b"x")
+    assert cache.get("https://example.com/a") is None
+
+
+def test_ignored_params_are_left_out_of_the_key(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put(STATEMENT_URL.format(hash="old"), b"rows")
+
+    assert cache.get(STATEMENT_URL.format(hash="new")).content == b"rows"
+
+
+def test_ttl_expires_short_lived_entries(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    url = "https://sistemaswebb3-listados.b3.com.br/list"
+    cache.put(url, b"companies")
+    cache.put(NSD_URL, b"filed")
+
+    later = time.time() + 61
+    monkeypatch.setattr(time, "time", lambda: later)
+
+    assert cache.get(url) is None
+    assert cache.get(NSD_URL).content == b"filed"
+
+
+def test_identical_bodies_share_one_blob_and_eviction_bounds_size(tmp_path):
+    cache = _cache(tmp_path, max_bytes=3000)
+    cache.put(NSD_URL, b"same")
+    cache.put(STATEMENT_URL.format(hash=""), b"same")
+    assert len(list(cache.blob_dir.rglob("*.z"))) == 1
+
+    for nsd in range(20):
+        cache.put(NSD_URL.replace("=1&", f"={nsd + 2}&"), bytes(range(256)) * nsd)
+
+    assert cache.size <= 3000
+    # The most recent entry survives eviction
+    assert cache.get(NSD_URL.replace("=1&", "=21&")) is not None
+
+
+def test_putting_a_url_again_keeps_or_releases_its_blob(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put(NSD_URL, b"hello")
+    size = cache.size
+
+    cache.put(NSD_URL, b"hello")
+    assert cache.get(NSD_URL).content == b"hello"
+    assert cache.size == size
+    assert len(list(cache.blob_dir.rglob("*.z"))) == 1
+
+    cache.put(NSD_URL, b"changed")
+    assert cache.get(NSD_URL).content == b"changed"
+    assert len(list(cache.blob_dir.rglob("*.z"))) == 1
+
+
+def test_data_survives_reopening(tmp_path):
+    cache = _cache(tmp_path)
+    cache.put(NSD_URL, b"filed")
+    cache.close()
+
+    assert _cache(tmp_path).get(NSD_URL).content == b"filed"
+
+
+def test_fetch_utils_serves_hits_without_network(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    fetch_utils = FetchUtils(DummyConfig(), DummyLogger(), cache=cache)
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    calls = []
+
+    def fake_get(url, timeout=None):
+        calls.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = b"<html>filed</html>"
+        return response
+
+    session = fetch_utils.session()
+    monkeypatch.setattr(session, "get", fake_get)
+
+    first, _ = fetch_utils.fetch_with_retry(None, NSD_URL)
+    second, _ = fetch_utils.fetch_with_retry(None, NSD_URL)
+
+    assert len(calls) == 1
+    assert second.text == first.text == "<html>filed</html>"
+    # Only the real download counts as network bytes
+    assert downloaded_size(first) == len(first.content)
+    assert downloaded_size(second) == 0
+
+    # Bypassing callers, such as the Hash lookup, always download
+    fetch_utils.fetch_with_retry(None, NSD_URL, cache_bypass=True)
+    assert len(calls) == 2
+
+    fetch_utils.report_block(NSD_URL)
+    fetch_utils.fetch_with_retry(None, NSD_URL)
+    assert len(calls) == 3
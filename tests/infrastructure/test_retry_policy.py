@@ -0,0 +1,77 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from infrastructure.helpers import FetchUtils, RetryExhaustedError, RetryPolicy
+from infrastructure.helpers.time_utils import TimeUtils
+from tests.conftest import DummyConfig, DummyLogger
+
+
+def _policy(**kwargs):
+    return RetryPolicy(DummyConfig(), rng=random.Random(1), **kwargs)
+
+
+def test_waits_stay_between_base_and_cap():
+    policy = _policy(max_attempts=0, base=0.5, cap=4.0, budget_ratio=-1)
+    retry = policy.start()
+
+    waits = [retry.next_delay() for _ in range(50)]
+
+    assert all(0.5 <= wait <= 4.0 for wait in waits)
+    assert max(waits) == 4.0
+    assert len(set(waits)) > 10
+
+
+def test_request_gives_up_after_max_attempts():
+    retry = _policy(max_attempts=3).start()
+
+    retry.next_delay()
+    retry.next_delay()
+    with pytest.raises(RetryExhaustedError):
+        retry.next_delay()
+    assert retry.attempt == 3
+
+
+def test_budget_is_shared_by_every_request_of_the_run():
+    policy = _policy(max_attempts=0, budget_ratio=0.5, budget_min=1)
+    first, second = policy.start(), policy.start()
+
+    # 1 + 0.5 * 2 requests = 2 retries for the whole run
+    first.next_delay()
+    second.next_delay()
+    with pytest.raises(RetryExhaustedError):
+        first.next_delay()
+
+    policy.reset()
+    assert policy.budget_left == 1
+
+
+def test_fetch_with_retry_stops_after_max_attempts(monkeypatch):
+    policy = _policy(max_attempts=3, base=0.0, cap=0.0)
+    fetch_utils = FetchUtils(DummyConfig(), DummyLogger(), retry_policy=policy)
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    monkeypatch.setattr(fetch_utils, "replacement_session", lambda **k: scraper)
+    calls = []
+
+    class Scraper:
+        def get(self, url, timeout):
+            calls.append(timeout)
+            return SimpleNamespace(status_code=503, content=b"", raw=None)
+
+    scraper = Scraper()
+    with pytest.raises(RetryExhaustedError):
+        fetch_utils.fetch_with_retry(scraper, "http://127.0.0.1:9/page")
+
+    # The timeout grows by one second per attempt
+    assert calls == [1, 2, 3]
+
+
+def test_dynamic_wait_grows_linearly_with_the_attempt(monkeypatch):
+    monkeypatch.setattr("psutil.cpu_percent", lambda interval: 0)
+    monkeypatch.setattr(random, "uniform", lambda low, high: high)
+    time_utils = TimeUtils(DummyConfig())
+
+    assert time_utils.dynamic_wait(0.5, 0, multiplier=1) == pytest.approx(0.25)
+    assert time_utils.dynamic_wait(0.5, 0, multiplier=4) == pytest.approx(1.0)
+    assert time_utils.dynamic_wait(4.0, 0, multiplier=4) == pytest.approx(8.0)
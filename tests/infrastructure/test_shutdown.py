@@ -0,0 +1,75 @@
+import os
+import signal
+import threading
+
+from infrastructure.helpers import (
+    CheckpointStore,
+    MetricsCollector,
+    ShutdownSignal,
+    WorkerPool,
+)
+from tests.conftest import DummyConfig, DummyLogger
+
+
+class CheckpointConfig(DummyConfig):
+    def __init__(self, path):
+        class Paths:
+            checkpoint_dir = path
+
+        self.paths = Paths()
+
+
+def test_sigterm_sets_the_flag_and_restores_handlers():
+    previous = signal.getsignal(signal.SIGTERM)
+    with ShutdownSignal() as shutdown:
+        os.kill(os.getpid(), signal.SIGTERM)
+        assert shutdown.is_set()
+    assert signal.getsignal(signal.SIGTERM) is previous
+
+
+def test_worker_pool_drains_in_flight_tasks_on_shutdown():
+    shutdown = ShutdownSignal()
+    started = threading.Event()
+    finished = []
+
+    def processor(task):
+        if task.data == 2:
+            started.set()
+            shutdown.request()
+        finished.append(task.data)
+        return task.data
+
+    pool = WorkerPool(
+        DummyConfig(), MetricsCollector(), max_workers=1, shutdown=shutdown
+    )
+    result = pool.run(
+        tasks=((i, i) for i in range(50)), processor=processor, logger=DummyLogger()
+    )
+
+    assert started.is_set()
+    assert result.interrupted
+    assert not result.deadline_reached
+    # The task that saw the signal completed; nothing new started after it
+    assert finished == [0, 1, 2]
+    assert result.items == [0, 1, 2]
+
+
+def test_checkpoint_round_trip(tmp_path):
+    config = CheckpointConfig(tmp_path)
+    store = CheckpointStore(config, "nsd")
+    for key in [1, 2, 3, 7, 8, 10]:
+        store.mark(key)
+    store.save(start=1, max_nsd=20)
+
+    raw = (tmp_path / "nsd.json").read_text()
+    assert "[1, 3]" in raw
+
+    resumed = CheckpointStore(config, "nsd")
+    assert resumed.load()
+    assert resumed.completed == {1, 2, 3, 7, 8, 10}
+    assert resumed.get("max_nsd") == 20
+    assert resumed.is_done(8) and not resumed.is_done(9)
+
+    resumed.clear()
+    assert not (tmp_path / "nsd.json").exists()
+    assert not CheckpointStore(config, "nsd").load()
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from collections import Counter
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from infrastructure.helpers import FetchUtils, SingleFlight, WorkerPool
+from infrastructure.helpers.transfer import downloaded_size
+from infrastructure.scrapers.nsd_scraper import NsdScraper
+from tests.conftest import DummyConfig, DummyLogger
+from tests.infrastructure.test_worker_pool import DummyMetricsCollector
+
+URL = "http://127.0.0.1:9/page"
+
+
+def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(2)
+        return "page"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flights.do(URL, slow)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while flights.shared < 3:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(results) == [("page", False)] * 3 + [("page", True)]
+    # Finished calls are not kept
+    assert flights.do(URL, lambda: "again") == ("again", True)
+
+
+def test_async_followers_receive_the_leader_exception():
+    flights = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise ValueError("blocked")
+
+    async def main():
+        return await asyncio.gather(
+            flights.do_async(URL, failing),
+            flights.do_async(URL, failing),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flights.shared == 1
+
+
+def test_fetch_with_retry_coalesces_the_same_url(monkeypatch):
+    fetch_utils = FetchUtils(DummyConfig(), DummyLogger())
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    started = threading.Event()
+    calls = []
+
+    class Scraper:
+        def get(self, url, timeout):
+            calls.append(url)
+            started.set()
+            # Hold the request until the follower has joined it
+            while fetch_utils.flights.shared == 0:
+                pass
+            return SimpleNamespace(status_code=200, content=b"page", raw=None)
+
+    leader, follower = Scraper(), Scraper()
+    results = {}
+    thread = threading.Thread(
+        target=lambda: results.update(leader=fetch_utils.fetch_with_retry(leader, URL))
+    )
+    thread.start()
+    started.wait(2)
+    results["follower"] = fetch_utils.fetch_with_retry(follower, URL)
+    thread.join()
+    fetch_utils.close()
+
+    assert calls == [URL]
+    assert results["follower"][0].content == results["leader"][0].content
+    # The shared body is counted once, for the leader
+    assert downloaded_size(results["leader"][0]) == len(b"page")
+    assert downloaded_size(results["follower"][0]) == 0
+    # Each caller keeps its own session
+    assert results["follower"][1] is follower
+
+
+def test_flights_are_keyed_by_url_and_insecure_and_skip_bypass(monkeypatch):
+    fetch_utils = FetchUtils(DummyConfig(), DummyLogger())
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    keys = []
+    do = fetch_utils.flights.do
+    monkeypatch.setattr(
+        fetch_utils.flights, "do", lambda key, fn: keys.append(key) or do(key, fn)
+    )
+    scraper = SimpleNamespace(
+        get=lambda url, timeout: SimpleNamespace(
+            status_code=200, content=b"page", raw=None
+        )
+    )
+
+    fetch_utils.fetch_with_retry(scraper, URL)
+    fetch_utils.fetch_with_retry(scraper, URL, insecure=True)
+    fetch_utils.fetch_with_retry(scraper, URL, cache_bypass=True)
+    fetch_utils.close()
+
+    assert keys == [(URL, False), (URL, True)]
+
+
+def test_fetch_all_reuses_the_pages_parsed_while_probing(monkeypatch):
+    config = DummyConfig()
+    config.exchange = SimpleNamespace(nsd_endpoint="http://127.0.0.1:9/nsd/{nsd}")
+    monkeypatch.setattr(config.global_settings, "max_linear_holes", 10, raising=False)
+    fetched = Counter()
+
+    class Fetch:
+        def fetch_with_retry(self, scraper, url, **kwargs):
+            fetched[url] += 1
+            return SimpleNamespace(content=b"x", text=url.rsplit("/", 1)[1]), None
+
+        def forget(self, url):
+            pass
+
+    scraper = NsdScraper(
+        config,
+        DummyLogger(),
+        data_cleaner=None,
+        worker_pool_executor=WorkerPool(
+            config, metrics_collector=DummyMetricsCollector()
+        ),
+        metrics_collector=DummyMetricsCollector(),
+        repository=None,
+        fetch_utils=Fetch(),
+    )
+    # NSDs 1-5 are filed; later ones have no sent date yet
+    scraper._parse_html = lambda nsd, html: (
+        {"nsd": nsd, "sent_date": datetime(2024, 1, nsd)} if nsd <= 5 else {"nsd": nsd}
+    )
+
+    result = scraper.fetch_all()
+
+    assert [int(item.nsd) for item in result.items] == [1, 2, 3, 4, 5]
+    assert set(fetched.values()) == {1}
+    assert not scraper._probed
+
+
+@pytest.mark.parametrize("ttl, downloads", [(600, 1), (-1, 2)])
+def test_probe_memo_expires(monkeypatch, ttl, downloads):
+    config = DummyConfig()
+    monkeypatch.setattr(config.scraping, "probe_memo_ttl", ttl)
+    config.exchange = SimpleNamespace(nsd_endpoint="http://127.0.0.1:9/nsd/{nsd}")
+    fetched = []
+
+    class Fetch:
+        def fetch_with_retry(self, scraper, url, **kwargs):
+            fetched.append(url)
+            return SimpleNamespace(content=b"x", text=""), None
+
+    scraper = NsdScraper(
+        config,
+        DummyLogger(),
+        data_cleaner=None,
+        worker_pool_executor=None,
+        metrics_collector=None,
+        repository=None,
+        fetch_utils=Fetch(),
+    )
+    scraper._parse_html = lambda nsd, html: {"nsd": nsd, "sent_date": "today"}
+
+    scraper._try_nsd(7)
+    scraper._try_nsd(7)
+
+    assert len(fetched) == downloads
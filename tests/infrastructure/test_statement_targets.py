@@ -0,0 +1,88 @@
+from sqlalchemy import event
+
+from domain.dto.company_data_dto import CompanyDataDTO
+from domain.dto.nsd_dto import NsdDTO
+from domain.dto.raw_statement_dto import RawStatementDTO
+from infrastructure.repositories import (
+    SqlAlchemyCompanyDataRepository,
+    SqlAlchemyNsdRepository,
+    SqlAlchemyRawStatementRepository,
+)
+
+
+def _nsd(nsd, company_name, nsd_type):
+    return NsdDTO.from_dict(
+        {"nsd": nsd, "company_name": company_name, "nsd_type": nsd_type}
+    )
+
+
+def _row(nsd):
+    return RawStatementDTO(
+        nsd=nsd,
+        company_name="ACME",
+        quarter="2024-03-31",
+        version="1",
+        grupo="DFs",
+        quadro="BPA",
+        account="1",
+        description="Ativo",
+        value=1.0,
+    )
+
+
+def test_targets_are_unfetched_nsds_of_known_companies(make_repo, engine):
+    company_repo = make_repo(SqlAlchemyCompanyDataRepository)
+    nsd_repo = make_repo(SqlAlchemyNsdRepository)
+    raw_repo = make_repo(SqlAlchemyRawStatementRepository)
+    company_repo.save_all(
+        [
+            CompanyDataDTO.from_dict({"cvm_code": "1", "company_name": "ACME"}),
+            CompanyDataDTO.from_dict({"cvm_code": "2", "company_name": "ROMI"}),
+        ]
+    )
+    nsd_repo.save_all(
+        [
+            _nsd("10", "ACME", "ITR"),
+            _nsd("9", "ROMI", "DFP"),
+            _nsd("11", "ACME", "ITR"),  # already fetched
+            _nsd("12", "ACME", "FRE"),  # type not wanted
+            _nsd("13", "UNKNOWN", "ITR"),  # company not registered
+            _nsd("14", None, "ITR"),
+        ]
+    )
+    raw_repo.save_all([_row("11")])
+
+    statements = []
+
+    def record(conn, cursor, sql, params, *args):
+        statements.append(params)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        targets = nsd_repo.get_statement_targets({"ITR", "DFP"})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # Numeric order, one statement bound only to the two types
+    assert [dto.nsd for dto in targets] == ["9", "10"]
+    assert len(statements) == 1 and len(statements[0]) == 2
+
+
+def test_target_query_uses_the_indexes(make_repo, engine):
+    nsd_repo = make_repo(SqlAlchemyNsdRepository)
+    plans = []
+
+    def explain(conn, cursor, sql, params, *args):
+        if sql.startswith("SELECT tbl_nsd"):
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            plans.extend(row[-1] for row in cursor.fetchall())
+
+    event.listen(engine, "before_cursor_execute", explain)
+    try:
+        nsd_repo.get_statement_targets({"ITR"})
+    finally:
+        event.remove(engine, "before_cursor_execute", explain)
+
+    plan = "\n".join(plans)
+    assert "INDEX ix_nsd_company_type" in plan
+    assert "COVERING INDEX ix_raw_statements_nsd" in plan
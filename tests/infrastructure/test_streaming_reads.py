@@ -0,0 +1,45 @@
+from domain.dto.nsd_dto import NsdDTO
+from infrastructure.models.nsd_model import NSDModel
+from infrastructure.repositories.nsd_repository import SqlAlchemyNsdRepository
+
+
+def _repo(make_repo):
+    repo = make_repo(SqlAlchemyNsdRepository)
+    repo.save_all(
+        [
+            NsdDTO.from_dict({"nsd": str(nsd), "company_name": name})
+            for nsd, name in ((1, "ACME"), (2, "ROMI"), (3, "ACME"), (4, None))
+        ]
+    )
+    return repo
+
+
+def test_iter_all_streams_every_row_in_batches(make_repo, monkeypatch):
+    repo = _repo(make_repo)
+    converted = []
+    to_dto = NSDModel.to_dto
+    monkeypatch.setattr(
+        NSDModel, "to_dto", lambda model: converted.append(model.nsd) or to_dto(model)
+    )
+
+    items = repo.iter_all(batch_size=3)
+    first = next(items)
+
+    # Only the first batch was loaded
+    assert first.nsd == "1" and converted == ["1", "2", "3"]
+    assert [dto.nsd for dto in items] == ["2", "3", "4"]
+    assert converted == ["1", "2", "3", "4"]
+
+
+def test_select_columns_returns_plain_tuples(make_repo):
+    repo = _repo(make_repo)
+
+    names = sorted(
+        repo.select_columns("company_name", distinct=True),
+        key=lambda row: row[0] or "",
+    )
+    pairs = sorted(repo.select_columns("nsd", "company_name", batch_size=2))
+
+    assert names == [(None,), ("ACME",), ("ROMI",)]
+    assert pairs[0] == ("1", "ACME") and type(pairs[0]) is tuple
+    assert len(pairs) == 4
@@ -0,0 +1,81 @@
+import gzip
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+
+from infrastructure.helpers import FetchUtils, MetricsCollector
+from infrastructure.helpers.transfer import decode_body, endpoint_of
+from tests.conftest import DummyConfig, DummyLogger
+
+BODY = b"<html>" + b"conta contabil " * 500 + b"</html>"
+
+
+def test_decode_body_handles_gzip_and_both_deflate_variants():
+    raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    raw = raw_deflate.compress(BODY) + raw_deflate.flush()
+
+    assert decode_body(gzip.compress(BODY), "gzip") == BODY
+    assert decode_body(zlib.compress(BODY), "deflate") == BODY
+    assert decode_body(raw, "deflate") == BODY
+    assert decode_body(BODY, None) == BODY
+
+
+def test_endpoint_of_drops_queries_and_payloads():
+    assert (
+        endpoint_of(
+            "https://www.rad.cvm.gov.br/ENET/frmGerenciaPaginaFRE.aspx"
+            "?NumeroSequencialDocumento=1&CodigoTipoInstituicao=1"
+        )
+        == "www.rad.cvm.gov.br/ENET/frmGerenciaPaginaFRE.aspx"
+    )
+    assert (
+        endpoint_of(
+            "https://sistemaswebb3-listados.b3.com.br/listedCompaniesProxy/"
+            "CompanyCall/GetDetail/eyJjb2RlQ1ZNIjoiOTUxMiIsImxhbmd1YWdlIjoicHQtYnIifQ=="
+        )
+        == "sistemaswebb3-listados.b3.com.br/listedCompaniesProxy/"
+        "CompanyCall/GetDetail/*"
+    )
+
+
+def test_fetch_negotiates_gzip_and_records_wire_and_decoded_bytes(monkeypatch):
+    accepted = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            accepted.append(self.headers.get("Accept-Encoding"))
+            body = gzip.compress(BODY)
+            self.send_response(200)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    collector = MetricsCollector()
+    fetch_utils = FetchUtils(DummyConfig(), DummyLogger(), metrics_collector=collector)
+    monkeypatch.setattr(fetch_utils.connectivity, "probe", lambda *a, **k: True)
+    url = f"http://127.0.0.1:{server.server_address[1]}/ENET/page.aspx?x=1"
+
+    try:
+        response, _ = fetch_utils.fetch_with_retry(requests.Session(), url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.content == BODY
+    assert "gzip" in accepted[0]
+    assert "gzip" in fetch_utils.header_random()["Accept-Encoding"]
+    metrics = collector.get_metrics(elapsed_time=0)
+    wire, decoded = metrics.endpoint_bytes[
+        f"127.0.0.1:{server.server_address[1]}/ENET/page.aspx"
+    ]
+    assert decoded == len(BODY)
+    assert wire == len(gzip.compress(BODY)) < decoded
+    assert metrics.wire_bytes == wire
@@ -53,3 +53,104 @@ def test_worker_pool_passes_task_dto():
     for idx, data, worker_id in received:
         assert tasks[idx][1] == data
         assert worker_id
+
+
+def test_worker_pool_drops_results_when_not_kept():
+    collector = DummyMetricsCollector()
+    pool = WorkerPool(config=DummyConfig(), metrics_collector=collector)
+    seen = []
+
+    result = pool.run(
+        tasks=enumerate(range(5)),
+        processor=lambda task: task.data * 2,
+        logger=DummyLogger(),
+        on_result=seen.append,
+        keep_results=False,
+    )
+
+    assert result.items == []
+    assert sorted(seen) == [0, 2, 4, 6, 8]
+
+
+def test_worker_pool_stream_consumes_tasks_lazily():
+    collector = DummyMetricsCollector()
+    pool = WorkerPool(config=DummyConfig(), metrics_collector=collector, max_workers=1)
+    pulled = []
+
+    def tasks():
+        for i in range(1000):
+            pulled.append(i)
+            yield i, i
+
+    stream = pool.stream(
+        tasks=tasks(), processor=lambda task: task.data, logger=DummyLogger()
+    )
+    first = [next(stream) for _ in range(3)]
+    stream.close()
+
+    assert first == [0, 1, 2]
+    # Only a bounded window of tasks is ever pulled from the iterator
+    assert len(pulled) < 50
+
+
+def test_worker_pool_retries_and_dead_letters_failing_tasks():
+    collector = DummyMetricsCollector()
+    pool = WorkerPool(config=DummyConfig(), metrics_collector=collector, max_workers=1)
+    attempts = {}
+
+    def processor(task: WorkerTaskDTO) -> int:
+        attempts[task.data] = attempts.get(task.data, 0) + 1
+        if task.data == 2 and attempts[task.data] == 1:
+            raise RuntimeError("flaky")
+        if task.data == 4:
+            raise RuntimeError("broken")
+        return task.data
+
+    result = pool.run(
+        tasks=enumerate(range(6)), processor=processor, logger=DummyLogger()
+    )
+
+    # The single worker survives every failure and finishes the run
+    assert sorted(result.items) == [0, 1, 2, 3, 5]
+    assert attempts[2] == 2
+    assert attempts[4] == 3
+    assert [(d.data, d.attempts) for d in result.dead_letters] == [(4, 3)]
+    assert result.dead_letters[0].error == "RuntimeError: broken"
+    assert result.metrics.failures == 1
+
+
+def test_worker_pool_runs_highest_priority_first():
+    collector = DummyMetricsCollector()
+    pool = WorkerPool(config=DummyConfig(), metrics_collector=collector, max_workers=1)
+    order = []
+
+    pool.run(
+        tasks=enumerate([5, 1, 4, 2, 3]),
+        processor=lambda task: order.append(task.data),
+        logger=DummyLogger(),
+        priority=lambda data: -data,
+    )
+
+    assert order == [5, 4, 3, 2, 1]
+
+
+def test_worker_pool_stops_at_time_budget():
+    import time
+
+    collector = DummyMetricsCollector()
+    pool = WorkerPool(config=DummyConfig(), metrics_collector=collector, max_workers=1)
+
+    def processor(task: WorkerTaskDTO) -> int:
+        time.sleep(0.05)
+        return task.data
+
+    result = pool.run(
+        tasks=enumerate(range(100)),
+        processor=processor,
+        logger=DummyLogger(),
+        time_budget=0.2,
+    )
+
+    assert result.deadline_reached
+    assert len(result.items) < 100
+    assert result.items == sorted(result.items)